@@ -8,9 +8,19 @@ This detector handles everything that is NOT canonical A..F letter-range mapping
 
 """
 
+import bisect
 import re
+import string
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+
+# Optional JIT kernel for very large syllabi (batch/CLI use)
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Detection Configuration Constants
 MAX_HEADING_SCAN_LINES = 8
@@ -26,6 +36,83 @@ MAX_UPWARD_SCAN = 7
 MAX_DOWNWARD_SCAN = 9
 MAX_FORWARD_SCAN = 7
 PERCENT_CLUSTER_WINDOW = 3
+MAX_LETTER_BLOCK_GAP = 80
+# Only hand documents this large to the numba kernel; below this the regexes are cheaper
+NUMBA_MIN_TEXT_LENGTH = 50000
+
+# Table for lowercasing pure-ASCII text in one C-level pass
+_ASCII_LOWER_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _lower(text: str) -> str:
+    """Lowercase ``text``, using the ASCII translate table when it is pure ASCII."""
+    return text.translate(_ASCII_LOWER_TABLE) if text.isascii() else text.lower()
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _is_word_byte(b):
+        # ASCII equivalent of regex \w
+        return (48 <= b <= 57) or (65 <= b <= 90) or (97 <= b <= 122) or b == 95
+
+    @njit(cache=True)
+    def _is_space_byte(b):
+        # ASCII equivalent of regex \s, minus the newline that separates lines
+        return b == 32 or b == 9 or (11 <= b <= 13) or (28 <= b <= 31)
+
+    @njit(cache=True)
+    def _match_points_unit(buf, j, n):
+        # case-insensitive 'points' / 'pts' at buf[j] followed by a word boundary
+        if j + 3 > n or (buf[j] | 32) != 112:
+            return False
+        if (j + 6 <= n and (buf[j + 1] | 32) == 111 and (buf[j + 2] | 32) == 105
+                and (buf[j + 3] | 32) == 110 and (buf[j + 4] | 32) == 116 and (buf[j + 5] | 32) == 115
+                and (j + 6 == n or not _is_word_byte(buf[j + 6]))):
+            return True
+        return ((buf[j + 1] | 32) == 116 and (buf[j + 2] | 32) == 115
+                and (j + 3 == n or not _is_word_byte(buf[j + 3])))
+
+    @njit(cache=True)
+    def _scan_lines(buf):
+        """Single pass over ASCII bytes returning (line_starts, has_percent, has_points).
+
+        Mirrors ``percent_pattern`` (\\d+\\s*%) and ``points_pattern``
+        (\\b\\d+\\s*(points|pts)\\b) evaluated on every '\\n'-separated line.
+        """
+        n = buf.shape[0]
+        n_lines = 1
+        for i in range(n):
+            if buf[i] == 10:
+                n_lines += 1
+        line_starts = np.zeros(n_lines, dtype=np.int32)
+        has_percent = np.zeros(n_lines, dtype=np.bool_)
+        has_points = np.zeros(n_lines, dtype=np.bool_)
+
+        line = 0
+        after_digit = False
+        for i in range(n):
+            b = buf[i]
+            if b == 10:
+                line += 1
+                line_starts[line] = i + 1
+                after_digit = False
+            elif 48 <= b <= 57:
+                after_digit = True
+                if not has_points[line] and (i == line_starts[line] or not _is_word_byte(buf[i - 1])):
+                    j = i
+                    while j < n and 48 <= buf[j] <= 57:
+                        j += 1
+                    while j < n and _is_space_byte(buf[j]):
+                        j += 1
+                    if _match_points_unit(buf, j, n):
+                        has_points[line] = True
+            elif b == 37:
+                if after_digit:
+                    has_percent[line] = True
+                after_digit = False
+            elif not _is_space_byte(b):
+                after_digit = False
+        return line_starts, has_percent, has_points
 
 
 class GradingProcessDetector:
@@ -38,11 +125,8 @@ class GradingProcessDetector:
         # Keywords that suggest a grading scale block
         self.percent_pattern = re.compile(r"\d+\s*%")
         self.points_pattern = re.compile(r"\b\d+\s*(points|pts)\b", re.I)
-        # Letter-grade block pattern (A:, B:, C:, D:, F: in same area)
-        self.letter_block_pattern = re.compile(
-            r"A\s*[:\-].{0,80}B\s*[:\-].{0,80}C\s*[:\-].{0,80}D\s*[:\-].{0,80}F\s*[:\-]",
-            re.I | re.S,
-        )
+        # Letter-grade block tokens (A:, B:, C:, D:, F: in same area), chained by _find_letter_block
+        self.letter_token_patterns = {letter: re.compile(letter + r"\s*[:\-]", re.I) for letter in 'ABCDF'}
 
         # small list of common labels to help anchor sections
         self.anchor_keywords = [
@@ -58,11 +142,59 @@ class GradingProcessDetector:
             re.I
         )
 
-    def _is_grading_scale_line(self, line: str) -> bool:
-        """Return True if line appears to be a grading scale (letter grades with ranges)."""
+    def _percent_points_masks(self, text: str, lines: List[str]) -> Tuple[List[bool], List[bool]]:
+        """Return per-line (has_percent, has_points) flags for ``text.split('\\n')``.
+
+        Uses the numba kernel for very large ASCII documents when numba is
+        installed, otherwise the compiled regexes.
+        """
+        if NUMBA_AVAILABLE and len(text) >= NUMBA_MIN_TEXT_LENGTH and text.isascii():
+            _, has_percent, has_points = _scan_lines(np.frombuffer(text.encode('ascii'), dtype=np.uint8))
+            return has_percent.tolist(), has_points.tolist()
+        has_percent = [bool(self.percent_pattern.search(ln)) for ln in lines]
+        has_points = [bool(self.points_pattern.search(ln)) for ln in lines]
+        return has_percent, has_points
+
+    def _find_letter_block(self, text: str) -> Optional[Tuple[int, int]]:
+        """Return the (start, end) span of an A:, B:, C:, D:, F: letter block, or None.
+
+        Each token must start within MAX_LETTER_BLOCK_GAP characters of the
+        end of the previous one. Working back from F:, only the tokens that
+        can still complete a block are kept. The block then starts at the
+        leftmost A: left, and each later token is the furthest one kept in
+        reach, which is the span the greedy wildcard regex this replaces
+        matched, found without backtracking.
+        """
+        # (start, end) of every token that can begin the rest of a block
+        reachable = {'F': [match.span() for match in self.letter_token_patterns['F'].finditer(text)]}
+        next_letter = 'F'
+        for letter in 'DCBA':
+            next_starts = [token_start for token_start, _ in reachable[next_letter]]
+            reachable[letter] = [
+                (token_start, token_end) for token_start, token_end in
+                (match.span() for match in self.letter_token_patterns[letter].finditer(text))
+                if bisect.bisect_right(next_starts, token_end + MAX_LETTER_BLOCK_GAP) > bisect.bisect_left(next_starts, token_end)
+            ]
+            if not reachable[letter]:
+                return None
+            next_letter = letter
+        block_start, pos = reachable['A'][0]
+        for letter in 'BCDF':
+            tokens = reachable[letter]
+            # the furthest token in reach; one exists because pos is reachable
+            index = bisect.bisect_right(tokens, (pos + MAX_LETTER_BLOCK_GAP, len(text) + 1)) - 1
+            pos = tokens[index][1]
+        return block_start, pos
+
+    def _is_grading_scale_line(self, line: str, line_lower: Optional[str] = None) -> bool:
+        """Return True if line appears to be a grading scale (letter grades with ranges).
+
+        ``line_lower`` may be passed when the caller already has the lowered line.
+        """
         if not line:
             return False
-        line_lower = line.lower()
+        if line_lower is None:
+            line_lower = line.lower()
 
         # Check for grading scale patterns like "A 100% to 94%", "A: 93-100"
         if self.grading_scale_pattern.search(line):
@@ -92,11 +224,12 @@ class GradingProcessDetector:
 
         return False
 
-    def _is_late_policy_line(self, line: str) -> bool:
+    def _is_late_policy_line(self, line: str, line_lower: Optional[str] = None) -> bool:
         """Return True if line appears to be a late submission policy."""
         if not line:
             return False
-        line_lower = line.lower()
+        if line_lower is None:
+            line_lower = line.lower()
 
         # Check for late submission indicators
         late_indicators = ['days late', 'late submission', 'points subtracted', 'late penalty',
@@ -136,11 +269,12 @@ class GradingProcessDetector:
                 return ln
         return ''
 
-    def _is_heading_line(self, s: str) -> bool:
+    def _is_heading_line(self, s: str, low: Optional[str] = None) -> bool:
         """Return True if ``s`` looks like a short section heading.
 
         This is a lightweight heuristic used when extending blocks to
-        include nearby headings.
+        include nearby headings. ``low`` may be passed as the already
+        stripped and lowered line.
         """
         if not s or not s.strip():
             return False
@@ -151,7 +285,8 @@ class GradingProcessDetector:
         if s_stripped.isupper() and len(words) <= MAX_HEADING_WORDS_CAPS:
             return True
 
-        low = s_stripped.lower()
+        if low is None:
+            low = s_stripped.lower()
         # Anchor keywords are useful, but require the line to be reasonably short
         if any(k in low for k in self.anchor_keywords) and len(words) <= MAX_HEADING_WORDS_ANCHOR:
             return True
@@ -173,15 +308,18 @@ class GradingProcessDetector:
         2) contiguous percent/points windows, and
         3) local percentage clusters near labels.
         """
-        self.logger.info(f"Starting detection for field: {self.field_name}")
+        self.logger.info("Starting detection for field: %s", self.field_name)
 
         if not text:
-            self.logger.info(f"NOT_FOUND: {self.field_name} (empty text)")
+            self.logger.info("NOT_FOUND: %s (empty text)", self.field_name)
             return {'found': False, 'content': ''}
 
         # Normalize line endings
         lines = [ln.rstrip() for ln in text.split('\n')]
         joined = '\n'.join(lines)
+        line_has_percent, line_has_points = self._percent_points_masks(text, lines)
+        # Lowercase the document once; helpers get the stripped, lowered line
+        lines_lower = [ln.strip() for ln in _lower(text).split('\n')]
 
         # DISABLED: Letter-grade block detection (A: ... B: ... C: ... F:)
         # This was detecting grading SCALES (A=90-100%), not grading PROCESS (Homework 30%)
@@ -199,12 +337,13 @@ class GradingProcessDetector:
                     current_block = []
                 continue
 
-            has_percent = bool(self.percent_pattern.search(s))
-            has_points = bool(self.points_pattern.search(s))
+            has_percent = line_has_percent[i]
+            has_points = line_has_points[i]
             looks_like_item = bool(re.match(r"^[A-Za-z].{0,60}(\d+\s*%|\(\d+%\)|\d+\s*points|\d+\s*pts)", s, re.I))
 
             # Skip lines that look like grading scale (letter grades with ranges)
-            if self._is_grading_scale_line(s):
+            s_lower = lines_lower[i]
+            if self._is_grading_scale_line(s, s_lower):
                 # If we have a block, end it here
                 if current_block:
                     windows.append((i - len(current_block), current_block))
@@ -212,7 +351,7 @@ class GradingProcessDetector:
                 continue
 
             # Skip lines that look like late submission policy
-            if self._is_late_policy_line(s):
+            if self._is_late_policy_line(s, s_lower):
                 # If we have a block, end it here
                 if current_block:
                     windows.append((i - len(current_block), current_block))
@@ -234,18 +373,19 @@ class GradingProcessDetector:
         best_score = 0
         for idx, block in windows:
             # FILTER: Skip windows that are predominantly grading scales or late policies
-            grading_scale_lines = sum(1 for ln in block if self._is_grading_scale_line(ln))
-            late_policy_lines = sum(1 for ln in block if self._is_late_policy_line(ln))
             total_lines = len(block)
+            block_lower = lines_lower[idx:idx + total_lines]
+            grading_scale_lines = sum(1 for ln, low in zip(block, block_lower) if self._is_grading_scale_line(ln, low))
+            late_policy_lines = sum(1 for ln, low in zip(block, block_lower) if self._is_late_policy_line(ln, low))
 
             # If more than 50% of lines are grading scale/late policy, skip this window
             if total_lines > 0 and (grading_scale_lines + late_policy_lines) / total_lines > 0.5:
                 continue
 
-            score = sum(1 for ln in block if self.percent_pattern.search(ln) or self.points_pattern.search(ln))
+            score = sum(1 for k in range(idx, idx + total_lines) if line_has_percent[k] or line_has_points[k])
             # bonus if there is an anchor keyword near the block
-            context = ' '.join(lines[max(0, idx-PERCENT_CLUSTER_WINDOW): min(len(lines), idx+len(block)+PERCENT_CLUSTER_WINDOW)])
-            if any(k in context.lower() for k in self.anchor_keywords):
+            context = _lower(' '.join(lines[max(0, idx-PERCENT_CLUSTER_WINDOW): min(len(lines), idx+len(block)+PERCENT_CLUSTER_WINDOW)]))
+            if any(k in context for k in self.anchor_keywords):
                 score += 1
             if score > best_score and score >= MIN_WINDOW_SCORE:
                 best_score = score
@@ -262,7 +402,7 @@ class GradingProcessDetector:
                     break
                 if not lines[i].strip():
                     break
-                if self._is_heading_line(lines[i]):
+                if self._is_heading_line(lines[i], lines_lower[i]):
                     start = i
                     # once we include a heading, stop scanning further up
                     break
@@ -280,7 +420,7 @@ class GradingProcessDetector:
                 end = j
 
             # Prefer to return only the percent/points lines and very short context
-            percent_idxs = [i for i in range(start, end + 1) if self.percent_pattern.search(lines[i]) or self.points_pattern.search(lines[i])]
+            percent_idxs = [i for i in range(start, end + 1) if line_has_percent[i] or line_has_points[i]]
             if percent_idxs:
                 selected = []
                 for idx in percent_idxs:
@@ -295,13 +435,8 @@ class GradingProcessDetector:
                         next_line = lines[idx+1].strip()
                         if len(next_line.split()) <= MAX_NEXT_LINE_WORDS and not ('.' in next_line and len(next_line.split()) > MAX_NEXT_LINE_WORDS):
                             selected.append(idx+1)
-                # dedupe while preserving order
-                seen = set()
-                final_idxs = []
-                for i in selected:
-                    if i not in seen:
-                        seen.add(i)
-                        final_idxs.append(i)
+                # dedupe while preserving order (dict keys double as an ordered set)
+                final_idxs = dict.fromkeys(selected)
 
                 # If percent lines are separated by short label lines that appear later,
                 # scan forward up to a few lines to capture them (e.g., 'Quizzes:' then later 'Quiz1: 40%')
@@ -309,14 +444,13 @@ class GradingProcessDetector:
                     start_block = min(final_idxs)
                     end_block = max(final_idxs)
                     for j in range(end_block + 1, min(len(lines), end_block + MAX_FORWARD_SCAN)):
-                        if self.percent_pattern.search(lines[j]):
+                        if line_has_percent[j]:
                             # include intervening short lines
                             for k in range(end_block + 1, j + 1):
-                                if k not in seen and lines[k].strip():
+                                if k not in final_idxs and lines[k].strip():
                                     # only include short label/context lines
                                     if k == j or len(lines[k].split()) <= MAX_SHORT_LINE_WORDS:
-                                        seen.add(k)
-                                        final_idxs.append(k)
+                                        final_idxs[k] = None
                             end_block = j
                             break
 
@@ -326,31 +460,30 @@ class GradingProcessDetector:
                 if heading and (not content_lines or not content_lines[0].startswith(heading)):
                     content_lines.insert(0, heading)
                 content = '\n'.join(content_lines).strip()
-                self.logger.info(f"FOUND: {self.field_name} (percent/points window)")
+                self.logger.info("FOUND: %s (percent/points window)", self.field_name)
                 return {'found': True, 'content': content}
             else:
                 # fallback to returning the short block (should be rare)
                 content_lines = [lines[i].rstrip() for i in range(start, end + 1) if lines[i].strip()]
                 content = '\n'.join(content_lines).strip()
-                self.logger.info(f"FOUND: {self.field_name} (short block fallback)")
+                self.logger.info("FOUND: %s (short block fallback)", self.field_name)
                 return {'found': True, 'content': content}
 
         # 3) fallback: look for lines containing a cluster of assignment labels followed shortly by percentages
         # find lines where a percentage exists and gather +/-PERCENT_CLUSTER_WINDOW lines around it
-        percent_lines_idx = [i for i, ln in enumerate(lines) if self.percent_pattern.search(ln)]
+        percent_lines_idx = [i for i, flag in enumerate(line_has_percent) if flag]
         for idx in percent_lines_idx:
             # gather a slightly larger window and then try to expand to heading/context
             start = max(0, idx - PERCENT_CLUSTER_WINDOW)
             end = min(len(lines), idx + PERCENT_CLUSTER_WINDOW + 1)
-            block_lines = [lines[j] for j in range(start, end) if lines[j].strip()]
-            if sum(1 for ln in block_lines if self.percent_pattern.search(ln)) >= MIN_WINDOW_SCORE:
+            if sum(line_has_percent[start:end]) >= MIN_WINDOW_SCORE:
                 # expand similarly to the window case
                 # find nearest non-empty start before 'start' that looks like a heading
                 heading_start = start
                 for i in range(start - 1, max(-1, start - MAX_DOWNWARD_SCAN), -1):
                     if i < 0 or not lines[i].strip():
                         break
-                    if any(k in lines[i].lower() for k in self.anchor_keywords) or lines[i].strip().isupper():
+                    if any(k in lines_lower[i] for k in self.anchor_keywords) or lines[i].strip().isupper():
                         heading_start = i
                         break
                 final_start = heading_start
@@ -360,7 +493,7 @@ class GradingProcessDetector:
                         break
                     final_end = j
                 # prefer to return only percent/points lines near the cluster
-                percent_idxs2 = [k for k in range(final_start, final_end + 1) if self.percent_pattern.search(lines[k]) or self.points_pattern.search(lines[k])]
+                percent_idxs2 = [k for k in range(final_start, final_end + 1) if line_has_percent[k] or line_has_points[k]]
                 if percent_idxs2:
                     selected = []
                     for idx in percent_idxs2:
@@ -373,24 +506,18 @@ class GradingProcessDetector:
                             next_line = lines[idx+1].strip()
                             if len(next_line.split()) <= MAX_NEXT_LINE_WORDS and not ('.' in next_line and len(next_line.split()) > MAX_NEXT_LINE_WORDS):
                                 selected.append(idx+1)
-                    seen = set()
-                    final_idxs2 = []
-                    for i in selected:
-                        if i not in seen:
-                            seen.add(i)
-                            final_idxs2.append(i)
+                    final_idxs2 = dict.fromkeys(selected)
 
                     # expand forward to include percent lines that appear after short labels
                     if final_idxs2:
                         start_block2 = min(final_idxs2)
                         end_block2 = max(final_idxs2)
                         for j in range(end_block2 + 1, min(len(lines), end_block2 + MAX_FORWARD_SCAN)):
-                            if self.percent_pattern.search(lines[j]):
+                            if line_has_percent[j]:
                                 for k in range(end_block2 + 1, j + 1):
-                                    if k not in seen and lines[k].strip():
+                                    if k not in final_idxs2 and lines[k].strip():
                                         if k == j or len(lines[k].split()) <= MAX_SHORT_LINE_WORDS:
-                                            seen.add(k)
-                                            final_idxs2.append(k)
+                                            final_idxs2[k] = None
                                 end_block2 = j
                                 break
 
@@ -398,20 +525,26 @@ class GradingProcessDetector:
                     heading = self._get_heading_before(lines, final_start)
                     if heading and (not content_lines or not content_lines[0].startswith(heading)):
                         content_lines.insert(0, heading)
-                    self.logger.info(f"FOUND: {self.field_name} (percent cluster)")
+                    self.logger.info("FOUND: %s (percent cluster)", self.field_name)
                     return {'found': True, 'content': '\n'.join(content_lines).strip()}
                 content_lines = [lines[k].rstrip() for k in range(final_start, final_end + 1) if lines[k].strip()]
-                self.logger.info(f"FOUND: {self.field_name} (cluster fallback)")
+                self.logger.info("FOUND: %s (cluster fallback)", self.field_name)
                 return {'found': True, 'content': '\n'.join(content_lines).strip()}
 
-        self.logger.info(f"NOT_FOUND: {self.field_name}")
+        self.logger.info("NOT_FOUND: %s", self.field_name)
         return {'found': False, 'content': ''}
 
 
+# Shared detector for the module-level wrapper, built on first use
+_DEFAULT_DETECTOR = None
+
+
 # Backwards compatibility
 def detect_grading_process(text: str) -> str:
-    d = GradingProcessDetector()
-    res = d.detect(text)
+    global _DEFAULT_DETECTOR
+    if _DEFAULT_DETECTOR is None:
+        _DEFAULT_DETECTOR = GradingProcessDetector()
+    res = _DEFAULT_DETECTOR.detect(text)
     return res.get('content', '') if res.get('found') else ''
 
 
@@ -11,7 +11,7 @@ we literally just look for A-F grading scales. They need to have all 12 letters
 
 """
 
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set
 import re
 import logging
 
@@ -29,6 +29,22 @@ class GradingScaleDetector:
     Searches through the document to find all 12 required grades (A, A-, B+, B, B-, C+, C, C-, D+, D, D-, F)
     and optionally A+. Returns the complete block when found.
     """
+
+    # Common prefixes that aren't part of the scale, compiled once
+    _PREFIXES = (
+        r'^.*?guidelines using this schema:\s*',
+        r'^.*?grading scale:\s*',
+        r'^.*?final grades.*?scale:\s*',
+        r'^.*?letter grades?\s*are\s*as\s*follows?:\s*',
+        r'^.*?grading\s*criteria:?\s*',
+        r'^.*?scale\s*is:?\s*',
+    )
+    _PREFIX_PATTERNS = tuple(re.compile(prefix, re.IGNORECASE) for prefix in _PREFIXES)
+    _PREFIX_RE = re.compile('|'.join(f'(?:{prefix})' for prefix in _PREFIXES), re.IGNORECASE)
+    _ASSIGN_PCT_RE = re.compile(r'\b[A-Z][\w\-]*\s+\d+%\b')
+    _GRADE_PREFIX_RE = re.compile(r'[A-F][+-]?')
+    _GRADE_START_RE = re.compile(r'\b([A-F][+-]?)\s*[:=<>\d]')
+    _GRADE_LETTER_RE = re.compile(r'[ABCDF]', re.IGNORECASE)
     
     def __init__(self):
         """Initialize the detector."""
@@ -38,6 +54,8 @@ class GradingScaleDetector:
         # Pattern to match grade letters with optional + or -
         # More flexible pattern that handles various contexts
         self.grade_pattern = re.compile(r'([ABCDF][+-]?)(?=[\s:=\d]|$)', re.IGNORECASE)
+        # Pattern for grades after an equals sign (90-100=A)
+        self.equals_pattern = re.compile(r'=\s*([ABCDF][+-]?)', re.IGNORECASE)
     
     def find_grades_in_text(self, text: str) -> List[str]:
         """Find all grade letters in a piece of text."""
@@ -48,8 +66,7 @@ class GradingScaleDetector:
         matches.extend(standard_matches)
         
         # Pattern 2: After equals sign (90-100=A)
-        equals_pattern = re.compile(r'=\s*([ABCDF][+-]?)', re.IGNORECASE)
-        equals_matches = equals_pattern.findall(text)
+        equals_matches = self.equals_pattern.findall(text)
         matches.extend(equals_matches)
         
         # Normalize to uppercase and filter to valid grades only
@@ -65,8 +82,21 @@ class GradingScaleDetector:
         """Check if we found all 12 required grades."""
         return REQUIRED_GRADES.issubset(found_grades)
     
-    def extract_block(self, lines: List[str], start_idx: int) -> str:
-        """Extract a block of text that contains the grading scale."""
+    def grade_letter_mask(self, lines: List[str]) -> List[bool]:
+        """Return, per line, whether it contains any A-F letter at all.
+
+        Lines without one can never yield a grade, so callers can skip
+        ``find_grades_in_text`` for them.
+        """
+        return [bool(self._GRADE_LETTER_RE.search(line)) for line in lines]
+
+    def extract_block(self, lines: List[str], start_idx: int, has_letter: Optional[List[bool]] = None) -> str:
+        """Extract a block of text that contains the grading scale.
+
+        ``has_letter`` is an optional precomputed ``grade_letter_mask(lines)``.
+        """
+        if has_letter is None:
+            has_letter = self.grade_letter_mask(lines)
         found_grades = set()
         block_lines = []
         
@@ -77,7 +107,7 @@ class GradingScaleDetector:
                 continue
                 
             # Find grades in this line
-            line_grades = self.find_grades_in_text(line)
+            line_grades = self.find_grades_in_text(line) if has_letter[i] else []
             
             if line_grades:
                 # This line has grades, add it to our block
@@ -111,7 +141,7 @@ class GradingScaleDetector:
                     # We already found some grades, so this might be end of scale
                     # But let's check one more line in case grades continue
                     if i + 1 < len(lines):
-                        next_line_grades = self.find_grades_in_text(lines[i + 1])
+                        next_line_grades = has_letter[i + 1] and self.find_grades_in_text(lines[i + 1])
                         if not next_line_grades:
                             # No more grades coming, stop here
                             break
@@ -122,34 +152,26 @@ class GradingScaleDetector:
     
     def clean_grading_scale_block(self, text: str) -> str:
         """Clean the grading scale block to remove extra text and keep only the scale."""
-        import re
-        
-        # Remove common prefixes that aren't part of the scale
-        prefixes_to_remove = [
-            r'^.*?guidelines using this schema:\s*',
-            r'^.*?grading scale:\s*',
-            r'^.*?final grades.*?scale:\s*',
-            r'^.*?letter grades?\s*are\s*as\s*follows?:\s*',
-            r'^.*?grading\s*criteria:?\s*',
-            r'^.*?scale\s*is:?\s*',
-        ]
-        
-        for prefix in prefixes_to_remove:
-            text = re.sub(prefix, '', text, flags=re.IGNORECASE)
+        # Remove common prefixes that aren't part of the scale. Each prefix is
+        # stripped in turn (a later one may remove more after an earlier one),
+        # so the combined alternation only gates whether any of them applies.
+        if self._PREFIX_RE.match(text):
+            for prefix in self._PREFIX_PATTERNS:
+                text = prefix.sub('', text)
         
         # Remove assignment percentages and other non-scale content
         # Pattern to match things like "E-Portfolio 20%" or "Assignment 30%"
-        text = re.sub(r'\b[A-Z][\w\-]*\s+\d+%\b', '', text)
+        text = self._ASSIGN_PCT_RE.sub('', text)
         
         # Remove extra whitespace
         text = ' '.join(text.split())
         
         # If the text starts with a grade letter, we're good
-        if re.match(r'^[A-F][+-]?', text.strip()):
-            return text.strip()
+        if self._GRADE_PREFIX_RE.match(text):
+            return text
         
         # Try to find where the actual scale starts
-        grade_start = re.search(r'\b([A-F][+-]?)\s*[:=<>\d]', text)
+        grade_start = self._GRADE_START_RE.search(text)
         if grade_start:
             return text[grade_start.start():].strip()
         
@@ -165,31 +187,35 @@ class GradingScaleDetector:
         Returns:
             Dict[str, Any]: Dictionary with 'found', 'content', and 'grades_found'.
         """
-        self.logger.info(f"Starting detection for field: {self.field_name}")
+        self.logger.info("Starting detection for field: %s", self.field_name)
         
         lines = text.split('\n')
+        has_letter = self.grade_letter_mask(lines)
         
-        # Go through each line looking for grades
+        # Go through each line looking for grades, skipping lines with no A-F letter
         for i, line in enumerate(lines):
+            if not has_letter[i]:
+                continue
             line_grades = self.find_grades_in_text(line)
             
             if line_grades:
                 # Found some grades, try to extract a block starting here
-                block = self.extract_block(lines, i)
+                block = self.extract_block(lines, i, has_letter)
                 
                 if block:
                     # Verify the block has all required grades
                     block_grades = set(self.find_grades_in_text(block))
                     if self.has_all_required_grades(block_grades):
-                        self.logger.info(f"FOUND: {self.field_name} - Grades: {sorted(block_grades)}")
+                        grades_found = sorted(block_grades)
+                        self.logger.info("FOUND: %s - Grades: %s", self.field_name, grades_found)
                         return {
                             'found': True,
                             'content': block,
-                            'grades_found': sorted(list(block_grades))
+                            'grades_found': grades_found
                         }
         
         # No valid grading scale found
-        self.logger.info(f"NOT_FOUND: {self.field_name}")
+        self.logger.info("NOT_FOUND: %s", self.field_name)
         return {
             'found': False,
             'content': 'Missing',
@@ -9,9 +9,30 @@ Typical usage example:
     print(result)
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import functools
+import os
 import re
+import sys
 import logging
+import threading
+
+# Optional linear-time engine (google-re2) for pre-scanning the name patterns
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Optional JIT kernel for the name validation hot loop
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Detection Configuration Constants
 MIN_NAME_PARTS = 2
@@ -23,6 +44,158 @@ LINES_TO_SCAN = 30
 PAGE_SIZE = 30
 CONTEXT_OFFSET_RANGE = 2
 NEXT_LINE_OFFSET = 2
+# Bounded LRU cache of detect() results for repeated syllabi; longer texts are not cached
+DETECT_CACHE_SIZE = 128
+MAX_CACHED_TEXT_LENGTH = 100000
+# Characters Python's re matches with \s. RE2's \s is ASCII-only, so patterns handed
+# to RE2 use this class instead and never reject text that re would accept.
+PY_WHITESPACE_CLASS = '[\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]'
+
+# 64-bit FNV-1a parameters for hashing lowercased words into the kernel's lookup tables
+FNV_OFFSET_BASIS = 14695981039346656037
+FNV_PRIME = 1099511628211
+# Name token kinds reported by the kernel's tokenizer
+TOKEN_INVALID = 0
+TOKEN_INITIAL = 1
+TOKEN_WORD = 2
+TOKEN_COMPOUND = 3
+
+
+def _fnv1a_hash(word):
+    """Returns the 64-bit FNV-1a hash of a lowercased word's bytes."""
+    h = FNV_OFFSET_BASIS
+    for b in word.lower().encode('utf-8'):
+        h = ((h ^ b) * FNV_PRIME) & 0xFFFFFFFFFFFFFFFF
+    return h
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _is_split_byte(b):
+        # ASCII characters str.split() treats as whitespace
+        return b == 32 or (9 <= b <= 13) or (28 <= b <= 31)
+
+    @njit(cache=True)
+    def _is_upper_byte(b):
+        return 65 <= b <= 90
+
+    @njit(cache=True)
+    def _is_lower_byte(b):
+        return 97 <= b <= 122
+
+    @njit(cache=True)
+    def _name_token_kind(buf, start, end):
+        # Byte-level equivalent of name_token_pattern.fullmatch(buf[start:end])
+        if not _is_upper_byte(buf[start]):
+            return TOKEN_INVALID
+        if end - start == 1:
+            return TOKEN_INITIAL
+        if (end - start) % 2 == 0:
+            initials = True
+            for k in range(start, end, 2):
+                if not (_is_upper_byte(buf[k]) and buf[k + 1] == 46):
+                    initials = False
+                    break
+            if initials:
+                return TOKEN_INITIAL
+        word = True
+        for k in range(start + 1, end):
+            b = buf[k]
+            if not (_is_lower_byte(b) or b == 45 or b == 46):
+                word = False
+                break
+        if word:
+            return TOKEN_WORD
+        # CamelCase is exactly two [A-Z][a-z]+ runs; hyphenated joins two or more with '-'
+        k = start
+        runs = 0
+        hyphens = 0
+        while k < end:
+            if not _is_upper_byte(buf[k]):
+                return TOKEN_INVALID
+            k += 1
+            run_start = k
+            while k < end and _is_lower_byte(buf[k]):
+                k += 1
+            if k == run_start:
+                return TOKEN_INVALID
+            runs += 1
+            if k < end and buf[k] == 45:
+                hyphens += 1
+                k += 1
+                if k == end:
+                    return TOKEN_INVALID
+        if (runs == 2 and hyphens == 0) or (runs >= 2 and hyphens == runs - 1):
+            return TOKEN_COMPOUND
+        return TOKEN_INVALID
+
+    @njit(cache=True)
+    def _lower_hash(buf, start, end):
+        h = np.uint64(FNV_OFFSET_BASIS)
+        for k in range(start, end):
+            b = np.uint64(buf[k])
+            if _is_upper_byte(buf[k]):
+                b = b | np.uint64(32)
+            h = (h ^ b) * np.uint64(FNV_PRIME)
+        return h
+
+    @njit(cache=True)
+    def _in_hash_table(table, h):
+        i = np.searchsorted(table, h)
+        return i < table.shape[0] and table[i] == h
+
+    @njit(cache=True, boundscheck=False)
+    def _is_valid_name_fast(buf, stopword_hashes, excluded_word_hashes):
+        # Same decision as InstructorDetector.is_valid_name for an ASCII candidate
+        n = buf.shape[0]
+        parts = 0
+        i = 0
+        while i < n:
+            while i < n and _is_split_byte(buf[i]):
+                i += 1
+            if i == n:
+                break
+            start = i
+            while i < n and not _is_split_byte(buf[i]):
+                i += 1
+            parts += 1
+            if parts > MAX_NAME_PARTS:
+                return False
+            kind = _name_token_kind(buf, start, i)
+            if kind == TOKEN_INVALID:
+                return False
+            h = _lower_hash(buf, start, i)
+            if kind != TOKEN_INITIAL:
+                if kind == TOKEN_WORD:
+                    # part.isupper(): a plain word with no lowercase letters after its capital
+                    has_lower = False
+                    for k in range(start + 1, i):
+                        if _is_lower_byte(buf[k]):
+                            has_lower = True
+                            break
+                    if not has_lower:
+                        return False
+                if _in_hash_table(stopword_hashes, h):
+                    return False
+            if _in_hash_table(excluded_word_hashes, h):
+                return False
+        return parts >= MIN_NAME_PARTS
+
+
+# detect() results keyed by (detector class, full text), shared by the instances of a class
+_DETECT_CACHE = OrderedDict()
+_DETECT_CACHE_LOCK = threading.Lock()
+# Detectors built once per worker process by detect_batch, keyed by detector class
+_WORKER_DETECTORS = {}
+
+
+def _detect_in_worker(detector_class, text):
+    """Runs detect() in a detect_batch worker process, reusing one detector per class."""
+    detector = _WORKER_DETECTORS.get(detector_class)
+    if detector is None:
+        detector = _WORKER_DETECTORS[detector_class] = detector_class()
+    return detector.detect(text)
+
 
 class InstructorDetector:
     """
@@ -49,20 +222,23 @@ class InstructorDetector:
         self.non_name = [
             "contact information", "office hours", "office location", "office:", "office", "email", "phone", "building", "room"
         ]
+        # Keyword lists only used for substring checks are stored lowercased,
+        # longest first, so the most specific keyword is tried first.
         # Lines containing these keywords should be skipped (likely textbook or other info)
-        self.skip_line_keywords = [
+        self.skip_line_keywords = self._by_length([
             "textbook", "text:", "published by", "isbn", "edition", "pearson", "mcgraw", "wiley",
             "o'reilly", "openstax", "cengage"
-        ]
-        self.name_prev_keywords = [
+        ])
+        self.name_prev_keywords = self._by_length([
             'INSTRUCTOR INFORMATION', "instructor information"
-        ]
-        self.non_name_prefixes = [
+        ])
+        # Membership-tested, so a frozenset
+        self.non_name_prefixes = frozenset([
             "course", "class", "program", "degree", "assignment"
-        ]
-        self.non_name_keywords = [
+        ])
+        self.non_name_keywords = self._by_length([
             'Course Name', 'Course Name:', 'class name', 'class name:'
-        ]
+        ])
         self.title_keywords = [
             'assistant professor', 'associate professor', 'senior lecturer', 'lecturer', 'adjunct professor', 'adjunct instructor', 'adjunct faculty', 'professor', 'prof.', "adjunct"
         ]
@@ -101,6 +277,137 @@ class InstructorDetector:
             'openstax', 'rice', 'communicate', 'professionally', 'lathi', 'radar', 'range', 'equation'
         ])
 
+        # Name patterns, tried in order (most specific first)
+        name_patterns = [
+            # Name with nickname in parentheses and hyphenated last name: Mateusz (Matt) Pacha-Sucharzewski
+            r'([A-Z][a-zA-Z\-]+\s+\([A-Za-z]+\)\s+[A-Z][a-zA-Z]+(?:-[A-Z][a-zA-Z]+)+)',
+            # Name with nickname in parentheses: Mateusz (Matt) Smith
+            r'([A-Z][a-zA-Z\-]+\s+\([A-Za-z]+\)\s+[A-Z][a-zA-Z\-]+)',
+            # First Last-Last (hyphenated last name without nickname)
+            r'([A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+(?:-[A-Z][a-zA-Z]+)+)',
+            # Initials with periods: K.M. Kilcrease or J.R. Smith
+            r'([A-Z]\.[A-Z]\.?\s+[A-Z][a-zA-Z\-]+)',
+            # Initials with spaces: K. M. Kilcrease or R J Greene
+            r'([A-Z]\.?\s+[A-Z]\.?\s+[A-Z][a-zA-Z\-]+)',
+            # First M. Last (with middle initial)
+            r'([A-Z][a-zA-Z\-]+\s+[A-Z]\.\s+[A-Z][a-zA-Z\-]+)',
+            # First Middle Last (three names)
+            r'([A-Z][a-zA-Z\-]+\s+[A-Z][a-zA-Z\-]+\s+[A-Z][a-zA-Z\-]+)',
+            # First Last (simple two-word name)
+            r'([A-Z][a-zA-Z\-]+\s+[A-Z][a-zA-Z\-]+)',
+        ]
+        self.name_patterns = [re.compile(pattern) for pattern in name_patterns]
+        # All name patterns in one alternation: a single scan tells whether any of them can match
+        self.any_name_pattern = re.compile('|'.join(f'(?:{pattern})' for pattern in name_patterns))
+        # With RE2 installed, one linear-time scan reports exactly which patterns match
+        self.name_pattern_set = None
+        if RE2_AVAILABLE:
+            self.name_pattern_set = re2.Set.SearchSet()
+            for pattern in name_patterns:
+                self.name_pattern_set.Add(pattern.replace(r'\s', PY_WHITESPACE_CLASS))
+            self.name_pattern_set.Compile()
+        # Any of the patterns anchored to a whole line (standalone names). Each pattern ends on a
+        # letter, '-' or '.', so whichever one matches captures the same text: the line without
+        # its trailing commas/spaces. One alternation therefore decides for all of them.
+        self.anchored_name_pattern = re.compile('^(?:' + '|'.join(name_patterns) + r')[,\s]*$')
+        self.title_keyword_pairs = [(keyword, keyword.lower()) for keyword in self.title_keywords]
+
+        # One alternation per keyword list, so a line is scanned once for all of them
+        self.name_keyword_pattern = self._literal_alternation(self.name_keywords)
+        self.non_name_keyword_pattern = self._literal_alternation(self.non_name_keywords)
+        self.title_keyword_pattern = self._literal_alternation(self.title_keywords)
+        # Skip words are matched as whole words, so "text:" does not flag "context:"
+        self.skip_line_pattern = re.compile('|'.join(
+            rf'\b{re.escape(keyword)}' + (r'\b' if keyword[-1].isalnum() else '') for keyword in self.skip_line_keywords
+        ))
+        self.known_department_pattern = self._literal_alternation(self.known_departments)
+        self.generic_department_values = frozenset([
+            'dept.', 'department', 'department and program', 'school of', 'division of', 'program', 'college of', 'department/program'
+        ])
+        self.known_department_pairs = [(dept, dept.lower()) for dept in self.known_departments]
+        # Per-keyword splitters used to take the text after a name keyword. Longer keywords
+        # go first so a prefix ('Dr', 'Instructor Name') cannot steal a longer one's match.
+        self.keyword_splitters = [
+            (keyword, keyword.lower(), re.compile(rf'{re.escape(keyword)}[:\-]*', re.IGNORECASE))
+            for keyword in sorted(self.name_keywords, key=len, reverse=True)
+        ]
+
+        # Name cleanup and validation patterns
+        self.nickname_pattern = re.compile(r'\s*\([^)]+\)\s*')
+        self.degree_suffix_pattern = re.compile(r',?\s*(Ph\.?D\.?|M\.?S\.?|M\.?A\.?|M\.?B\.?A\.?)\s*$', re.IGNORECASE)
+        self.name_token_pattern = re.compile(
+            r'(?P<initial>[A-Z]|(?:[A-Z]\.)+)'
+            r'|(?P<camelcase>[A-Z][a-z]+[A-Z][a-z]+)'
+            r'|(?P<hyphenated>[A-Z][a-z]+(?:-[A-Z][a-z]+)+)'
+            r'|(?P<word>[A-Z][a-z\-\.]+)'
+        )
+        # Lowercased, interned word sets for the per-token membership tests
+        # Tokens are lowercased before the lookup, so entries with capitals ("New")
+        # have never matched and are left out rather than lowercased
+        self.name_bad_words = frozenset(
+            sys.intern(word) for word in self.name_stopwords | self.name_non_personal if word == word.lower())
+        self.name_excluded_words = frozenset(sys.intern(word) for word in self.name_non_personal | {
+            'course', 'syllabus', 'outline', 'schedule', 'description', "computer", "Computer", "Contact", "contact", "Using", "using", "New", "Wildcat"
+        } if word == word.lower())
+        # Sorted FNV-1a hash tables of the same word sets for the numba kernel
+        self.stopword_hashes = None
+        self.excluded_word_hashes = None
+        if NUMBA_AVAILABLE:
+            self.stopword_hashes = np.array(sorted({_fnv1a_hash(w) for w in self.name_bad_words}), dtype=np.uint64)
+            self.excluded_word_hashes = np.array(sorted({_fnv1a_hash(w) for w in self.name_excluded_words}), dtype=np.uint64)
+        # Next whitespace-separated capitalised word or initial (R, K., Greene), matched from a position
+        self.name_word_pattern = re.compile(r'\s*([A-Z][a-zA-Z\-\.]*)(?=\s|$)')
+        # Every name pattern needs at least two capitals; text without them can be skipped
+        self.two_capitals_pattern = re.compile(r'[A-Z][^A-Z]*[A-Z]')
+
+        # Standalone-name line filter: course titles, dates and other non-name content,
+        # or email, phone and URL patterns
+        self.standalone_skip_pattern = re.compile(
+            r'\b(COMP|ET|BUS|PHYS|HLS|BIOT|course|syllabus|spring|fall|summer|winter|20\d{2}|credits?)\b'
+            r'|@|http|www\.|\.edu|\.com|\d{3}[-.\s]?\d{3}', re.IGNORECASE)
+        self.context_line_pattern = re.compile(r'@|office|room|building', re.IGNORECASE)
+
+        # Department patterns. Require a capital D when matching 'Department' or 'Dept.'
+        # to avoid lower-case false positives (e.g., 'department' inside sentences).
+        self.dept_pattern_cs = re.compile(r"\b(Department|Dept\.)[\s:,-]*([A-Za-z &\-.,]+)")
+        # Fallback patterns (case-insensitive) for School/Division/Program/College
+        self.dept_other_pattern = re.compile(r"\b(School of|Division of|Program\b|College of|Department and Program|Department/Program)[\s:,-]*([A-Za-z &\-.,]+)", re.IGNORECASE)
+        self.dept_and_program_pattern = re.compile(r'Department\s*(?:and|/)\s*Program\s*[:\-]', re.IGNORECASE)
+        self.program_label_pattern = re.compile(r'\bprogram\b\s*[:\-]', re.IGNORECASE)
+        self.dept_leading_punct_pattern = re.compile(r'^[\s:,-]+')
+        self.dept_leading_label_pattern = re.compile(r'^(Department|Dept\.|Program\b|School of|Division of|College of)[\s:,-]*', re.IGNORECASE)
+
+        # "Dr. Lastname" fallback
+        self.dr_pattern = re.compile(r"\bDr\.?\s+([A-Z][a-zA-Z\-]+)\b")
+
+    @staticmethod
+    def _by_length(keywords):
+        """
+        Lowercases and deduplicates keywords, longest first.
+
+        Args:
+            keywords (list): The keywords to normalize.
+
+        Returns:
+            tuple: The lowercased keywords sorted by descending length.
+        """
+        return tuple(sorted({keyword.lower() for keyword in keywords}, key=lambda keyword: (-len(keyword), keyword)))
+
+    @staticmethod
+    def _literal_alternation(keywords):
+        """
+        Compiles keywords into one alternation that matches any of them in lowercased text.
+
+        Longer keywords come first so the longest keyword at a position wins.
+
+        Args:
+            keywords (list): The keywords to match.
+
+        Returns:
+            re.Pattern: Pattern to search against lowercased text.
+        """
+        return re.compile('|'.join(re.escape(keyword) for keyword in InstructorDetector._by_length(keywords)))
+
     def clean_name_candidate(self, candidate):
         """
         Cleans up a name candidate by removing nicknames, suffixes, and normalizing format.
@@ -115,13 +422,13 @@ class InstructorDetector:
             return candidate
 
         # Remove nicknames in parentheses: "Mateusz (Matt) Pacha" -> "Mateusz Pacha"
-        candidate = re.sub(r'\s*\([^)]+\)\s*', ' ', candidate)
+        candidate = self.nickname_pattern.sub(' ', candidate)
 
         # Remove Ph.D., PhD, Ph.D and similar suffixes
-        candidate = re.sub(r',?\s*(Ph\.?D\.?|M\.?S\.?|M\.?A\.?|M\.?B\.?A\.?)\s*$', '', candidate, flags=re.IGNORECASE)
+        candidate = self.degree_suffix_pattern.sub('', candidate)
 
         # Normalize multiple spaces
-        candidate = re.sub(r'\s+', ' ', candidate).strip()
+        candidate = ' '.join(candidate.split())
 
         return candidate
 
@@ -135,35 +442,43 @@ class InstructorDetector:
         Returns:
             bool: True if valid, False otherwise.
         """
+        if self.stopword_hashes is not None and candidate.isascii():
+            return bool(_is_valid_name_fast(
+                np.frombuffer(candidate.encode('ascii'), dtype=np.uint8),
+                self.stopword_hashes, self.excluded_word_hashes))
         parts = candidate.split()
         if not MIN_NAME_PARTS <= len(parts) <= MAX_NAME_PARTS:
             return False
         for part in parts:
-            # Allow middle initial with period (e.g., W. or A.)
-            if re.match(r'^[A-Z]\.$', part):
-                continue
-            # Allow single capital letter as initial (e.g., R J Greene -> R, J are valid)
-            if re.match(r'^[A-Z]$', part):
-                continue
-            # Allow initials with periods like K.M. or J.R.
-            if re.match(r'^([A-Z]\.)+$', part):
+            # Classify the token in one match: initials (W., R, K.M.), CamelCase (McDonald),
+            # hyphenated (Pacha-Sucharzewski) or a plain capitalised word. Anything else,
+            # including extra capitals in a plain word, is not a name.
+            token = self.name_token_pattern.fullmatch(part)
+            if not token:
+                return False
+            if token.lastgroup == 'initial':
                 continue
-            # Allow CamelCase names (e.g., TakaHide, McDonald, DeVito) and hyphenated names (Pacha-Sucharzewski)
-            # Check if multiple capitals exist
-            upper_count = sum(1 for c in part if c.isupper())
-            if upper_count > 1:
-                # Allow CamelCase personal names (TakaHide, McDonald, etc.)
-                # Pattern: Starts with capital, has lowercase, then capital
-                is_camelcase = bool(re.match(r'^[A-Z][a-z]+[A-Z][a-z]+$', part))
-                # Allow hyphenated names like Pacha-Sucharzewski (each part starts with capital)
-                is_hyphenated = bool(re.match(r'^[A-Z][a-z]+(-[A-Z][a-z]+)+$', part))
-                if not is_camelcase and not is_hyphenated:
-                    return False
-            if len(part) < 2 or not re.match(r"^[A-Z][a-zA-Z\-\.]+$", part) or part.isupper() or part.lower() in self.name_stopwords | self.name_non_personal or "'" in part:
+            if part.isupper() or part.lower() in self.name_bad_words:
                 return False
-        if any(word.lower() in self.name_non_personal or word.lower() in ['course', 'syllabus', 'outline', 'schedule', 'description', "computer", "Computer", "Contact", "contact", "Using", "using", "New", "Wildcat"] for word in parts):
-            return False
-        return True
+        return self.name_excluded_words.isdisjoint(word.lower() for word in parts)
+
+    def matching_name_patterns(self, text):
+        """
+        Returns the name patterns that can match somewhere in text, in priority order.
+
+        Uses a single RE2 set scan when google-re2 is installed, otherwise the
+        combined alternation as a yes/no gate for all patterns.
+
+        Args:
+            text (str): The text to scan.
+
+        Returns:
+            list: Compiled name patterns worth running on text.
+        """
+        if self.name_pattern_set is not None:
+            # Match returns None, not an empty list, when no pattern matches
+            return [self.name_patterns[i] for i in sorted(self.name_pattern_set.Match(text) or ())]
+        return self.name_patterns if self.any_name_pattern.search(text) else []
 
     def contains_non_name_keyword(self, text: str) -> bool:
         """
@@ -178,121 +493,135 @@ class InstructorDetector:
         Returns:
             bool: True if the text contains a non-name keyword, False otherwise.
         """
-        t = text.lower()
-        return any(bad.lower() in t for bad in self.non_name_keywords)
+        return bool(self.non_name_keyword_pattern.search(text.lower()))
+
+    def is_instructor_name(self, candidate):
+        """
+        Checks that a candidate is a valid name and contains no non-name keyword.
+
+        Args:
+            candidate (str): The candidate name string.
+
+        Returns:
+            bool: True if the candidate can be returned as the instructor's name.
+        """
+        return self.is_valid_name(candidate) and not self.contains_non_name_keyword(candidate)
 
-    def extract_name(self, lines):
+    def _name_from_candidate(self, candidate, clean=True):
+        """
+        Finds a name in the text that follows a name keyword.
+
+        Tries each name pattern first, then falls back to the leading run of
+        capitalised words and initials.
+
+        Args:
+            candidate (str): The text after the keyword.
+            clean (bool): Whether to strip nicknames, degrees, etc. from the
+                candidate and from each pattern match.
+
+        Returns:
+            str: The name, or None if the candidate does not start with one.
+        """
+        if clean:
+            # Clean the candidate (remove nicknames, Ph.D., etc.)
+            candidate = self.clean_name_candidate(candidate)
+        if not self.two_capitals_pattern.search(candidate):
+            return None
+        for pattern in self.matching_name_patterns(candidate):
+            pattern_match = pattern.search(candidate)
+            if pattern_match:
+                possible_name = pattern_match.group(1)
+                if clean:
+                    possible_name = self.clean_name_candidate(possible_name)
+                if self.is_instructor_name(possible_name):
+                    return possible_name
+        # Take the leading run of name words, stopping at the first word that is not one
+        name_candidate = []
+        pos = 0
+        while len(name_candidate) < MAX_NAME_CANDIDATE_LENGTH:
+            word_match = self.name_word_pattern.match(candidate, pos)
+            if not word_match:
+                break
+            name_candidate.append(word_match.group(1))
+            pos = word_match.end()
+        if MIN_NAME_CANDIDATE_LENGTH <= len(name_candidate) <= MAX_NAME_CANDIDATE_LENGTH:
+            possible_name = ' '.join(name_candidate)
+            if self.is_instructor_name(possible_name):
+                return possible_name
+        return None
+
+    def extract_name(self, lines, lines_lower=None):
         """
         Extracts the instructor's name from the given lines of text.
 
         Args:
             lines (list): The lines of text to search.
+            lines_lower (list, optional): The same lines already lowercased.
 
         Returns:
             str: The extracted name, or None if not found.
         """
+        if lines_lower is None:
+            lines_lower = [line.lower() for line in lines]
         lines_for_name = lines[1:] if len(lines) > 1 else lines
+        lines_for_name_lower = lines_lower[1:] if len(lines_lower) > 1 else lines_lower
         name = None
         found_keyword = False
-        patterns = [
-            # Name with nickname in parentheses and hyphenated last name: Mateusz (Matt) Pacha-Sucharzewski
-            r'([A-Z][a-zA-Z\-]+\s+\([A-Za-z]+\)\s+[A-Z][a-zA-Z]+(?:-[A-Z][a-zA-Z]+)+)',
-            # Name with nickname in parentheses: Mateusz (Matt) Smith
-            r'([A-Z][a-zA-Z\-]+\s+\([A-Za-z]+\)\s+[A-Z][a-zA-Z\-]+)',
-            # First Last-Last (hyphenated last name without nickname)
-            r'([A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+(?:-[A-Z][a-zA-Z]+)+)',
-            # Initials with periods: K.M. Kilcrease or J.R. Smith
-            r'([A-Z]\.[A-Z]\.?\s+[A-Z][a-zA-Z\-]+)',
-            # Initials with spaces: K. M. Kilcrease or R J Greene
-            r'([A-Z]\.?\s+[A-Z]\.?\s+[A-Z][a-zA-Z\-]+)',
-            # First M. Last (with middle initial)
-            r'([A-Z][a-zA-Z\-]+\s+[A-Z]\.\s+[A-Z][a-zA-Z\-]+)',
-            # First Middle Last (three names)
-            r'([A-Z][a-zA-Z\-]+\s+[A-Z][a-zA-Z\-]+\s+[A-Z][a-zA-Z\-]+)',
-            # First Last (simple two-word name)
-            r'([A-Z][a-zA-Z\-]+\s+[A-Z][a-zA-Z\-]+)',
-        ]
-        # Search all but the first line
-        prevKeyword = ""
-        for i, line in enumerate(lines_for_name):
-            prevLine = lines_for_name[i-1] if i > 0 else ""
-            line_clean = line.lower()
-            for keyword in self.name_keywords:
-                if keyword.lower() == "name":
+        # Indexes into lines of the lines a name keyword was found on
+        keyword_lines = set()
+        name_line_offset = 1 if len(lines) > 1 else 0
+        # Search all but the first line, pairing each with the line before it
+        len_lines = len(lines)
+        prev_lines_lower = [""] + lines_for_name_lower[:-1]
+        for i, (prevLine_lower, line, line_clean) in enumerate(zip(prev_lines_lower, lines_for_name, lines_for_name_lower)):
+            # one scan for all keywords before trying them one by one
+            if not self.name_keyword_pattern.search(line_clean):
+                continue
+            for keyword, keyword_lower, splitter in self.keyword_splitters:
+                if keyword_lower == "name":
                     if any(prefix + " name" in line_clean for prefix in self.non_name_prefixes):
                         continue  # skip this keyword match
-                    if prevLine.lower() in self.non_name_prefixes:
+                    if prevLine_lower in self.non_name_prefixes:
                         continue
-                if keyword.lower() in line_clean:
+                if keyword_lower in line_clean:
                     found_keyword = True
-                    after = re.split(rf'{keyword}[:\-]*', line, flags=re.IGNORECASE)
+                    keyword_lines.add(i + name_line_offset)
+                    # only after[1] (the text up to any repeat of the keyword) is used
+                    after = splitter.split(line, maxsplit=2)
                     if after in self.non_name:
                         continue
                     else:
                         candidate = after[1].strip() if len(after) > 1 else ''
                     if not candidate:
-                        if i + NEXT_LINE_OFFSET < len(lines):
+                        if i + NEXT_LINE_OFFSET < len_lines:
                             candidate = lines[i + NEXT_LINE_OFFSET].strip()
-                    # Clean the candidate (remove nicknames, Ph.D., etc.)
-                    candidate = self.clean_name_candidate(candidate)
-                    for pattern in patterns:
-                        pattern_match = re.search(pattern, candidate)
-                        if pattern_match:
-                            possible_name = self.clean_name_candidate(pattern_match.group(1))
-                            if self.is_valid_name(possible_name) and not self.contains_non_name_keyword(possible_name):
-                                name = possible_name
-                                break
+                    name = self._name_from_candidate(candidate)
                     if name:
                         break
-                    words = candidate.split()
-                    name_candidate = []
-                    for word in words:
-                        # Also allow single capital letter (for initials like R J Greene)
-                        if re.match(r'^[A-Z][a-zA-Z\-\.]*$', word) or re.match(r'^[A-Z]\.$', word) or re.match(r'^[A-Z]$', word):
-                            name_candidate.append(word)
-                            if len(name_candidate) == MAX_NAME_CANDIDATE_LENGTH:
-                                break
-                        else:
-                            break
-                    if MIN_NAME_CANDIDATE_LENGTH <= len(name_candidate) <= MAX_NAME_CANDIDATE_LENGTH:
-                        possible_name = ' '.join(name_candidate)
-                        if self.is_valid_name(possible_name) and not self.contains_non_name_keyword(possible_name):
-                            name = possible_name
-                            break
-                prevKeyword = keyword
             if name:
                 break
 
         # If no name found, check the first line
-        if not name and len(lines) > 0:
+        if not name and len(lines) > 0 and self.name_keyword_pattern.search(lines_lower[0]):
             first_line = lines[0]
-            for keyword in self.name_keywords:
-                if keyword.lower() in first_line.lower():
-                    after = re.split(rf'{keyword}[:\-]*', first_line, flags=re.IGNORECASE)
+            first_line_lower = lines_lower[0]
+            for keyword, keyword_lower, splitter in self.keyword_splitters:
+                if keyword_lower in first_line_lower:
+                    keyword_lines.add(0)
+                    after = splitter.split(first_line, maxsplit=2)
                     candidate = after[1].strip() if len(after) > 1 else ''
-                    for pattern in patterns:
-                        pattern_match = re.search(pattern, candidate)
-                        if pattern_match:
-                            possible_name = pattern_match.group(1)
-                            if self.is_valid_name(possible_name) and not self.contains_non_name_keyword(possible_name):
-                                name = possible_name
-                                break
+                    name = self._name_from_candidate(candidate, clean=False)
                     if name:
                         break
-                    words = candidate.split()
-                    name_candidate = []
-                    for word in words:
-                        if re.match(r'^[A-Z][a-zA-Z\-\.]*$', word) or re.match(r'^[A-Z]\.$', word):
-                            name_candidate.append(word)
-                            if len(name_candidate) == MAX_NAME_CANDIDATE_LENGTH:
-                                break
-                        else:
-                            break
-                    if MIN_NAME_CANDIDATE_LENGTH <= len(name_candidate) <= MAX_NAME_CANDIDATE_LENGTH:
-                        possible_name = ' '.join(name_candidate)
-                        if self.is_valid_name(possible_name) and not self.contains_non_name_keyword(possible_name):
-                            name = possible_name
-                            break
+
+        if not name:
+            # The fallback passes skip textbook/publisher lines ("Pearson Education"),
+            # but never a line with a name keyword: that is the instructor's own line
+            skip_line = [
+                i not in keyword_lines and bool(self.skip_line_pattern.search(line_lower))
+                for i, line_lower in enumerate(lines_lower)
+            ]
+            skip_line_for_name = skip_line[name_line_offset:]
 
         # 2. Check for standalone names on early lines (first 20 lines)
         # These are lines that contain ONLY a name-like pattern (no other text)
@@ -302,34 +631,35 @@ class InstructorDetector:
             for i, line in enumerate(early_lines):
                 line_stripped = line.strip()
                 # Skip empty lines or lines that are too long (likely sentences)
-                if not line_stripped or len(line_stripped) > 60:
-                    continue
-                # Skip lines that look like course titles, dates, or other non-name content
-                if re.search(r'\b(COMP|ET|BUS|PHYS|HLS|BIOT|course|syllabus|spring|fall|summer|winter|20\d{2}|credits?)\b', line_stripped, re.IGNORECASE):
+                if not line_stripped or len(line_stripped) > 60 or skip_line[i]:
                     continue
-                # Skip lines with email, phone, or URL patterns
-                if re.search(r'@|http|www\.|\.edu|\.com|\d{3}[-.\s]?\d{3}', line_stripped, re.IGNORECASE):
+                # Skip lines that look like course titles, dates, contact details or other non-name content
+                if self.standalone_skip_pattern.search(line_stripped):
                     continue
                 # Clean the line
                 cleaned_line = self.clean_name_candidate(line_stripped)
+                if not self.two_capitals_pattern.search(cleaned_line):
+                    continue
                 # Try to match name patterns
-                for pattern in patterns:
-                    pattern_match = re.match(rf'^{pattern}[,\s]*$', cleaned_line)
-                    if pattern_match:
-                        possible_name = self.clean_name_candidate(pattern_match.group(1))
-                        if self.is_valid_name(possible_name) and not self.contains_non_name_keyword(possible_name):
-                            name = possible_name
-                            break
-                if name:
-                    break
+                pattern_match = self.anchored_name_pattern.match(cleaned_line)
+                if pattern_match:
+                    possible_name = self.clean_name_candidate(pattern_match.group(pattern_match.lastindex))
+                    if self.is_instructor_name(possible_name):
+                        name = possible_name
+                        break
 
         # 3. Only if NO instructor/name keyword was found at all, fall back to pattern search
         if not name and not found_keyword:
-            for pattern in patterns:
-                for line in lines_for_name:
-                    for possible_name in re.findall(pattern, line.strip()):
+            # one combined scan per line keeps only lines where some pattern can match
+            name_lines = [
+                line.strip() for line, skip in zip(lines_for_name, skip_line_for_name)
+                if not skip and self.matching_name_patterns(line)
+            ]
+            for pattern in self.name_patterns:
+                for line in name_lines:
+                    for possible_name in pattern.findall(line):
                         cleaned_name = self.clean_name_candidate(possible_name)
-                        if self.is_valid_name(cleaned_name) and not self.contains_non_name_keyword(cleaned_name):
+                        if self.is_instructor_name(cleaned_name):
                             name = cleaned_name
                             break
                     if name:
@@ -337,16 +667,18 @@ class InstructorDetector:
                 if name:
                     break
         if not name:
-            indices = [i for i, line in enumerate(lines_for_name) if re.search(r'@|office|room|building', line, re.IGNORECASE)]
+            indices = [i for i, line in enumerate(lines_for_name) if self.context_line_pattern.search(line)]
             checked = set()
             for idx in indices:
                 for offset in range(-CONTEXT_OFFSET_RANGE, CONTEXT_OFFSET_RANGE + 1):
                     j = idx + offset
                     if 0 <= j < len(lines_for_name) and j not in checked:
                         checked.add(j)
-                        for pattern in patterns:
-                            for possible_name in re.findall(pattern, lines_for_name[j].strip()):
-                                if self.is_valid_name(possible_name) and not self.contains_non_name_keyword(possible_name):
+                        if skip_line_for_name[j]:
+                            continue
+                        for pattern in self.matching_name_patterns(lines_for_name[j]):
+                            for possible_name in pattern.findall(lines_for_name[j].strip()):
+                                if self.is_instructor_name(possible_name):
                                     name = possible_name
                                     break
                             if name:
@@ -359,27 +691,30 @@ class InstructorDetector:
         # return name if found, else None
         return name
 
-    def extract_title(self, lines):
+    def extract_title(self, lines, lines_lower=None):
         """
         Extracts the instructor's title from the given lines of text.
 
         Args:
             lines (list): The lines of text to search.
+            lines_lower (list, optional): The same lines already lowercased.
 
         Returns:
             str: The extracted title, or None if not found.
         """
-        # First, look for any title except 'Dr'/'Dr.' and 'Phd'/'Ph.D'
-        found_title = None
-        for line in lines:
-            for keyword in self.title_keywords:
-                if keyword not in ['Dr', 'Dr.']:
-                    if keyword.lower() in line.lower():
-                        return keyword.title() if keyword.islower() else keyword
-                elif keyword.lower() in ['phd', 'ph.d']:
-                    if keyword.lower() in line.lower():
-                        found_title = keyword.title() if keyword.islower() else keyword
-
+        if lines_lower is None:
+            lines_lower = [line.lower() for line in lines]
+        # One scan finds the first line holding any title; within that line the
+        # keywords keep their priority order ('assistant professor' before 'professor')
+        text_lower = '\n'.join(lines_lower)
+        title_match = self.title_keyword_pattern.search(text_lower)
+        if not title_match:
+            return None
+        line_lower = lines_lower[text_lower.count('\n', 0, title_match.start())]
+        for keyword, keyword_lower in self.title_keyword_pairs:
+            if keyword_lower in line_lower:
+                return keyword.title() if keyword.islower() else keyword
+        return None
 
     def extract_department(self, lines):
         """
@@ -391,22 +726,16 @@ class InstructorDetector:
         Returns:
             str: The extracted department, or None if not found.
         """
-        # First, require a capital D when matching 'Department' or 'Dept.' to avoid
-        # lower-case false positives (e.g., 'department' inside sentences).
-        dept_pattern_cs = re.compile(r"\b(Department|Dept\.)[\s:,-]*([A-Za-z &\-.,]+)")
-        # Fallback patterns (case-insensitive) for School/Division/Program/College
-        other_pattern = re.compile(r"\b(School of|Division of|Program\b|College of|Department and Program|Department/Program)[\s:,-]*([A-Za-z &\-.,]+)", re.IGNORECASE)
-
         for line in lines:
             # try case-sensitive Department/Dept. first
-            dept_match = dept_pattern_cs.search(line)
+            dept_match = self.dept_pattern_cs.search(line)
             if dept_match:
                     # Only treat 'program' as a separate label when it's actually used as a label
                     # (e.g., 'Program: X' or 'Department and Program: X'). If 'program' appears
                     # as a trailing word in the department name (e.g., 'Bio/Biotech program'),
                     # leave it in the captured value.
-                    dept_and_prog = re.search(r'Department\s*(?:and|/)\s*Program\s*[:\-]', line, re.IGNORECASE)
-                    prog_label = re.search(r'\bprogram\b\s*[:\-]', line, re.IGNORECASE)
+                    dept_and_prog = self.dept_and_program_pattern.search(line)
+                    prog_label = self.program_label_pattern.search(line)
                     if dept_and_prog:
                         value = line[dept_and_prog.end():].strip()
                     elif prog_label:
@@ -414,54 +743,50 @@ class InstructorDetector:
                     else:
                         value = dept_match.group(2).strip()
             else:
-                other_match = other_pattern.search(line)
+                other_match = self.dept_other_pattern.search(line)
                 if other_match:
                     value = other_match.group(2).strip()
                 else:
                     continue
 
             # cleanup leading punctuation/labels
-            value = re.sub(r'^[\s:,-]+', '', value)
-            value = re.sub(r'^(Department|Dept\.|Program\b|School of|Division of|College of)[\s:,-]*', '', value, flags=re.IGNORECASE)
+            value = self.dept_leading_punct_pattern.sub('', value)
+            value = self.dept_leading_label_pattern.sub('', value)
 
             # normalize whitespace and strip trailing punctuation
-            value = re.sub(r'\s+', ' ', value).strip().strip('.,;-')
+            value = ' '.join(value.split()).strip('.,;-')
 
             # Skip very generic or empty values
             low = value.lower()
-            if not value or low in ['dept.', 'department', 'department and program', 'school of', 'division of', 'program', 'college of', 'department/program']:
-                continue
-            if low in self.name_non_personal or low in self.name_stopwords:
+            if not value or low in self.generic_department_values or low in self.name_bad_words:
                 continue
 
             # limit returned department to up to MAX_DEPARTMENT_WORDS words
-            words = [word for word in re.split(r'\s+', value) if word]
+            words = value.split()
             if len(words) > MAX_DEPARTMENT_WORDS:
                 words = words[:MAX_DEPARTMENT_WORDS]
-            return ' '.join(words).strip()
+            return ' '.join(words)
 
         return None
 
-    def _search_known_departments(self, text: str):
+    def _search_known_departments(self, search_text: str):
         """
         Fallback search for known department names in text.
         Only searches near instructor info (top 30 lines) to avoid false positives
         from program descriptions or footers.
 
         Args:
-            text (str): The full syllabus text.
+            search_text (str): The first LINES_TO_SCAN lines, lowercased and joined with newlines.
 
         Returns:
             str: The department name if found, or None.
         """
-        # Only search first 30 lines (where instructor info typically appears)
-        # This avoids matching department names in course descriptions or footers
-        lines = text.split('\n')[:30]
-        search_text = '\n'.join(lines).lower()
+        if not self.known_department_pattern.search(search_text):
+            return None
 
         # Search for known departments (list is ordered from most specific to least)
-        for dept in self.known_departments:
-            if dept.lower() in search_text:
+        for dept, dept_lower in self.known_department_pairs:
+            if dept_lower in search_text:
                 return dept
 
         return None
@@ -470,22 +795,92 @@ class InstructorDetector:
         """
         Detects instructor name, title, and department from syllabus text.
 
+        Results for texts up to MAX_CACHED_TEXT_LENGTH characters are kept in a
+        bounded LRU cache, so duplicate syllabi in a batch are only scanned once.
+        The cache is keyed by detector class and text, not by instance: changes
+        made to one instance's keyword lists are not seen by cached results, so
+        such an instance should call _detect() to bypass the cache.
+
+        Args:
+            text (str): The syllabus text to search.
+
+        Returns:
+            Dict[str, Any]: Dictionary with keys 'found', 'name', 'title', 'department'.
+        """
+        cacheable = len(text) <= MAX_CACHED_TEXT_LENGTH
+        if cacheable:
+            # Subclasses may detect differently, so each class has its own entries
+            key = (type(self), text)
+            with _DETECT_CACHE_LOCK:
+                cached = _DETECT_CACHE.get(key)
+                if cached is not None:
+                    _DETECT_CACHE.move_to_end(key)
+            if cached is not None:
+                self.logger.info("Using cached result for field: %s", self.field_name)
+                # the values are immutable, so a new dict keeps callers off the cached one
+                return dict(cached)
+
+        result = self._detect(text)
+
+        if cacheable:
+            with _DETECT_CACHE_LOCK:
+                _DETECT_CACHE[key] = dict(result)
+                if len(_DETECT_CACHE) > DETECT_CACHE_SIZE:
+                    _DETECT_CACHE.popitem(last=False)
+        return result
+
+    def detect_batch(self, texts, max_workers=None, use_threads=False) -> List[Dict[str, Any]]:
+        """
+        Runs detect() over many syllabi in parallel.
+
+        Worker processes each build one detector of this detector's class and reuse
+        it for every text they are given, so changes made to this instance after
+        construction are not seen there. Threads share this detector instead, which only
+        pays off when the matching releases the GIL (e.g. with RE2 installed).
+
+        Args:
+            texts (list): The syllabus texts to search.
+            max_workers (int, optional): Number of workers; defaults to the executor's choice.
+            use_threads (bool): Use a thread pool instead of a process pool.
+
+        Returns:
+            List[Dict[str, Any]]: One detect() result per text, in input order.
+        """
+        texts = list(texts)
+        if len(texts) <= 1:
+            return [self.detect(text) for text in texts]
+        if use_threads:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(self.detect, texts))
+        # a few chunks per worker keeps the pickling overhead low while balancing load
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(texts) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(functools.partial(_detect_in_worker, type(self)), texts, chunksize=chunksize))
+
+    def _detect(self, text: str) -> Dict[str, Any]:
+        """
+        Runs the uncached detection for detect().
+
         Args:
             text (str): The syllabus text to search.
 
         Returns:
             Dict[str, Any]: Dictionary with keys 'found', 'name', 'title', 'department'.
         """
-        self.logger.info(f"Starting detection for field: {self.field_name}")
+        self.logger.info("Starting detection for field: %s", self.field_name)
 
         lines = text.split('\n')[:LINES_TO_SCAN]
-        name = self.extract_name(lines)
-        title = self.extract_title(lines)
+        lines_lower = [line.lower() for line in lines]
+        name = self.extract_name(lines, lines_lower)
+        title = self.extract_title(lines, lines_lower)
         department = self.extract_department(lines)
 
         # Fallback: if no department found by pattern matching, search for known departments
         if not department:
-            department = self._search_known_departments(text)
+            # Only the scanned lines (where instructor info typically appears) are searched,
+            # which avoids matching department names in course descriptions or footers
+            department = self._search_known_departments('\n'.join(lines_lower))
 
         # Fallback: if no name was found by the normal logic, scan every
         # PAGE_SIZE-line "page" for a simple "Dr. Lastname" pattern and return
@@ -493,11 +888,10 @@ class InstructorDetector:
         # because syllabus text often uses the short form 'Dr. Smith'.
         if not name:
             all_lines = text.split('\n')
-            dr_pattern = re.compile(r"\bDr\.?\s+([A-Z][a-zA-Z\-]+)\b")
             for i in range(0, len(all_lines), PAGE_SIZE):
                 page = all_lines[i:i+PAGE_SIZE]
                 for page_line in page:
-                    dr_match = dr_pattern.search(page_line)
+                    dr_match = self.dr_pattern.search(page_line)
                     if dr_match:
                         lastname = dr_match.group(1)
                         # Standardize to 'Dr. Lastname'
@@ -509,7 +903,7 @@ class InstructorDetector:
         found = bool(name and title and department and name != 'N/A' and title != 'N/A' and department != 'N/A')
 
         if found:
-            self.logger.info(f"FOUND: {self.field_name} - Name: {name}, Title: {title}, Dept: {department}")
+            self.logger.info("FOUND: %s - Name: %s, Title: %s, Dept: %s", self.field_name, name, title, department)
         else:
             if not name:
                 name = 'Missing'
@@ -517,6 +911,6 @@ class InstructorDetector:
                 title = 'Missing'
             if not department:
                 department = 'Missing'
-            self.logger.info(f"NOT_FOUND: {self.field_name} - Name: {name}, Title: {title}, Dept: {department}")
+            self.logger.info("NOT_FOUND: %s - Name: %s, Title: %s, Dept: %s", self.field_name, name, title, department)
 
         return {'found': found, 'name': name, 'title': title, 'department': department}
@@ -15,7 +15,15 @@ It looks for titles like "Late Work", and if it cannot find any titles it'll try
 
 import re
 import logging
-from typing import Dict, Any, Tuple
+import unicodedata
+from typing import Dict, Any, List, Optional, Tuple
+
+# Optional linear-time regex engine for the content scan
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
 
 # Detection Configuration Constants
 MAX_DOCUMENT_LENGTH = 20000
@@ -41,6 +49,104 @@ SECTION_HEADERS = [
     'prerequisites', 'textbook', 'grading', 'schedule',
     'extra credit', 'attendance'
 ]
+# Matched against the lowercased line; a plain alternation keeps the substring semantics
+SECTION_HEADERS_REGEX = re.compile('|'.join(re.escape(section) for section in SECTION_HEADERS))
+
+# Unicode punctuation mapped to ASCII equivalents by _normalize_text, after NFKC
+# normalization has already folded compatibility forms such as the full-width colon
+_PUNCTUATION_TABLE = str.maketrans({
+    '\u2014': '-',  # Em-dash
+    '\u2013': '-',  # En-dash
+    '\u2010': '-',  # Hyphen
+    '\u2011': '-',  # Non-breaking hyphen
+    '\u2043': '-',  # Hyphen bullet
+    '\u2019': "'",  # Right single quote
+    '\u2018': "'",  # Left single quote
+    '\u201c': '"',  # Left double quote
+    '\u201d': '"',  # Right double quote
+})
+
+# Deletes the colons and periods that title comparisons ignore
+_PUNCTUATION_STRIP_TABLE = str.maketrans('', '', ':.')
+
+# Content patterns that strongly indicate late work policies
+# Made more conservative to reduce false positives
+CONTENT_PATTERNS = [
+    # High confidence patterns - require clear policy language
+    r"late work is.*?(?:anything submitted|defined as|considered).*?after.*?(?:due date|deadline)",
+    r"you will lose.*?\d+.*?(?:percent|%).*?per day.*?(?:late|tardy)",  # Must have "per day" context
+    r"late work is anything submitted after.*?(?:due date|deadline)",  
+    r"(?:\d+%|ten percent|\d+ percent).*?(?:deduction|penalty).*?per day.*?(?:late work|late assignment)",
+    r"late work will not be accepted.*?(?:after|beyond)",
+    r"no assignment will be accepted after.*?(?:deadline|due date)",
+    r"submissions will not be accepted after.*?(?:deadline|due date)",
+    r"(?:late|tardy).*?(?:penalty|deduction).*?\d+%.*?(?:per day|each day)",
+    r"do not submit.*?(?:homework|assignment|work).*?late",
+    r"you may hand in.*?(?:one|1).*?late.*?(?:homework|assignment)",
+
+    # New pattern for the specific case you mentioned
+    r"any assignment not turned in by.*?(?:midnight|due date|date).*?(?:late|penalty|grade penalty)",
+
+    # Medium confidence patterns
+    r"unexcused late.*?will receive.*?deduction",
+    r"no submissions.*?accepted.*?(?:after|beyond).*?\d+.*?days",
+    r"three days after.*?due date.*?will not be accepted",
+    r"(?:48|forty-eight) hours after.*?due.*?(?:day|date)",
+    r"grace period.*?(?:late|assignment)",
+    r"make-?up.*?(?:work|exam|assignment).*?(?:policy|will be)",
+
+    # Medium confidence patterns - require more context
+    r"late submissions.*?no assignment will be accepted",
+    r"(?:late|tardy).*?(?:work|assignment).*?policy",  # Must mention "policy"
+    r"(?:grading|penalty).*?\(late policy.*?\)",
+
+    # Conservative patterns for simple statements  
+    r"(?:homework|assignments).*?submitted late.*?(?:deduct|reduce|lose).*?\d+",  # Must have penalty amount
+    r"(?:one|1).*?late.*?(?:homework|assignment).*?(?:allowed|accepted)",
+
+    # Additional patterns for assignment-specific policies
+    r"assignment.*?not turned in.*?(?:midnight|due date).*?(?:late|penalty)",
+    r"(?:assignment|homework).*?(?:due date|deadline).*?(?:penalty|deduction|zero|0)",
+    r"after.*?(?:due date|deadline).*?assignment.*?(?:not accepted|zero|penalty)",
+
+    # Patterns for combined title+content cases
+    r"late submissions.*?no assignment will be accepted",
+    r"late work.*?no.*?(?:assignment|work).*?(?:accepted|allowed)",
+    r"you will receive.*?(?:grade of 0|zero).*?for.*?(?:quiz|exam).*?(?:miss|late)",
+    r"you will receive a grade of 0 for any (?:quiz|exam|assignment) that you miss",  # Very specific pattern
+    r"late submissions.*?no assignment will be accepted after.*?deadline.*?grade",  # Combined title+content pattern
+]
+
+# Multi-line patterns - more conservative
+MULTILINE_PATTERNS = [
+    r"late work is anything submitted after.*?(?:unless you have received|zero will be given|will not be accepted)",
+    r"(?:10|ten)%.*?per day.*?for.*?(?:work submitted late|late work).*?(?:up to|for up to)",
+    r"late work is.*?(?:submitted|turned in|handed in).*?after.*?(?:due|deadline).*?(?:penalty|deduction|lose)",
+    r"(?:penalty|deduction).*?\d+.*?(?:percent|%).*?per day.*?(?:late|tardy)",
+]
+
+# Compiled once at import. A line only needs to match some content pattern, so they
+# are fused into one alternation. Without DOTALL no match can cross a newline, so one
+# scan of the lowercased document finds exactly the lines a per-line search would.
+# Multi-line patterns are tried in order against the whole lowercased document; their
+# fused form only tells whether any of them can match at all.
+CONTENT_REGEX = re.compile('|'.join(f'(?:{pattern})' for pattern in CONTENT_PATTERNS), re.IGNORECASE)
+# ASCII text is scanned as bytes, which re matches faster than str and where its \d and
+# case folding behave exactly as on the ASCII str. RE2 has no backtracking, so the lazy
+# wildcards cannot blow up on long lines; it is only given those ASCII bytes, and the
+# leftmost match start, which is all the scan uses, does not depend on the engine.
+CONTENT_REGEX_BYTES = re.compile(CONTENT_REGEX.pattern.encode('ascii'), re.IGNORECASE)
+CONTENT_REGEX_RE2 = re2.compile(b'(?i)' + CONTENT_REGEX_BYTES.pattern) if RE2_AVAILABLE else None
+MULTILINE_REGEXES = [re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in MULTILINE_PATTERNS]
+MULTILINE_REGEX = re.compile('|'.join(f'(?:{pattern})' for pattern in MULTILINE_PATTERNS), re.IGNORECASE | re.DOTALL)
+
+# Every content and multi-line pattern requires at least one of these literals, so a
+# document containing none of them cannot match and skips the pattern scans entirely
+CONTENT_KEYWORDS = [
+    'late', 'tardy', 'per day', 'accepted', 'submit', 'hand in', 'turned in',
+    'hours after', 'grace period', 'make', 'due date', 'deadline', 'receive',
+]
+CONTENT_KEYWORD_REGEX = re.compile('|'.join(re.escape(keyword) for keyword in CONTENT_KEYWORDS), re.IGNORECASE)
 
 
 class LateDetector:
@@ -94,6 +200,29 @@ class LateDetector:
             "summary/critique paper (late policy)",
             "experiments/demonstrations"
         ]
+        # Titles normalized once for the line comparisons, with their word counts
+        self.normalized_titles = [self._normalize_text(title) for title in self.approved_titles]
+        self.title_word_counts = [len(title.split()) for title in self.normalized_titles]
+        # Set forms of the titles for the exact-match lookups
+        self.normalized_title_set = frozenset(self.normalized_titles)
+        self.normalized_title_colon_set = frozenset(title + ':' for title in self.normalized_titles)
+        # Any title as it can appear in a line with ':' and '.' removed. A line where this
+        # finds nothing cannot be an exact or a header match, so it is skipped.
+        self.title_pattern = re.compile('|'.join(
+            re.escape(title.translate(_PUNCTUATION_STRIP_TABLE).strip())
+            for title in sorted(self.normalized_titles, key=len, reverse=True)
+        ))
+        # Longest-first, so a match at the start of a line is the longest title the line
+        # starts with; the tuple answers whether a line ends with any title
+        self.title_prefix_pattern = re.compile('|'.join(
+            re.escape(title) for title in sorted(self.normalized_titles, key=len, reverse=True)
+        ))
+        self.normalized_title_tuple = tuple(self.normalized_titles)
+        # Normalizing never lengthens an ASCII line, so one shorter than the shortest
+        # searchable title cannot contain one
+        self.min_title_length = min(
+            len(title.translate(_PUNCTUATION_STRIP_TABLE).strip()) for title in self.normalized_titles
+        )
 
     @staticmethod
     def _normalize_text(text: str) -> str:
@@ -101,39 +230,39 @@ class LateDetector:
         Normalize text for consistent matching.
         Handles:
         - Lowercasing
-        - Unicode punctuation (full-width colon, em-dash, etc.)
+        - Unicode compatibility forms (NFKC: full-width colon, ligatures, etc.)
+        - Unicode punctuation (em-dash, curly quotes, etc.)
         - Extra whitespace
         """
         if not text:
             return ""
 
-        # Lowercase first
-        normalized = text.lower()
-
-        # Replace Unicode punctuation with ASCII equivalents
-        normalized = normalized.replace('：', ':')  # Full-width colon
-        normalized = normalized.replace('—', '-')  # Em-dash
-        normalized = normalized.replace('–', '-')  # En-dash
-        normalized = normalized.replace('‐', '-')  # Hyphen (U+2010)
-        normalized = normalized.replace('‑', '-')  # Non-breaking hyphen (U+2011)
-        normalized = normalized.replace('⁃', '-')  # Bullet operator (U+2043)
-        normalized = normalized.replace('\u2014', '-')  # Em-dash (unicode)
-        normalized = normalized.replace('\u2013', '-')  # En-dash (unicode)
-        normalized = normalized.replace('\u2010', '-')  # Hyphen (unicode)
-        normalized = normalized.replace('\u2011', '-')  # Non-breaking hyphen (unicode)
-        normalized = normalized.replace('\u2043', '-')  # Bullet operator (unicode)
-        
-        # Handle common Unicode quotation marks
-        normalized = normalized.replace("’", "'")   # Right single quote
-        normalized = normalized.replace("‘", "'")   # Left single quote
-        normalized = normalized.replace("“", '"')   # Left double quote
-        normalized = normalized.replace("”", '"')   # Right double quote
+        return LateDetector._normalize_lowered_text(text.lower())
 
+    @staticmethod
+    def _normalize_lowered_text(text_lower: str) -> str:
+        """
+        Normalize text that is already lowercased, as _normalize_text does.
+        """
+        # NFKC folds compatibility characters (full-width forms, ligatures, ...);
+        # it can produce uppercase letters, so lowercase again. ASCII is unaffected.
+        if not text_lower.isascii():
+            text_lower = unicodedata.normalize('NFKC', text_lower).lower()
 
-        # Normalize whitespace (multiple spaces -> single space)
-        normalized = ' '.join(normalized.split())
+        # Map the remaining Unicode punctuation to ASCII in one pass, then
+        # normalize whitespace (multiple spaces -> single space)
+        return ' '.join(text_lower.translate(_PUNCTUATION_TABLE).split())
 
-        return normalized
+    @staticmethod
+    def _line_at(text: str, line_starts: List[int], index: int) -> str:
+        """
+        Return line ``index`` of text (without its newline), given the
+        offsets at which each line starts.
+        """
+        start = line_starts[index]
+        if index + 1 < len(line_starts):
+            return text[start:line_starts[index + 1] - 1]
+        return text[start:]
 
     def detect(self, text: str) -> Dict[str, Any]:
         """
@@ -154,9 +283,12 @@ class LateDetector:
             text = text[:MAX_DOCUMENT_LENGTH]
             self.logger.info(f"Truncated large document from {original_length} to {MAX_DOCUMENT_LENGTH} characters")
 
+        # Both passes work on the same lowercased text
+        text_lower = text.lower()
+
         try:
             # First try title-based detection
-            found, content = self._simple_title_detection(text)
+            found, content = self._simple_title_detection(text, text_lower)
             
             if found:
                 result = {
@@ -169,7 +301,7 @@ class LateDetector:
             else:
                 # Fallback to content-based detection
                 self.logger.info("No approved titles found, trying content-based detection")
-                found, content = self._content_based_detection(text)
+                found, content = self._content_based_detection(text, text_lower)
                 
                 if found:
                     result = {
@@ -199,79 +331,95 @@ class LateDetector:
                 'content': None
             }
 
-    def _simple_title_detection(self, text: str) -> Tuple[bool, str]:
+    def _simple_title_detection(self, text: str, text_lower: Optional[str] = None) -> Tuple[bool, str]:
         """
         Simple title-based late detection.
         Just looks for exact approved titles and extracts following content.
 
         Args:
             text (str): Text to search
+            text_lower (str, optional): text.lower(), if already computed
 
         Returns:
             tuple: (found, content)
         """
-        lines = text.split('\n')
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # Every line's normalized form is a substring of the whole document's, so a
+        # document where no title appears cannot have a title line; skip the line scan
+        if not self.title_pattern.search(self._normalize_lowered_text(text_lower).translate(_PUNCTUATION_STRIP_TABLE)):
+            return False, ""
+
+        # Lines are screened in their lowercased form; the original text of a line is
+        # only sliced out, from line offsets built on first use, for candidate lines
+        # and the content that follows the best one
+        lines_lower = text_lower.split('\n')
+        line_starts = None
 
         # Find all potential matches first, then pick the best one
         potential_matches = []
 
-        for i, line in enumerate(lines):
-            line_normalized = self._normalize_text(line.strip())
-            line_without_punctuation = line_normalized.replace(':', '').replace('.', '').strip()
+        for i, line_lower in enumerate(lines_lower):
+            if len(line_lower) < self.min_title_length and line_lower.isascii():
+                continue
+            line_normalized = self._normalize_lowered_text(line_lower)
+            line_without_punctuation = line_normalized.translate(_PUNCTUATION_STRIP_TABLE).strip()
+            if not self.title_pattern.search(line_without_punctuation):
+                continue
+            if line_starts is None:
+                line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+            line = self._line_at(text, line_starts, i)
+            # Whitespace is uncased, so stripping cannot change this; computed once per
+            # candidate line for the header checks and scoring below
+            line_is_upper = line.isupper()
 
             # First check for exact matches - these get priority
-            exact_match_found = False
-            for title in self.approved_titles:
-                normalized_title = self._normalize_text(title)
-                if (normalized_title == line_without_punctuation or
-                    normalized_title + ':' == line_normalized or
-                    normalized_title == line_normalized.rstrip(':')):
-                    # Exact match - add with very high score
-                    potential_matches.append((100, i, line))
-                    exact_match_found = True
-                    break
-            
-            if exact_match_found:
+            if (line_without_punctuation in self.normalized_title_set or
+                line_normalized in self.normalized_title_colon_set or
+                line_normalized.rstrip(':') in self.normalized_title_set):
+                # Exact match - add with very high score
+                potential_matches.append((100, i, line))
                 continue
 
             # Check if any approved title appears properly (not just as part of a sentence)
             contains_approved_title = False
-            for title in self.approved_titles:
-                normalized_title = self._normalize_text(title)
+            line_word_count = len(line_without_punctuation.split())
+            prefix_title_match = self.title_prefix_pattern.match(line_without_punctuation)
+            ends_with_title = line_without_punctuation.endswith(self.normalized_title_tuple)
+            for normalized_title, title_word_count in zip(self.normalized_titles, self.title_word_counts):
                 if normalized_title in line_without_punctuation:
                     # Additional check: line should be relatively short and not part of a long sentence
                     # or the title should be at the start/end of the line
-                    line_words = line_without_punctuation.split()
-                    title_words = normalized_title.split()
 
                     # Much stricter check: title must appear in header-like format
                     is_valid_header = False
 
                     # Case 1: Very short line (title + max 2 extra words) with proper formatting
-                    if len(line_words) <= len(title_words) + MAX_EXTRA_WORDS_HEADER:
+                    if line_word_count <= title_word_count + MAX_EXTRA_WORDS_HEADER:
                         has_proper_formatting = (
                             ':' in line or                           # Has colon (section header)
-                            line.strip().isupper() or              # All caps
-                            (len(line_words) == len(title_words) and  # Exact title match
+                            line_is_upper or                           # All caps
+                            (line_word_count == title_word_count and  # Exact title match
                              not line_normalized.endswith((',', ';', '.', '!', '?')))
                         )
                         if has_proper_formatting:
                             is_valid_header = True
 
                     # Case 2: Title at the very beginning of line (starts with title)
-                    elif line_without_punctuation.startswith(normalized_title):
+                    elif prefix_title_match and line_without_punctuation.startswith(normalized_title):
                         # But only if it looks like a header (has colon or is short)
-                        if ':' in line or len(line_words) <= len(title_words) + MAX_EXTRA_WORDS_START:
+                        if ':' in line or line_word_count <= title_word_count + MAX_EXTRA_WORDS_START:
                             is_valid_header = True
 
                     # Case 3: Title at the very end of line (ends with title)
-                    elif line_without_punctuation.endswith(normalized_title):
+                    elif ends_with_title and line_without_punctuation.endswith(normalized_title):
                         # Only if it's a short line
-                        if len(line_words) <= len(title_words) + MAX_EXTRA_WORDS_END:
+                        if line_word_count <= title_word_count + MAX_EXTRA_WORDS_END:
                             is_valid_header = True
                     
                     # Case 4: For very short approved titles (like "Late Work"), be more lenient
-                    elif len(title_words) <= 3 and normalized_title in line_without_punctuation:
+                    elif title_word_count <= 3 and normalized_title in line_without_punctuation:
                         # Check if the title appears in isolation (not embedded in longer text)
                         title_start = line_without_punctuation.find(normalized_title)
                         title_end = title_start + len(normalized_title)
@@ -283,10 +431,10 @@ class LateDetector:
                                   line_without_punctuation[title_end] in ' \t\n:-.()[]')
                         
                         # Be even more lenient for 2-word titles like "Late Work" 
-                        if len(title_words) == 2:
-                            is_valid_header = before_ok and after_ok and len(line_words) <= len(title_words) + 6
+                        if title_word_count == 2:
+                            is_valid_header = before_ok and after_ok and line_word_count <= title_word_count + 6
                         else:
-                            is_valid_header = before_ok and after_ok and len(line_words) <= len(title_words) + 4
+                            is_valid_header = before_ok and after_ok and line_word_count <= title_word_count + 4
                             
                     # Case 5: Extra lenient check for exact title matches in short lines
                     elif (normalized_title == line_without_punctuation or 
@@ -302,36 +450,16 @@ class LateDetector:
                 # Score this match based on how likely it is to be a section header
                 score = 0
 
-                # Very high score for exact matches (check both case variations)
-                exact_match = False
-                for title in self.approved_titles:
-                    normalized_title = self._normalize_text(title)
-                    # Also check title case version
-                    title_case_version = title.title()
-                    normalized_title_case = self._normalize_text(title_case_version)
-                    
-                    for check_title in [normalized_title, normalized_title_case]:
-                        if (check_title == line_without_punctuation or 
-                            check_title + ':' == line_without_punctuation or
-                            check_title == line_without_punctuation.rstrip(':') or
-                            # Check if line starts with the title and has reasonable continuation
-                            (line_without_punctuation.startswith(check_title) and 
-                             len(line_without_punctuation) <= len(check_title) + 100)):
-                            exact_match = True
-                            break
-                    if exact_match:
-                        break
-                if exact_match:
-                    score += 20  # Very high score for exact matches
-
-                # Higher score for lines that start with approved titles
-                starts_with_approved = False
-                for title in self.approved_titles:
-                    normalized_title = self._normalize_text(title)
-                    if line_without_punctuation.startswith(normalized_title):
-                        starts_with_approved = True
-                        break
-                if starts_with_approved:
+                # The line starts with an approved title; if the longest such title leaves
+                # at most 100 more characters, it also counts as an exact match. (A line
+                # equal to a title starts with it, and normalized titles are lowercase,
+                # so their title-case forms normalize back to the same strings.)
+                if prefix_title_match:
+                    # Very high score for exact matches
+                    if len(line_without_punctuation) <= prefix_title_match.end() + 100:
+                        score += 20
+
+                    # Higher score for lines that start with approved titles
                     score += SCORE_STARTS_WITH_TITLE
 
                 # Higher score for shorter lines (more likely to be headers)
@@ -347,7 +475,7 @@ class LateDetector:
                     score += SCORE_HAS_COLON
 
                 # Higher score for lines in ALL CAPS
-                if line.strip().isupper():
+                if line_is_upper:
                     score += SCORE_ALL_CAPS
 
                 potential_matches.append((score, i, line))
@@ -367,16 +495,13 @@ class LateDetector:
             content_lines = [title]
             content_length = len(title)
 
-            for j in range(best_i + 1, min(best_i + MAX_CONTENT_LINES, len(lines))):
-                if j >= len(lines):
-                    break
-
-                next_line = lines[j].strip()
+            for j in range(best_i + 1, min(best_i + MAX_CONTENT_LINES, len(line_starts))):
+                next_line = self._line_at(text, line_starts, j).strip()
                 if not next_line:
                     continue
 
                 # Stop if we hit another section title
-                if any(section in next_line.lower() for section in SECTION_HEADERS):
+                if SECTION_HEADERS_REGEX.search(next_line.lower()):
                     break
 
                 content_lines.append(next_line)
@@ -391,127 +516,101 @@ class LateDetector:
 
         return False, ""
 
-    def _content_based_detection(self, text: str) -> Tuple[bool, str]:
+    def _content_based_detection(self, text: str, text_lower: Optional[str] = None) -> Tuple[bool, str]:
         """
         Content-based late work detection as fallback when no titles are found.
         Looks for common late work content patterns in the document.
 
         Args:
             text (str): Text to search
+            text_lower (str, optional): text.lower(), if already computed
 
         Returns:
             tuple: (found, content)
         """
-        # Content patterns that strongly indicate late work policies
-        # Made more conservative to reduce false positives
-        content_patterns = [
-            # High confidence patterns - require clear policy language
-            r"late work is.*?(?:anything submitted|defined as|considered).*?after.*?(?:due date|deadline)",
-            r"you will lose.*?\d+.*?(?:percent|%).*?per day.*?(?:late|tardy)",  # Must have "per day" context
-            r"late work is anything submitted after.*?(?:due date|deadline)",  
-            r"(?:\d+%|ten percent|\d+ percent).*?(?:deduction|penalty).*?per day.*?(?:late work|late assignment)",
-            r"late work will not be accepted.*?(?:after|beyond)",
-            r"no assignment will be accepted after.*?(?:deadline|due date)",
-            r"submissions will not be accepted after.*?(?:deadline|due date)",
-            r"(?:late|tardy).*?(?:penalty|deduction).*?\d+%.*?(?:per day|each day)",
-            r"do not submit.*?(?:homework|assignment|work).*?late",
-            r"you may hand in.*?(?:one|1).*?late.*?(?:homework|assignment)",
-            
-            # New pattern for the specific case you mentioned
-            r"any assignment not turned in by.*?(?:midnight|due date|date).*?(?:late|penalty|grade penalty)",
-            
-            # Medium confidence patterns
-            r"unexcused late.*?will receive.*?deduction",
-            r"no submissions.*?accepted.*?(?:after|beyond).*?\d+.*?days",
-            r"three days after.*?due date.*?will not be accepted",
-            r"(?:48|forty-eight) hours after.*?due.*?(?:day|date)",
-            r"grace period.*?(?:late|assignment)",
-            r"make-?up.*?(?:work|exam|assignment).*?(?:policy|will be)",
+        if text_lower is None:
+            text_lower = text.lower()
+        if not CONTENT_KEYWORD_REGEX.search(text_lower):
+            return False, ""
+        
+        # Line offsets are only needed once a pattern matches, to slice out the
+        # matched line and the few lines after it
+        line_starts = None
+        
+        # Offsets into the ASCII bytes are the same as into text_lower
+        if text_lower.isascii():
+            haystack = text_lower.encode('ascii')
+            newline = b'\n'
+            content_regex = CONTENT_REGEX_RE2 if CONTENT_REGEX_RE2 is not None else CONTENT_REGEX_BYTES
+        else:
+            haystack = text_lower
+            newline = '\n'
+            content_regex = CONTENT_REGEX
+        
+        # Search for content patterns, one line at a time from each match
+        i = 0
+        line_pos = 0
+        while True:
+            match = content_regex.search(haystack, line_pos)
+            if not match:
+                break
+            i += haystack.count(newline, line_pos, match.start())
+            if line_starts is None:
+                line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+            line = self._line_at(text, line_starts, i)
+            # Found a content pattern, extract surrounding context
             
-            # Medium confidence patterns - require more context
-            r"late submissions.*?no assignment will be accepted",
-            r"(?:late|tardy).*?(?:work|assignment).*?policy",  # Must mention "policy"
-            r"(?:grading|penalty).*?\(late policy.*?\)",
+            # Balanced content extraction - focused but not too restrictive
+            content_lines = []
             
-            # Conservative patterns for simple statements  
-            r"(?:homework|assignments).*?submitted late.*?(?:deduct|reduce|lose).*?\d+",  # Must have penalty amount
-            r"(?:one|1).*?late.*?(?:homework|assignment).*?(?:allowed|accepted)",
+            # Start with the current line that matched the pattern
+            current_line = line.strip()
+            if current_line:
+                content_lines.append(current_line)
+            total_length = len(current_line)
             
-            # Additional patterns for assignment-specific policies
-            r"assignment.*?not turned in.*?(?:midnight|due date).*?(?:late|penalty)",
-            r"(?:assignment|homework).*?(?:due date|deadline).*?(?:penalty|deduction|zero|0)",
-            r"after.*?(?:due date|deadline).*?assignment.*?(?:not accepted|zero|penalty)",
+            # Add up to 2 additional lines if they continue the policy
+            for j in range(i + 1, min(i + 3, len(line_starts))):
+                next_line = self._line_at(text, line_starts, j).strip()
+                if not next_line:
+                    continue
+                
+                # Stop if we hit obvious section breaks
+                if (SECTION_HEADERS_REGEX.search(next_line.lower()) or
+                    (next_line.endswith(':') and len(next_line) < 50) or  # Likely header
+                    (next_line[0].isupper() and ':' in next_line and len(next_line) < 60)):  # New section
+                    break
+                
+                content_lines.append(next_line)
+                
+                # Stop if content is getting too long
+                total_length += len(next_line)
+                if total_length > 300:  # More reasonable limit
+                    break
             
-            # Patterns for combined title+content cases
-            r"late submissions.*?no assignment will be accepted",
-            r"late work.*?no.*?(?:assignment|work).*?(?:accepted|allowed)",
-            r"you will receive.*?(?:grade of 0|zero).*?for.*?(?:quiz|exam).*?(?:miss|late)",
-            r"you will receive a grade of 0 for any (?:quiz|exam|assignment) that you miss",  # Very specific pattern
-            r"late submissions.*?no assignment will be accepted after.*?deadline.*?grade",  # Combined title+content pattern
-        ]
-
-        lines = text.split('\n')
-        
-        # Search for content patterns
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
+            # Create focused content
+            if content_lines:
+                content = ' '.join(content_lines)
+                # Clean up extra whitespace
+                content = re.sub(r'\s+', ' ', content).strip()
+                
+                # More reasonable length limits
+                if 20 < len(content) <= 350:  # Between 20-350 characters
+                    return True, content
             
-            # Check if this line matches any content pattern
-            for pattern in content_patterns:
-                if re.search(pattern, line_lower, re.IGNORECASE | re.DOTALL):
-                    # Found a content pattern, extract surrounding context
-                    
-                    # Balanced content extraction - focused but not too restrictive
-                    content_lines = []
-                    
-                    # Start with the current line that matched the pattern
-                    current_line = line.strip()
-                    if current_line:
-                        content_lines.append(current_line)
-                    
-                    # Add up to 2 additional lines if they continue the policy
-                    for j in range(i + 1, min(i + 3, len(lines))):
-                        if j < len(lines):
-                            next_line = lines[j].strip()
-                            if not next_line:
-                                continue
-                            
-                            # Stop if we hit obvious section breaks
-                            if (any(section in next_line.lower() for section in SECTION_HEADERS) or
-                                (next_line.endswith(':') and len(next_line) < 50) or  # Likely header
-                                (next_line[0].isupper() and ':' in next_line and len(next_line) < 60)):  # New section
-                                break
-                            
-                            content_lines.append(next_line)
-                            
-                            # Stop if content is getting too long
-                            total_length = sum(len(cl) for cl in content_lines)
-                            if total_length > 300:  # More reasonable limit
-                                break
-                    
-                    # Create focused content
-                    if content_lines:
-                        content = ' '.join(content_lines)
-                        # Clean up extra whitespace
-                        content = re.sub(r'\s+', ' ', content).strip()
-                        
-                        # More reasonable length limits
-                        if 20 < len(content) <= 350:  # Between 20-350 characters
-                            return True, content
+            # Resume the scan at the start of the next line
+            next_pos = haystack.find(newline, match.start())
+            if next_pos == -1:
+                break
+            i += 1
+            line_pos = next_pos + 1
         
         # Also check for multi-line patterns that span across lines
-        full_text_lower = text.lower()
-        
-        # Multi-line patterns - more conservative
-        multiline_patterns = [
-            r"late work is anything submitted after.*?(?:unless you have received|zero will be given|will not be accepted)",
-            r"(?:10|ten)%.*?per day.*?for.*?(?:work submitted late|late work).*?(?:up to|for up to)",
-            r"late work is.*?(?:submitted|turned in|handed in).*?after.*?(?:due|deadline).*?(?:penalty|deduction|lose)",
-            r"(?:penalty|deduction).*?\d+.*?(?:percent|%).*?per day.*?(?:late|tardy)",
-        ]
+        if not MULTILINE_REGEX.search(text_lower):
+            return False, ""
         
-        for pattern in multiline_patterns:
-            match = re.search(pattern, full_text_lower, re.IGNORECASE | re.DOTALL)
+        for pattern in MULTILINE_REGEXES:
+            match = pattern.search(text_lower)
             if match:
                 # Extract just the matched content with minimal padding
                 start_pos = max(0, match.start() - 20)  # Much less padding
@@ -8,15 +8,158 @@ contains three sub-detectors: LocationDetector and HoursDetector and PhoneDetect
 
 import re
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+import functools
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
+# Optional linear-time regex engine for the patterns it supports
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 # Detection Configuration Constants
 DEFAULT_LOCATION_SEARCH_LIMIT = 5000
 DEFAULT_HOURS_SEARCH_LIMIT = 8000  # Increased to catch office hours further in document
 DEFAULT_PHONE_SEARCH_LIMIT = 2000
 OFFICE_CONTEXT_SEARCH_LIMIT = 2000
 
+# On ASCII text RE2 agrees with re except for \s, which in re also matches these
+_RE2_MISMATCHED_WHITESPACE = re.compile(r'[\x0b\x1c-\x1f]')
+_UNICODE_ESCAPE = re.compile(r'\\u([0-9a-fA-F]{4})')
+# Dash variants (and the replacement character PDFs leave for them) read as a hyphen
+_DASH_VARIANTS = re.compile('[\u2013\u2014\u2015\u2212\ufffd]')
+# The only characters an IGNORECASE letter matches that str.lower() does not map to it
+_LOWER_MISMATCHED_LETTERS = re.compile('[\u0130\u0131\u017f]')
+# An escape sequence (kept as is) or an uppercase letter (lowered) in a pattern source
+_PATTERN_ESCAPE_OR_UPPER = re.compile(r'\\.|[A-Z]')
+
+
+if RE2_AVAILABLE:
+    # Patterns RE2 rejects (e.g. lookaheads) fall back to re; don't log each one to stderr
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+
+
+def _compile_re2(pattern: re.Pattern):
+    """
+    Compile a pattern with RE2, if it is installed and supports the pattern.
+    Args:
+        pattern (re.Pattern): Pattern compiled with re.
+    Returns:
+        The RE2 pattern, or None when re must be used (e.g. lookaheads).
+    """
+    if not RE2_AVAILABLE:
+        return None
+    flags = ''.join(letter for flag, letter in ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+                    if pattern.flags & flag)
+    # RE2 spells \uXXXX as \x{XXXX}
+    source = _UNICODE_ESCAPE.sub(r'\\x{\1}', pattern.pattern)
+    try:
+        return re2.compile(f'(?{flags}){source}' if flags else source, _RE2_OPTIONS)
+    except re2.error:
+        return None
+
+
+def _fold_pattern(pattern: re.Pattern) -> Optional[re.Pattern]:
+    """
+    Compile a case-sensitive, lowercase copy of an IGNORECASE pattern.
+    On text lowered by _lower_for_anchors it matches exactly where the original
+    matches the text, and without IGNORECASE re can skip ahead on literal prefixes.
+    Args:
+        pattern (re.Pattern): Pattern compiled with re.
+    Returns:
+        Optional[re.Pattern]: The folded pattern, or None if the pattern is not an
+        ASCII IGNORECASE pattern.
+    """
+    if not pattern.flags & re.IGNORECASE or not pattern.pattern.isascii():
+        return None
+    source = _PATTERN_ESCAPE_OR_UPPER.sub(lambda m: m.group(0).lower() if len(m.group(0)) == 1 else m.group(0),
+                                          pattern.pattern)
+    return re.compile(source, pattern.flags & ~re.IGNORECASE)
+
+
+def _iter_matches(pattern, haystack: str, text: str) -> Iterator[str]:
+    """
+    Yield the first capture group of each match of pattern in haystack (the whole
+    match if it has no groups, '' if the group did not take part), sliced from text.
+    haystack is text itself or its lowered copy of the same length, so captures
+    keep the original case.
+    Args:
+        pattern: Compiled pattern to run.
+        haystack (str): Text the pattern searches.
+        text (str): Text the results are sliced from.
+    Returns:
+        Iterator[str]: One string per match.
+    """
+    group = 1 if pattern.groups else 0
+    for match in pattern.finditer(haystack):
+        start, end = match.span(group)
+        yield text[start:end] if start >= 0 else ''
+
+
+def _lower_for_anchors(text: str) -> Optional[str]:
+    """
+    Lowercase text for anchor substring checks and folded patterns.
+    Args:
+        text (str): Text the IGNORECASE patterns will search.
+    Returns:
+        Optional[str]: text.lower(), or None when substring checks or folded
+        patterns on it could miss text an IGNORECASE pattern matches.
+    """
+    if _LOWER_MISMATCHED_LETTERS.search(text):
+        return None
+    return text.lower()
+
+
+def _re2_compatible(text: str) -> bool:
+    """Whether RE2 patterns find exactly what the re patterns would in text."""
+    return text.isascii() and not _RE2_MISMATCHED_WHITESPACE.search(text)
+
+
+# Per-room pattern templates used by LocationDetector; {room} is the escaped room number
+_ROOM_FORMAT_TEMPLATES = (
+    r'\bP{room}\b',                                                   # "P529"
+    r'Pand[o]?ra\s*,?\s*(?:Rm\.?|Room)\s*{room}\b',                      # "Pandora Room 529"
+    r'(Pand[o]?ra)\s*(?:Building)?\s*,?\s*(?:Rm\.?|Room|Lab)\s*{room}\b',  # building name
+)
+_ROOM_REFERENCE = r'(?:Room|Rm\.?)\s*{room}'
+_CLASSROOM_TEMPLATE = r'{indicator}.{{0,100}}' + _ROOM_REFERENCE
+# Office-context templates with the lowercase anchors one of which a match contains.
+# The gap is bounded to one line of up to 200 characters; an unbounded [^{}]* ran
+# to the end of the text and backtracked from every "Office" mention.
+_CONTEXT_GAP = r'[^\n{{}}]{{0,200}}'
+_OFFICE_CONTEXT_TEMPLATES = (
+    (r'Office' + _CONTEXT_GAP + _ROOM_REFERENCE, ('office',)),           # "Office ... Room 529"
+    (r'Instructor' + _CONTEXT_GAP + _ROOM_REFERENCE, ('instructor',)),   # "Instructor ... Room 529"
+    (r'Professor' + _CONTEXT_GAP + _ROOM_REFERENCE, ('professor',)),     # "Professor ... Room 529"
+    (_ROOM_REFERENCE + _CONTEXT_GAP + r'(?:Phone|Email|Hours)', ('phone', 'email', 'hours')),  # "Room 529 ... Phone:"
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _room_format_patterns(room: str) -> Tuple[re.Pattern, ...]:
+    """Compiled P###, "Pandora Room ###" and building-name patterns for a room."""
+    escaped = re.escape(room)
+    return tuple(re.compile(template.format(room=escaped), re.IGNORECASE)
+                 for template in _ROOM_FORMAT_TEMPLATES)
+
+
+@functools.lru_cache(maxsize=128)
+def _office_context_patterns(room: str) -> Tuple[Tuple[re.Pattern, Tuple[str, ...]], ...]:
+    """Compiled patterns (with their anchors) placing a room next to office/instructor context."""
+    escaped = re.escape(room)
+    return tuple((re.compile(template.format(room=escaped), re.IGNORECASE), anchors)
+                 for template, anchors in _OFFICE_CONTEXT_TEMPLATES)
+
+
+@functools.lru_cache(maxsize=128)
+def _classroom_pattern(indicator: str, room: str) -> re.Pattern:
+    """Compiled pattern for a classroom indicator followed by a room."""
+    return re.compile(_CLASSROOM_TEMPLATE.format(indicator=indicator, room=re.escape(room)),
+                      re.IGNORECASE | re.DOTALL)
+
 
 @dataclass
 class DetectionResult:
@@ -39,6 +182,10 @@ class BaseDetector:
 
     """
 
+    # Whether the first processed match is the one detect reports, so that
+    # detection can stop there when all_matches is not needed
+    FIRST_MATCH_IS_BEST = True
+
     def __init__(self, field_name: str, search_limit: int = 5000):
         """
         Initialize the base detector.
@@ -49,7 +196,34 @@ class BaseDetector:
         self.field_name = field_name
         self.search_limit = search_limit
         self.logger = logging.getLogger(f'detector.{field_name}')
-        self.patterns = self._init_patterns()
+        # Patterns are compiled once per detector class and shared by its instances
+        compiled = type(self).__dict__.get('_compiled_patterns')
+        if compiled is None:
+            compiled = self._compile_patterns()
+            type(self)._compiled_patterns = compiled
+        (self.patterns, self.re2_patterns, self.folded_patterns,
+         self.pattern_anchors, self.anchor_literals) = compiled
+
+    def _compile_patterns(self) -> Tuple[tuple, ...]:
+        """
+        Build the detection patterns and the forms derived from them.
+        Returns:
+            Tuple[tuple, ...]: Patterns, their RE2 and folded versions, their anchors,
+            and every anchor literal.
+        """
+        patterns = tuple(self._init_patterns())
+        # RE2 versions of the patterns it can compile, used on text where both agree
+        re2_patterns = tuple(_compile_re2(pattern) for pattern in patterns)
+        # Lowercase case-sensitive versions of the patterns, run on lowered text
+        folded_patterns = tuple(_fold_pattern(pattern) for pattern in patterns)
+        # Lowercase literals a pattern cannot match without (any one of them);
+        # an empty tuple means the pattern always runs
+        anchors = self._init_anchors()
+        pattern_anchors = tuple(anchors) if anchors is not None else ((),) * len(patterns)
+        if len(pattern_anchors) != len(patterns):
+            raise ValueError(f"{self.field_name}: expected {len(patterns)} pattern anchors, got {len(pattern_anchors)}")
+        anchor_literals = tuple(sorted({anchor for anchors in pattern_anchors for anchor in anchors}))
+        return patterns, re2_patterns, folded_patterns, pattern_anchors, anchor_literals
 
     def _init_patterns(self) -> List[re.Pattern]:
         """
@@ -59,16 +233,30 @@ class BaseDetector:
         """
         raise NotImplementedError
 
-    def detect(self, text: str) -> DetectionResult:
+    def _init_anchors(self) -> Optional[List[Tuple[str, ...]]]:
+        """
+        Anchor literals for each pattern, in the same order as the patterns.
+        Returns:
+            Optional[List[Tuple[str, ...]]]: Lowercase literals, one of which every match
+            contains, or None to always run every pattern.
+        """
+        return None
+
+    def detect(self, text: str, collect_all: bool = True) -> DetectionResult:
         """
         Detect the field in the given text.
         Args:
             text (str): The syllabus text to search.
+            collect_all (bool): Gather every valid match into all_matches. When False,
+                stop at the first valid match; content is the same either way.
         Returns:
             DetectionResult: The result of the detection.
         """
         # Limit search to first N characters for performance
         search_text = text[:self.search_limit] if len(text) > self.search_limit else text
+        if not collect_all and self.FIRST_MATCH_IS_BEST:
+            return self._detect_first(search_text, text)
+
         matches = self._find_all_matches(search_text)
 
         if matches:
@@ -83,28 +271,79 @@ class BaseDetector:
 
         return DetectionResult()  # No matches found
 
-    def _find_all_matches(self, text: str) -> List[Any]:
+    def _detect_first(self, search_text: str, text: str) -> DetectionResult:
+        """
+        Detect the field from the first raw match that survives processing.
+        Args:
+            search_text (str): Text to search.
+            text (str): Full syllabus text for context.
+        Returns:
+            DetectionResult: The result, with only that match in all_matches.
+        """
+        for _, pattern, haystack in self._active_patterns(search_text):
+            for raw in _iter_matches(pattern, haystack, search_text):
+                processed = self._process_matches([raw], text)
+                if processed:
+                    return DetectionResult(found=True, content=processed[0], all_matches=processed)
+
+        return DetectionResult()  # No matches found
+
+    def _active_patterns(self, text: str) -> Iterator[Tuple[int, Any, str]]:
+        """
+        Yield, in order, the patterns that can match text, each with the text to run
+        it on: the RE2 version on text where usable, else the folded version on the
+        lowered text where exact, else the pattern itself on text.
+        Args:
+            text (str): Text to search
+        Returns:
+            Iterator[Tuple[int, Any, str]]: Pattern index, compiled pattern and haystack
+        """
+        use_re2 = RE2_AVAILABLE and _re2_compatible(text)
+        # Find which anchors occur once, then skip patterns none of whose anchors do.
+        # Substring checks on the lowered text agree with IGNORECASE unless the text
+        # has one of the few letters lower() maps differently, in which case all run.
+        present = None
+        text_lower = _lower_for_anchors(text)
+        if text_lower is not None:
+            present = {anchor for anchor in self.anchor_literals if anchor in text_lower}
+        for i, (pattern, re2_pattern, folded_pattern, anchors) in enumerate(
+                zip(self.patterns, self.re2_patterns, self.folded_patterns, self.pattern_anchors)):
+            if anchors and present is not None and present.isdisjoint(anchors):
+                continue
+            if use_re2 and re2_pattern is not None:
+                yield i, re2_pattern, text
+            elif text_lower is not None and folded_pattern is not None:
+                yield i, folded_pattern, text_lower
+            else:
+                yield i, pattern, text
+
+    def _find_all_matches(self, text: str) -> List[str]:
         """
         Apply all regex patterns to find matches.
-        Returns list that may contain strings or tuples depending on regex capture groups.
+        Each match contributes its first capture group, or the whole match for
+        patterns without groups.
         Args:
             text (str): Text to search
         Returns:
-            List[Any]: List of all raw matches found
+            List[str]: List of all raw matches found
         """
         all_matches = []
-        for i, pattern in enumerate(self.patterns):
-            matches = pattern.findall(text)
+        for i, pattern, haystack in self._active_patterns(text):
+            if haystack is text and pattern.groups <= 1:
+                # findall already returns one string per match here
+                matches = pattern.findall(text)
+            else:
+                matches = list(_iter_matches(pattern, haystack, text))
             if matches:
                 self.logger.debug(f"Pattern {i+1} found: {matches}")
                 all_matches.extend(matches)
         return all_matches
 
-    def _process_matches(self, matches: List, text: str) -> List[str]:
+    def _process_matches(self, matches: List[str], text: str) -> List[str]:
         """
         Process and validate raw matches.
         Args:
-            matches (List): Raw regex matches.
+            matches (List[str]): Raw regex matches.
             text (str): Full syllabus text for context.
         Returns:
             List[str]: Processed, valid field strings.
@@ -117,6 +356,18 @@ class LocationDetector(BaseDetector):
     Detector for office location information.
     """
 
+    # Lowercase anchors one of which a classroom indicator's match contains;
+    # indicators without an entry always run
+    CLASSROOM_INDICATOR_ANCHORS = {
+        r'Class\s*Meeting': ('meeting',),
+        r'Lab\s*Meeting': ('meeting',),
+        r'Time\s*and\s*Location.*room': ('location',),
+    }
+
+    # Room number format: digits optionally followed by a letter (e.g., "529", "105A")
+    _ROOM_NUMBER_RE = re.compile(r'^\d+[A-Z]?$')
+    _PANDRA_RE = re.compile(r'Pandra', re.IGNORECASE)
+
     def __init__(self):
         """Initialize location detector with DEFAULT_LOCATION_SEARCH_LIMIT char search limit."""
         super().__init__('location', DEFAULT_LOCATION_SEARCH_LIMIT)
@@ -179,6 +430,27 @@ class LocationDetector(BaseDetector):
         ]
 
         return [re.compile(p, re.IGNORECASE) for p in patterns]
+
+    def _init_anchors(self) -> List[Tuple[str, ...]]:
+        """
+        Anchor literals for the location patterns, one tuple per pattern.
+        Returns:
+            List[Tuple[str, ...]]: Lowercase literals, one of which every match contains.
+        """
+        pandora = ('pandora', 'pandra')
+        return [
+            ('room',),                                  # Pattern 1
+            ('room',),                                  # Pattern 2
+            ('office:',),                               # Pattern 2a
+            pandora,                                    # Pattern 3
+            ('room',),                                  # Pattern 4
+            ('room',),                                  # Pattern 5
+            ('(office:',),                              # Pattern 6
+            pandora,                                    # Pattern 7
+            ('office', 'contact'),                      # Pattern 8
+            ('room',),                                  # Pattern 9
+            ('instructor', 'professor', 'faculty', 'office'),  # Pattern 10
+        ]
     
     def _process_matches(self, matches: List[str], text: str) -> List[str]:
         """
@@ -191,73 +463,68 @@ class LocationDetector(BaseDetector):
         """
         unique_rooms = []
         seen = set()
+        # Sliced and lowered once for the per-room helpers
+        search_text = text[:DEFAULT_LOCATION_SEARCH_LIMIT]
+        text_lower = _lower_for_anchors(text)
 
         for match in matches:
-            # Handle tuple matches from regex capture groups
-            if isinstance(match, tuple):
-                match = match[0] if match else ''
-
             room = match.strip() if match else ''
 
             # Validate format: digits optionally followed by a letter (e.g., "529", "105A")
-            if room and re.match(r'^\d+[A-Z]?$', room) and room not in seen:
+            if room and self._ROOM_NUMBER_RE.match(room) and room not in seen:
                 # Check if this is actually an office (not a classroom)
-                if self._is_office_context(room, text):
+                if self._is_office_context(room, text, text_lower):
                     # Check how this room appears in the document to match the format
-                    formatted = self._format_room_number(room, text)
+                    formatted = self._format_room_number(room, search_text)
                     unique_rooms.append(formatted)
                     seen.add(room)
 
         return unique_rooms
 
-    def _format_room_number(self, room: str, text: str) -> str:
+    def _format_room_number(self, room: str, search_text: str) -> str:
         """
         Format room number to match how it appears in the document.
         Priority: P### > Pandora Room ### > Room ###
         Args:
             room (str): Room number (e.g., "529")
-            text (str): syllabus text for context.
+            search_text (str): First DEFAULT_LOCATION_SEARCH_LIMIT chars of the syllabus.
         Returns:
             str: Formatted room string.
         """
-        search_text = text[:DEFAULT_LOCATION_SEARCH_LIMIT]
+        p_pattern, pandora_pattern, _ = _room_format_patterns(room)
 
         # Check for P### format (shorthand)
-        p_pattern = rf'\bP{re.escape(room)}\b'
-        if re.search(p_pattern, search_text, re.IGNORECASE):
+        if p_pattern.search(search_text):
             return f"P{room}"
 
         # Check for "Pandora Room ###" or "Pandora, Room ###"
-        pandora_pattern = rf'Pand[o]?ra\s*,?\s*(?:Rm\.?|Room)\s*{re.escape(room)}\b'
-        pandora_match = re.search(pandora_pattern, search_text, re.IGNORECASE)
+        pandora_match = pandora_pattern.search(search_text)
         if pandora_match:
             building_name = pandora_match.group(0)
             # Normalize "Pandra" to "Pandora"
             if 'pandra' in building_name.lower():
                 # Extract the full match and replace Pandra with Pandora
-                return re.sub(r'Pandra', 'Pandora', building_name, flags=re.IGNORECASE)
+                return self._PANDRA_RE.sub('Pandora', building_name)
             return building_name
 
         # Default to "Room ###" format
         return f"Room {room}"
 
-    def _extract_building_name(self, room: str, text: str) -> str:
+    def _extract_building_name(self, room: str, search_text: str) -> str:
         """
         Extract building name from text near the room number.
         Returns building name if found, empty string otherwise.
         Args:
             room (str): Room number (e.g., "529")
-            text (str): syllabus text for context.
+            search_text (str): First DEFAULT_LOCATION_SEARCH_LIMIT chars of the syllabus.
         Returns:
             str: Building name if found, else empty string.
         """
         # Search for "Pandora" (or "Pandra" typo) near this room number
-        # Look in first 5000 chars for performance
-        search_text = text[:DEFAULT_LOCATION_SEARCH_LIMIT]
 
         # Pattern: Pandora/Pandra followed by optional "Building", then Room/Rm and the room number
-        building_pattern = rf'(Pand[o]?ra)\s*(?:Building)?\s*,?\s*(?:Rm\.?|Room|Lab)\s*{re.escape(room)}\b'
-        building_match = re.search(building_pattern, search_text, re.IGNORECASE)
+        building_pattern = _room_format_patterns(room)[2]
+        building_match = building_pattern.search(search_text)
 
         if building_match:
             # Return the building name (e.g., "Pandora")
@@ -265,35 +532,35 @@ class LocationDetector(BaseDetector):
 
         return ""
 
-    def _is_office_context(self, room: str, text: str) -> bool:
+    def _is_office_context(self, room: str, text: str, text_lower: Optional[str]) -> bool:
         """
         Check if room number is in office context (not classroom).
         Args:
             room (str): Room number (e.g., "529")
             text (str): syllabus text for context.
+            text_lower (Optional[str]): _lower_for_anchors(text); patterns none of whose
+                anchors occur in it are skipped.
         Returns:
             bool: True if room is in office context, False if likely a classroom.
         """
-        room_pattern = rf'(?:Room|Rm\.?)\s*{re.escape(room)}'
 
         # REJECT: Check if it's a classroom
         for indicator in self.classroom_indicators:
-            pattern = rf'{indicator}.{{0,100}}{room_pattern}'
-            if re.search(pattern, text, re.IGNORECASE | re.DOTALL):
+            anchors = self.CLASSROOM_INDICATOR_ANCHORS.get(indicator, ())
+            if text_lower is not None and anchors and not any(anchor in text_lower for anchor in anchors):
+                continue
+            if _classroom_pattern(indicator, room).search(text):
                 self.logger.debug(f"Room {room} appears to be classroom")
                 return False
 
         # ACCEPT: Check if it's in office context
-        office_patterns = [
-            rf'Office[^{{}}]*{room_pattern}',           # "Office ... Room 529"
-            rf'Instructor[^{{}}]*{room_pattern}',        # "Instructor ... Room 529"
-            rf'Professor[^{{}}]*{room_pattern}',         # "Professor ... Room 529"
-            rf'{room_pattern}[^{{}}]*(?:Phone|Email|Hours)'  # "Room 529 ... Phone:"
-        ]
-
-        for pattern in office_patterns:
-            # Check first OFFICE_CONTEXT_SEARCH_LIMIT chars for performance
-            if re.search(pattern, text[:OFFICE_CONTEXT_SEARCH_LIMIT], re.IGNORECASE | re.DOTALL):
+        # Check first OFFICE_CONTEXT_SEARCH_LIMIT chars for performance
+        context_text = text[:OFFICE_CONTEXT_SEARCH_LIMIT]
+        context_lower = text_lower[:OFFICE_CONTEXT_SEARCH_LIMIT] if text_lower is not None else None
+        for pattern, anchors in _office_context_patterns(room):
+            if context_lower is not None and not any(anchor in context_lower for anchor in anchors):
+                continue
+            if pattern.search(context_text):
                 return True
 
         return True  # Default to office if context unclear
@@ -306,15 +573,15 @@ class HoursDetector(BaseDetector):
 
     # Phrases that indicate false positives (not actual office hours)
     # Made more specific to avoid blocking valid office hours text
-    INVALID_PHRASES = [
+    INVALID_PHRASES = (
         'to discuss ideas', 'questions about the material', 'meeting agenda',
         'click here for', 'assignment submission', 'to join the meeting',
         'feel free to contact me about', 'hours of free individual tutoring',
         'tutoring appointment and access'
-    ]
+    )
 
     # Patterns that indicate valid office hours content
-    VALID_INDICATORS = [
+    VALID_INDICATORS = (
         r'\d{1,2}:\d{2}',  # Time like "4:00"
         r'\d{1,2}\s*[ap]\.?m',  # Time like "4pm" or "4 p.m."
         r'monday|tuesday|wednesday|thursday|friday',  # Day names
@@ -343,7 +610,91 @@ class HoursDetector(BaseDetector):
         r'outside\s+(?:my\s+)?office',  # "Outside my office"
         r'private\s+(?:zoom|teams)',  # "Private Zoom/Teams sessions"
         r'from\s+a\s+link',  # "from a link"
-    ]
+    )
+
+    # Patterns that indicate class meeting times, not office hours
+    CLASS_TIME_INDICATORS = (
+        r'class\s+(?:meets|meeting|schedule|time)',
+        r'lecture\s+(?:meets|time|schedule)',
+        r'course\s+(?:meets|meeting|schedule)',
+        r'session\s+time',
+        r'class\s+(?:is\s+)?held',
+    )
+
+    # Each list as one alternation, so validation is a single search per list
+    _INVALID_PHRASE_RE = re.compile('|'.join(re.escape(phrase) for phrase in INVALID_PHRASES))
+    _CLASS_TIME_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in CLASS_TIME_INDICATORS))
+    _VALID_INDICATOR_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in VALID_INDICATORS), re.IGNORECASE)
+    _VALID_INDICATOR_FOLDED = _fold_pattern(_VALID_INDICATOR_RE)
+    # RE2 versions of the three (each None without RE2), which run the
+    # alternations as a single DFA pass on candidates where both engines agree
+    _VALIDATION_RE2 = tuple(_compile_re2(pattern) for pattern in (_INVALID_PHRASE_RE, _CLASS_TIME_RE, _VALID_INDICATOR_RE))
+
+    # The reported hours are picked from all valid matches by _select_best_hours
+    FIRST_MATCH_IS_BEST = False
+
+    # Cleaners for matched hours text, compiled once
+    _INLINE_WHITESPACE_RE = re.compile(r'[^\S\n]+')
+    _SEMICOLON_NEWLINE_RE = re.compile(r';\s*\n\s*')
+    _SEMICOLON_SPACE_RE = re.compile(r';\s+')
+    _SECTION_RE = re.compile(r'^Section\s+[A-Z]\d+:', re.IGNORECASE)
+    _DAY_SEGMENT_RE = re.compile(r'(?:Monday|Tuesday|Wednesday|Thursday|Friday)\s*[-:]\s*\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}',
+                                 re.IGNORECASE)
+    _NON_WORD_RE = re.compile(r'[^\w\d]+')
+    # Weekday names as capitalized or lowercase (the multi-day check) and in
+    # lowercased text (the ranking); most strings reaching them contain one
+    _WEEKDAY_NAME_RE = re.compile(r'[Mm]onday|[Tt]uesday|[Ww]ednesday|[Tt]hursday|[Ff]riday')
+    _WEEKDAY_RE = re.compile(r'monday|tuesday|wednesday|thursday|friday')
+    _ROOM_RES = (
+        re.compile(r',?\s*(?:Pandora|P)\s*\d+[A-Z]?\b', re.IGNORECASE),
+        re.compile(r',?\s*Room\s*\d+[A-Z]?', re.IGNORECASE),
+        re.compile(r',?\s*Rm\.?\s*\d+[A-Z]?', re.IGNORECASE),
+    )
+    _ANY_ROOM_RE = re.compile('|'.join(f'(?:{room_re.pattern})' for room_re in _ROOM_RES), re.IGNORECASE)
+    _TRAILING_SENTENCE_RE = re.compile(r'\s*(?:Students are|I am|Please|You may|You are).*$', re.IGNORECASE)
+    _INCOMPLETE_END_RE = re.compile(r'\s+(?:in\s+my|or\s+an|and\s+|to\s+)$', re.IGNORECASE)
+    _ABBREVIATIONS = (
+        (re.compile(r'by\s+appt\.?', re.IGNORECASE), 'by appointment'),
+        (re.compile(r'&\s+by\s+appt\.?', re.IGNORECASE), '& by appointment'),
+        (re.compile(r'\bappt\.?\b', re.IGNORECASE), 'appointment'),
+        (re.compile(r'\bin\s+adv\b', re.IGNORECASE), 'in advance'),
+    )
+    _ANY_ABBREVIATION_RE = re.compile('|'.join(f'(?:{abbreviation_re.pattern})' for abbreviation_re, _ in _ABBREVIATIONS),
+                                      re.IGNORECASE)
+
+    # Day and time checks used to rank valid hours, compiled once
+    _DAY_RANGE_RE = re.compile(r'(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s*[-–]\s*'
+                               r'(monday|tuesday|wednesday|thursday|friday|saturday|sunday)', re.IGNORECASE)
+    _AMPM_TIME_RE = re.compile(r'\d{1,2}\s*[ap]m', re.IGNORECASE)
+    _CLOCK_TIME_RE = re.compile(r'\d{1,2}:\d{2}')
+    _DAY_RE = re.compile(r'[MTWRF]|Monday|Tuesday|Wednesday|Thursday|Friday', re.IGNORECASE)
+    _GENERIC_LINK_RE = re.compile(r'see\s+.*\s+from\s+a\s+link', re.IGNORECASE)
+
+    # Phrases (lowercase) marking matches that only need light cleaning, in priority
+    # order, with whether the match is kept as is or just has whitespace collapsed
+    _LIGHT_CLEANING_STYLES = (
+        ('calendly.com', 'preserve'),              # URL pattern - no cleaning
+        ('canvas inbox', 'preserve'),              # Canvas Inbox tool
+        ('by arrangement', 'collapse'),            # "By Arrangement"
+        ('please contact', 'collapse'),            # "Please contact" style
+        ('after-class', 'collapse'),               # After-class help session
+        ('help session', 'collapse'),
+        ('see schedule', 'preserve'),              # "See schedule on Canvas"
+        ('meetings by appointment', 'collapse'),   # "Meetings by Appointment"
+        ('to be determined', 'collapse'),          # "To be determined"
+        ('after lecture', 'collapse'),             # "After lecture"
+        ('as posted', 'collapse'),                 # "As posted outside my office"
+        ('from a link', 'collapse'),               # "from a link"
+    )
+
+    # TBD patterns - highest priority; detect returns TBD as soon as one is found,
+    # so they are not among the detection patterns ("Office hours TBD" is covered
+    # by "hours TBD")
+    _TBD_COMPILED = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+        r'Hours?\s*[:]\s*(TBD)',
+        r'hours\s+(TBD)',
+    ))
+    _TBD_FOLDED = tuple(_fold_pattern(pattern) for pattern in _TBD_COMPILED)
 
     def __init__(self):
         """Initialize hours detector with DEFAULT_HOURS_SEARCH_LIMIT char search limit."""
@@ -356,60 +707,59 @@ class HoursDetector(BaseDetector):
         Returns:
             List[re.Pattern]: Compiled regex patterns for hours detection.
         """
+        # Optional leading labels such as "Office Hours:" are left off: findall only
+        # returns the captured text, which is the same whether or not the label was
+        # consumed, and a pattern that starts with its required text lets the regex
+        # engine skip ahead instead of trying the label at every position.
         patterns = [
-            # TBD patterns - highest priority
-            r'(?:Office\s*)?Hours?\s*[:]\s*(TBD)',
-            r'hours\s+(TBD)',
-            r'Office\s+hours\s+(TBD)',
-
             # NEW: Canvas Inbox tool pattern
-            r'(?:To\s+)?schedule\s+(?:in-person\s+or\s+)?Zoom\s+meetings\s+use\s+the\s+(Canvas\s+Inbox\s+tool)',
+            r'schedule\s+(?:in-person\s+or\s+)?Zoom\s+meetings\s+use\s+the\s+(Canvas\s+Inbox\s+tool)',
             # "Make an appointment using MyCourses Canvas Inbox tool"
             r'[Mm]ake\s+an?\s+appointment\s+using\s+(?:the\s+)?(MyCourses\s+Canvas\s+Inbox\s+tool)',
 
-            # NEW: After-class help session patterns (with en-dash support)
-            r'(?:Office\s*Hours?[\s:]+)?([MTWRF][a-z]*,?\s+\d{1,2}(?::\d{2})?\s*[-\u2013]\s*\d{1,2}(?::\d{2})?\s*[ap]m\s+\(after-class\s+help\s+session\))',
-            r'(?:Office\s*Hours?[\s:]+)?(\d{1,2}(?::\d{2})?\s*[ap]m\s*[-\u2013]\s*\d{1,2}(?::\d{2})?\s*[ap]m\s+\(after-class\s+help\s+session\))',
-            # Help session before the time (e.g., "help session, Tuesday, 1-3 pm") - with en-dash
-            r'help\s+session,?\s+([MTWRF][a-z]*,?\s+\d{1,2}(?::\d{2})?\s*[-\u2013]\s*\d{1,2}(?::\d{2})?\s*[ap]m)',
-            # "The after-class help session, Monday, 4 - 6 pm"
-            r'after-class\s+help\s+session,?\s+([MTWRF][a-z]*,?\s+\d{1,2}(?::\d{2})?\s*[-\u2013]\s*\d{1,2}(?::\d{2})?\s*[ap]m)',
+            # NEW: After-class help session patterns
+            r'([MTWRF][a-z]*,?\s+\d{1,2}(?::\d{2})?\s*-\s*\d{1,2}(?::\d{2})?\s*[ap]m\s+\(after-class\s+help\s+session\))',
+            r'(\d{1,2}(?::\d{2})?\s*[ap]m\s*-\s*\d{1,2}(?::\d{2})?\s*[ap]m\s+\(after-class\s+help\s+session\))',
+            # Help session before the time (e.g., "help session, Tuesday, 1-3 pm")
+            # Also covers "The after-class help session, Monday, 4 - 6 pm"
+            r'help\s+session,?\s+([MTWRF][a-z]*,?\s+\d{1,2}(?::\d{2})?\s*-\s*\d{1,2}(?::\d{2})?\s*[ap]m)',
 
             # NEW: Section-specific hours
-            r'(?:Office\s*Hours?[\s:]+)?(Section\s+[A-Z]\d+:\s+After\s+class;\s+By\s+appointment)',
+            r'(Section\s+[A-Z]\d+:\s+After\s+class;\s+By\s+appointment)',
 
             # NEW: Standalone URL pattern (calendly links)
             # Allow newlines/spaces within URL (PDFs sometimes break URLs across lines)
-            r'(?:Office\s*Hours?[\s:]*)?(https?://\s*(?:www\.)?calendly\.com/[a-zA-Z0-9_/-]+)',
+            r'(https?://\s*(?:www\.)?calendly\.com/[a-zA-Z0-9_/-]+)',
 
             # NEW: "See schedule on Canvas" pattern
-            r'(?:Office\s*Hours?[\s:]+)?(See\s+schedule\s+on\s+Canvas(?:;\s+By\s+appointment)?)',
+            r'(See\s+schedule\s+on\s+Canvas(?:;\s+By\s+appointment)?)',
             # "See Instructor office hours from a link"
             # Limit capture and stop at sentence boundaries to avoid capturing unrelated text
-            r'(?:Office\s*Hours?[\s:]+)?(See\s+Instructor\s+office\s+hours\s+from\s+a\s+link[^.!\n]{0,40})',
+            r'(See\s+Instructor\s+office\s+hours\s+from\s+a\s+link[^.!\n]{0,40})',
 
             # NEW: After class pattern (simple)
-            r'(?:Office\s*Hours?[\s:]+)?(After\s+class;\s+By\s+appointment)',
+            r'(After\s+class;\s+By\s+appointment)',
             # "After lecture or private Zoom/Teams sessions"
-            r'(?:Office\s*Hours?[\s:]+)?(After\s+lecture\s+or\s+private\s+(?:Zoom|Teams)[^\n]{0,80})',
+            r'(After\s+lecture\s+or\s+private\s+(?:Zoom|Teams)[^\n]{0,80})',
 
-            # NEW: "Meetings by Appointment" pattern (with en-dash)
-            r'Meetings?\s+by\s+Appointment[\s:�\u2013-]+([^\n]{5,100})',
+            # NEW: "Meetings by Appointment" pattern
+            r'Meetings?\s+by\s+Appointment[\s:-]+([^\n]{5,100})',
 
             # NEW: "available to meet" pattern
-            r'(?:Office\s*Hours?[\s:]+)?([Aa]vailable\s+to\s+meet\s+by\s+appointment[^\n]{0,80})',
+            r'([Aa]vailable\s+to\s+meet\s+by\s+appointment[^\n]{0,80})',
 
             # NEW: "to be determined" pattern
+            # Keeps its label: the capture may itself start with "Office hours"
             r'(?:Office\s*Hours?[\s:]+)?((?:Office\s+hours\s+)?to\s+be\s+determined[^\n]{0,80})',
 
             # NEW: By appointment with day ranges (e.g., "By appointment Sunday - Thursday 7pm - 9pm")
-            r'(?:Office\s*Hours?[\s:]+)?([Bb]y\s+appointment\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s*[-]\s*(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)[^\n]{0,100})',
+            r'([Bb]y\s+appointment\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s*[-]\s*(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)[^\n]{0,100})',
 
             # NEW: Compact time format without am/pm (e.g., "Mondays 1-2, Thursdays 2-4")
-            r'(?:Office\s*Hours?[\s:]+)?([MTWRF][a-z]+s?\s+\d{1,2}\s*[-\u2013]\s*\d{1,2},?\s+[MTWRF][a-z]+s?\s+\d{1,2}\s*[-\u2013]\s*\d{1,2})',
+            r'([MTWRF][a-z]+s?\s+\d{1,2}\s*-\s*\d{1,2},?\s+[MTWRF][a-z]+s?\s+\d{1,2}\s*-\s*\d{1,2})',
 
             # NEW: "As posted outside my office" pattern
-            r'(?:Office\s*Hours?[\s:]+)?(As\s+posted\s+outside\s+my\s+office[^\n]{0,80})',
+            r'(As\s+posted\s+outside\s+my\s+office[^\n]{0,80})',
 
             # Standard patterns
             # Special case: if line contains semicolon, allow newline continuation (up to 250 chars total)
@@ -431,16 +781,16 @@ class HoursDetector(BaseDetector):
             # Captures: "Tuesday - 4:00 - 5:00;Thursday - 3:00 - 5:00;\nFriday - 1:00 - 2:00"
             # Also captures: "Wednesdays 10:30 am - 12:00 pm; alternatively, Zoom and phone appointments..."
             # Allow newlines within semicolon-separated clauses (up to 200 chars after semicolon)
-            r'(?:Office\s*)?Hours?[\s:]+([^;\n]+(?:;[\s\S]{0,200}?)*?)(?=\s*(?:Phone|Email|Course|Office|Instructor|Prerequisites?|Text|$))',
+            r'Hours?[\s:]+([^;\n]+(?:;[\s\S]{0,200}?)*?)(?=\s*(?:Phone|Email|Course|Office|Instructor|Prerequisites?|Text|$))',
 
             # IMPROVEMENT 4a: Pattern for multi-day hours separated by newlines (document_processing extraction)
-            # Matches: "Tuesday - 4:00 � 5:00\nThursday - 3:00 � 5:00\nFriday - 1:00 � 2:00"
+            # Matches: "Tuesday - 4:00 - 5:00\nThursday - 3:00 - 5:00\nFriday - 1:00 - 2:00"
 
-            r'(?:Office\s*)?Hours?[\s:]+\n((Monday|Tuesday|Wednesday|Thursday|Friday)\s*[-:]\s*\d{1,2}:\d{2}\s*[-�\u2013\u2014]\s*\d{1,2}:\d{2}\s*(?:\n(Monday|Tuesday|Wednesday|Thursday|Friday)\s*[-:]\s*\d{1,2}:\d{2}\s*[-�\u2013\u2014]\s*\d{1,2}:\d{2})+)',
+            r'Hours?[\s:]+\n((Monday|Tuesday|Wednesday|Thursday|Friday)\s*[-:]\s*\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}\s*(?:\n(Monday|Tuesday|Wednesday|Thursday|Friday)\s*[-:]\s*\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2})+)',
 
             # IMPROVEMENT 4b: Pattern for multi-day hours separated by spaces (PyPDF2 extraction format)
             # Matches: "Tuesday - 4:00 - 5:00   Thursday - 3:00 - 5:00   Friday - 1:00 - 2:00"
-            r'(?:Office\s*)?Hours?[\s:]+((Monday|Tuesday|Wednesday|Thursday|Friday)\s*[-:]\s*\d{1,2}:\d{2}\s*[-�]\s*\d{1,2}:\d{2}\s*(?:\s+(Monday|Tuesday|Wednesday|Thursday|Friday)\s*[-:]\s*\d{1,2}:\d{2}\s*[-�]\s*\d{1,2}:\d{2})+)',
+            r'Hours?[\s:]+((Monday|Tuesday|Wednesday|Thursday|Friday)\s*[-:]\s*\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}\s*(?:\s+(Monday|Tuesday|Wednesday|Thursday|Friday)\s*[-:]\s*\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2})+)',
 
             # Day-based patterns
             # Increased from 80 to 200 chars to capture full multi-clause hours with semicolons
@@ -454,59 +804,105 @@ class HoursDetector(BaseDetector):
 
             # IMPROVED: By appointment patterns with more variations
             # Increased from 80 to 120 chars to avoid truncation
-            r'(?:Office\s*)?Hours?[\s:]+([Bb]y\s+appointment[^.\n]{0,120})(?=\.|$|\n)',
+            r'Hours?[\s:]+([Bb]y\s+appointment[^.\n]{0,120})(?=\.|$|\n)',
             r'Office\s*hours?\s+are\s+(schedule[d]?\s+by\s+appointment[^\n]{0,50})',
 
             # NEW: By Arrangement pattern (similar to "By appointment")
-            r'(?:Office\s*)?Hours?[\s:]+([Bb]y\s+[Aa]rrangement[^.\n]{0,100})(?=\.|$|\n)',
+            r'Hours?[\s:]+([Bb]y\s+[Aa]rrangement[^.\n]{0,100})(?=\.|$|\n)',
 
             # NEW: "Please contact" style office hours
-            r'(?:Office\s*)?Hours?[\s:]+([Pp]lease\s+contact\s+(?:the\s+)?(?:instructor|professor)[^.\n]{0,100})',
+            r'Hours?[\s:]+([Pp]lease\s+contact\s+(?:the\s+)?(?:instructor|professor)[^.\n]{0,100})',
 
             # IMPROVED: Available/By appointment combined pattern for Karen Jin style
-            r'(?:Office\s*)?Hours?[\s:]+([Bb]y\s+appointment[^;]*;\s*(?:available\s+)?in\s+person\s+or\s+virtual[^\n]*)',
+            r'Hours?[\s:]+([Bb]y\s+appointment[^;]*;\s*(?:available\s+)?in\s+person\s+or\s+virtual[^\n]*)',
 
             # IMPROVEMENT 3: Enhanced Available patterns - capture full context
-            r'(?:Office\s*)?Hours?[\s:]+([Aa]vailable\s+in\s+person\s+or\s+virtually[^\n.]{0,100})',
-            r'(?:Office\s*)?Hours?[\s:]+([Aa]vailable\s+(?:in\s+person|virtually)[^\n]{0,80})',
+            r'Hours?[\s:]+([Aa]vailable\s+in\s+person\s+or\s+virtually[^\n.]{0,100})',
+            r'Hours?[\s:]+([Aa]vailable\s+(?:in\s+person|virtually)[^\n]{0,80})',
 
             # Anytime patterns
             r'OFFICE\s*HOURS?[\s:]+([Aa]nytime\s+by\s+(?:ZOOM|zoom|Zoom)[^\n]{0,80})(?=\.|$|\n)',
 
             # IMPROVED: Monday patterns for NSIA_898 - handles "Mondays 4-5 pm via Zoom"
-            r'(?:Office\s*hours?\s+are\s+)?([Mm]ondays?\s+\d{1,2}(?:[-:]\d{1,2})?\s*[ap]m\s*via\s*Zoom[^\n]{0,50})',
+            r'([Mm]ondays?\s+\d{1,2}(?:[-:]\d{1,2})?\s*[ap]m\s*via\s*Zoom[^\n]{0,50})',
             r'([Mm]ondays?\s+\d{1,2}[-:]\d{1,2}\s*[ap]m[^,\n]*(?:,\s*plus\s+by\s+appointment)?)',
 
             # Day/time specific patterns
-            r'(?:Office\s*)?Hours?[\s:]+(?:on\s+)?([MTWRF][^\n]{5,80}?)(?=\.|$|\n|,\s*Room)',
-            r'(?:Office\s*)?Hours?[\s:]+(\d{1,2}(?::\d{2})?\s*[ap]m[^\n]{0,80}?)(?=\.|$|\n|,\s*Room)',
+            r'Hours?[\s:]+(?:on\s+)?([MTWRF][^\n]{5,80}?)(?=\.|$|\n|,\s*Room)',
+            r'Hours?[\s:]+(\d{1,2}(?::\d{2})?\s*[ap]m[^\n]{0,80}?)(?=\.|$|\n|,\s*Room)',
         ]
         
         return [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in patterns]
+
+    def _init_anchors(self) -> List[Tuple[str, ...]]:
+        """
+        Anchor literals for the hours patterns, one tuple per pattern.
+
+        Returns:
+            List[Tuple[str, ...]]: Lowercase literals, one of which every match contains.
+        """
+        hour = ('hour',)
+        hour_or_hr = ('hour', 'hr')
+        appointment = ('appointment',)
+        return [
+            # Canvas Inbox tool
+            ('canvas',), ('canvas',),
+            # After-class help sessions
+            ('after-class',), ('after-class',), ('help',),
+            # Section-specific hours, calendly, "See schedule", "See Instructor"
+            ('section',), ('calendly.com',), ('canvas',), ('instructor',),
+            # After class / lecture, meetings or available by appointment
+            appointment, ('lecture',), appointment, appointment,
+            # To be determined, by appointment with day ranges
+            ('determined',), appointment,
+            # Compact time format has no fixed text
+            (),
+            # As posted outside my office
+            ('posted',),
+            # Standard, virtual and combined location/hours patterns
+            ('office',), ('office',), ('office',),
+            ('virtual',), ('virtual',),
+            ('location',),
+            # Multi-line semicolon and multi-day patterns
+            hour, hour, hour,
+            # Day-based and time-based patterns
+            hour_or_hr, hour_or_hr, hour_or_hr,
+            # By appointment / arrangement / please contact
+            appointment, appointment, ('arrangement',), ('contact',), appointment,
+            # Available and anytime patterns
+            ('available',), ('available',), ('anytime',),
+            # Monday patterns
+            ('monday',), ('monday',),
+            # Day/time specific patterns
+            hour, hour,
+        ]
     
-    def detect(self, text: str) -> DetectionResult:
+    def detect(self, text: str, collect_all: bool = True) -> DetectionResult:
         """
         Special detection for hours to handle TBD priority.
         
         Args:
             text (str): The syllabus text to search.
+            collect_all (bool): Accepted for BaseDetector compatibility; hours
+                are always ranked across every match.
         Returns:
             DetectionResult: The result of the detection."""
         search_text = text[:self.search_limit] if len(text) > self.search_limit else text
+        # Dashes are normalized once here, so the patterns and the processed
+        # matches only ever see a plain hyphen
+        search_text = _DASH_VARIANTS.sub('-', search_text)
         
-        # Check for TBD first
-        tbd_patterns = [
-            re.compile(r'(?:Office\s*)?Hours?\s*[:]\s*(TBD)', re.IGNORECASE),
-            re.compile(r'hours\s+(TBD)', re.IGNORECASE),
-            re.compile(r'Office\s+hours\s+(TBD)', re.IGNORECASE),
-        ]
-        
-        for pattern in tbd_patterns:
-            if pattern.search(search_text):
-                return DetectionResult(found=True, content='TBD', all_matches=['TBD'])
+        # Check for TBD first (only possible when the text contains "tbd")
+        search_lower = _lower_for_anchors(search_text)
+        if search_lower is None:
+            tbd_found = any(pattern.search(search_text) for pattern in self._TBD_COMPILED)
+        else:
+            tbd_found = 'tbd' in search_lower and any(pattern.search(search_lower) for pattern in self._TBD_FOLDED)
+        if tbd_found:
+            return DetectionResult(found=True, content='TBD', all_matches=['TBD'])
         
         # Continue with normal detection
-        return super().detect(text)
+        return super().detect(search_text)
     
     def _process_matches(self, matches: List[str], text: str) -> List[str]:
         """
@@ -519,127 +915,110 @@ class HoursDetector(BaseDetector):
             List[str]: Processed, valid office hours strings.
         """
         valid_hours = []
+        valid_hours_lower = []
         seen = set()
 
         for match in matches:
-            if isinstance(match, tuple):
-                match = match[0] if match else ''
-
             if match and len(match.strip()) > 2:  # Allow shorter matches (was >3) for URLs, "TBD", etc.
-                # Handle tuple matches from regex groups
-                if isinstance(match, tuple):
-                    # Take the first capturing group (the full match)
-                    original_match = match[0] if match[0] else (match[1] if len(match) > 1 and match[1] else '')
-                else:
-                    original_match = match
-
-                original_match = original_match.strip()
-
-                
-                # All converted to standard hyphen (-) for consistent processing
-                original_match = re.sub(r'[\u2013\u2014\u2015\u2212�]', '-', original_match)
+                original_match = match.strip()
 
                 # Both converted to standardized format:
                 #   "Tuesday - 4:00 - 5:00;Thursday - 3:00 - 5:00;\nFriday - 1:00 - 2:00"
                 #   (semicolons between all days, newline before last day)
 
-                day_pattern = r'(Monday|Tuesday|Wednesday|Thursday|Friday)\s*[-:]\s*\d{1,2}:\d{2}\s*[-]\s*\d{1,2}:\d{2}'
-                day_matches = re.findall(day_pattern, original_match, re.IGNORECASE)
+                # Extract all complete "Day - StartTime - EndTime" segments in one pass
+                segments = self._DAY_SEGMENT_RE.findall(original_match)
 
-                if len(day_matches) >= 2:  # Multiple days found - this is a multi-day schedule
-                    # Extract all complete "Day - StartTime - EndTime" patterns
-                    segments = re.findall(r'((?:Monday|Tuesday|Wednesday|Thursday|Friday)\s*[-:]\s*\d{1,2}:\d{2}\s*[-]\s*\d{1,2}:\d{2})', original_match, re.IGNORECASE)
-                    if len(segments) >= 2:
-                        # Convert to standard format: "Day1;Day2;\nDay3"
-                        # Join all but last with ';', then add ';\n' before last day
-                        first_parts = ';'.join(segments[:-1])
-                        original_match = first_parts + ';\n' + segments[-1]
+                if len(segments) >= 2:  # Multiple days found - this is a multi-day schedule
+                    # Convert to standard format: "Day1;Day2;\nDay3"
+                    # Join all but last with ';', then add ';\n' before last day
+                    first_parts = ';'.join(segments[:-1])
+                    original_match = first_parts + ';\n' + segments[-1]
+
+                # Lowercased once for the style checks below
+                match_lower = original_match.lower()
 
                 # ===================================================================
                 # IMPROVEMENT 3: Whitespace Normalization (Preserving Structure)
                 # ===================================================================
                 # For multi-day schedules with semicolons, normalize whitespace
                 # while carefully preserving newlines that indicate structure
-                if ';' in original_match and any(day in original_match for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday']):
-                    cleaned = original_match
-
-                    # Step 1: Protect newlines from whitespace normalization
-                    # Use placeholder that won't appear in real text
-                    cleaned = cleaned.replace('\n', '<<<NEWLINE>>>')
+                if ';' in original_match and self._WEEKDAY_NAME_RE.search(original_match):
+                    # Step 1: Normalize all whitespace except newlines (multiple spaces → single space)
+                    cleaned = self._INLINE_WHITESPACE_RE.sub(' ', original_match)
 
-                    # Step 2: Normalize all other whitespace (multiple spaces → single space)
-                    cleaned = re.sub(r'\s+', ' ', cleaned)
-
-                    # Step 3: Restore newlines
-                    cleaned = cleaned.replace('<<<NEWLINE>>>', '\n')
-
-                    # Step 4: Clean up spacing around semicolons
+                    # Step 2: Clean up spacing around semicolons
                     # First handle semicolon-newline (protect it)
-                    cleaned = re.sub(r';\s*\n\s*', ';\n', cleaned)
+                    cleaned = self._SEMICOLON_NEWLINE_RE.sub(';\n', cleaned)
 
                     # Then clean up other semicolons (but not semicolon-newline)
                     # Split by ';\n', clean each part, then rejoin
                     parts = cleaned.split(';\n')
-                    cleaned_parts = [re.sub(r';\s+', ';', part) for part in parts]
+                    cleaned_parts = [self._SEMICOLON_SPACE_RE.sub(';', part) for part in parts]
                     cleaned = ';\n'.join(cleaned_parts)
-                elif 'by appointment' in original_match.lower() and ';' in original_match:
+                elif 'by appointment' in match_lower and ';' in original_match:
                     # "By appointment; in person or virtual" style
-                    cleaned = original_match
-                    cleaned = re.sub(r'\s+', ' ', cleaned)
-                elif 'monday' in original_match.lower() and 'zoom' in original_match.lower():
+                    cleaned = ' '.join(original_match.split())
+                elif 'monday' in match_lower and 'zoom' in match_lower:
                     # "Mondays 4-5 pm via Zoom" style - preserve as is
-                    cleaned = re.sub(r'\s+', ' ', original_match)
-                elif 'calendly.com' in original_match.lower():
-                    # URL pattern - preserve as is (no cleaning)
-                    cleaned = original_match.strip()
-                elif 'canvas inbox' in original_match.lower() or 'mycourses canvas inbox' in original_match.lower():
-                    # Canvas Inbox tool - preserve as is
-                    cleaned = original_match.strip()
-                elif 'by arrangement' in original_match.lower():
-                    # "By Arrangement" - minimal cleaning (just whitespace)
-                    cleaned = re.sub(r'\s+', ' ', original_match).strip()
-                elif 'please contact' in original_match.lower():
-                    # "Please contact" style - minimal cleaning
-                    cleaned = re.sub(r'\s+', ' ', original_match).strip()
-                elif 'after-class' in original_match.lower() or 'help session' in original_match.lower():
-                    # After-class help session - minimal cleaning (just whitespace)
-                    cleaned = re.sub(r'\s+', ' ', original_match).strip()
-                elif 'see schedule' in original_match.lower():
-                    # "See schedule on Canvas" - preserve as is
-                    cleaned = original_match.strip()
-                elif re.match(r'^Section\s+[A-Z]\d+:', original_match, re.IGNORECASE):
-                    # Section-specific hours - minimal cleaning
-                    cleaned = re.sub(r'\s+', ' ', original_match).strip()
-                elif 'meetings by appointment' in original_match.lower():
-                    # "Meetings by Appointment" - minimal cleaning
-                    cleaned = re.sub(r'\s+', ' ', original_match).strip()
-                elif 'to be determined' in original_match.lower():
-                    # "To be determined" - minimal cleaning
-                    cleaned = re.sub(r'\s+', ' ', original_match).strip()
-                elif 'after lecture' in original_match.lower():
-                    # "After lecture" - minimal cleaning
-                    cleaned = re.sub(r'\s+', ' ', original_match).strip()
-                elif 'as posted' in original_match.lower():
-                    # "As posted outside my office" - minimal cleaning
-                    cleaned = re.sub(r'\s+', ' ', original_match).strip()
-                elif 'from a link' in original_match.lower():
-                    # "from a link" - minimal cleaning
-                    cleaned = re.sub(r'\s+', ' ', original_match).strip()
+                    cleaned = ' '.join(original_match.split())
                 else:
-                    cleaned = self._clean_hours(original_match)
+                    # Styles that only need light cleaning, else the full _clean_hours
+                    style = self._light_cleaning_style(original_match, match_lower)
+                    if style == 'preserve':
+                        cleaned = original_match.strip()
+                    elif style == 'collapse':
+                        cleaned = ' '.join(original_match.split())
+                    else:
+                        cleaned = self._clean_hours(original_match)
 
                 # Avoid duplicates but consider variations as unique
-                normalized_for_comparison = re.sub(r'[^\w\d]+', '', cleaned.lower())
+                normalized_for_comparison = self._dedup_key(cleaned)
                 if self._is_valid_hours(cleaned) and normalized_for_comparison not in seen:
                     valid_hours.append(cleaned)
+                    valid_hours_lower.append(cleaned.lower())
                     seen.add(normalized_for_comparison)
 
         if valid_hours:
-            return [self._select_best_hours(valid_hours)]
+            return [self._select_best_hours(valid_hours, valid_hours_lower)]
 
         return []
     
-    def _clean_hours(self, hours: str) -> str:
+    def _light_cleaning_style(self, match: str, match_lower: str) -> Optional[str]:
+        """
+        Find how lightly a match should be cleaned.
+        Args:
+            match (str): Office hours match.
+            match_lower (str): The match lowercased.
+        Returns:
+            Optional[str]: 'preserve' or 'collapse', or None for full cleaning.
+        """
+        for phrase, style in self._LIGHT_CLEANING_STYLES:
+            if phrase in match_lower:
+                return style
+        # Section-specific hours - every phrase that outranks them is checked above,
+        # and the ones they outrank share their style
+        if self._SECTION_RE.match(match):
+            return 'collapse'
+        return None
+
+    # These only read class constants and the same fragments recur within and
+    # across syllabi, so results are cached per detector class and input
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _dedup_key(cls, hours: str) -> str:
+        """
+        Key under which cleaned office hours count as duplicates.
+        Args:
+            hours (str): Cleaned office hours text.
+        Returns:
+            str: The text lowercased, without non-word characters.
+        """
+        return cls._NON_WORD_RE.sub('', hours.lower())
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _clean_hours(cls, hours: str) -> str:
         """
         Clean office hours text.
         Args:
@@ -647,41 +1026,39 @@ class HoursDetector(BaseDetector):
         Returns:
             str: Cleaned office hours text.
         """
-        # IMPROVEMENT 1: Normalize various dash characters (en-dash, em-dash, hyphen)
-        # Replace en-dash (–), em-dash (—), and other dash variants with standard hyphen
-        hours = re.sub(r'[\u2013\u2014\u2015\u2212]', '-', hours)
+        # Dash variants were already replaced with "-" on the search window in detect
 
         # Normalize whitespace
         hours = ' '.join(hours.split())
 
-        # IMPROVED: More comprehensive room information removal (including building names)
-        hours = re.sub(r',?\s*(?:Pandora|P)\s*\d+[A-Z]?\b', '', hours, flags=re.IGNORECASE)
-        hours = re.sub(r',?\s*Room\s*\d+[A-Z]?', '', hours, flags=re.IGNORECASE)
-        hours = re.sub(r',?\s*Rm\.?\s*\d+[A-Z]?', '', hours, flags=re.IGNORECASE)
+        # IMPROVED: More comprehensive room information removal (including building names).
+        # Each removal runs in turn (one may expose a match for the next), so the
+        # combined alternation only gates whether any of them applies.
+        if cls._ANY_ROOM_RE.search(hours):
+            for room_re in cls._ROOM_RES:
+                hours = room_re.sub('', hours)
 
         # Remove trailing punctuation
         hours = hours.rstrip('.,;,')
 
         # Remove common suffixes and incomplete sentences
-        hours = re.sub(r'\s*(?:Students are|I am|Please|You may|You are).*$', '', hours, flags=re.IGNORECASE)
+        hours = cls._TRAILING_SENTENCE_RE.sub('', hours)
 
         # IMPROVED: Remove incomplete sentence fragments at the end
         # If it ends with " in my" or " or an" or similar incomplete phrases, remove them
-        hours = re.sub(r'\s+(?:in\s+my|or\s+an|and\s+|to\s+)$', '', hours, flags=re.IGNORECASE)
+        hours = cls._INCOMPLETE_END_RE.sub('', hours)
 
-        # Standardize appointment text
-        hours = re.sub(r'by\s+appt\.?', 'by appointment', hours, flags=re.IGNORECASE)
-        hours = re.sub(r'&\s+by\s+appt\.?', '& by appointment', hours, flags=re.IGNORECASE)
-
-        # Standardize "appt." to "appointment" in other contexts
-        hours = re.sub(r'\bappt\.?\b', 'appointment', hours, flags=re.IGNORECASE)
-
-        # IMPROVED: Standardize "in advance" vs "in adv"
-        hours = re.sub(r'\bin\s+adv\b', 'in advance', hours, flags=re.IGNORECASE)
+        # Standardize appointment text ("by appt.", "& by appt.", then "appt." in other
+        # contexts) and "in adv" to "in advance"; gated the same way as the rooms
+        if cls._ANY_ABBREVIATION_RE.search(hours):
+            for abbreviation_re, replacement in cls._ABBREVIATIONS:
+                hours = abbreviation_re.sub(replacement, hours)
 
         return hours.strip()
     
-    def _is_valid_hours(self, text: str) -> bool:
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _is_valid_hours(cls, text: str) -> bool:
         """
         Check if text is likely valid office hours.
         Args:
@@ -694,30 +1071,31 @@ class HoursDetector(BaseDetector):
 
         text_lower = text.lower()
 
+        if None not in cls._VALIDATION_RE2 and _re2_compatible(text):
+            invalid_phrase_re2, class_time_re2, valid_indicator_re2 = cls._VALIDATION_RE2
+            return not invalid_phrase_re2.search(text_lower) and not class_time_re2.search(text_lower) \
+                and bool(valid_indicator_re2.search(text))
+
         # Reject invalid phrases
-        if any(phrase in text_lower for phrase in self.INVALID_PHRASES):
+        if cls._INVALID_PHRASE_RE.search(text_lower):
             return False
 
         # Reject class/lecture times (not office hours)
-        # These patterns indicate class meeting times, not office hours
-        class_time_indicators = [
-            r'class\s+(?:meets|meeting|schedule|time)',
-            r'lecture\s+(?:meets|time|schedule)',
-            r'course\s+(?:meets|meeting|schedule)',
-            r'session\s+time',
-            r'class\s+(?:is\s+)?held',
-        ]
-        if any(re.search(pattern, text_lower) for pattern in class_time_indicators):
+        if cls._CLASS_TIME_RE.search(text_lower):
             return False
 
-        # Accept valid indicators
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in self.VALID_INDICATORS)
+        # Accept valid indicators, searched case-sensitively on the lowered text
+        # unless it has a letter lower() maps differently from IGNORECASE
+        if not _LOWER_MISMATCHED_LETTERS.search(text):
+            return bool(cls._VALID_INDICATOR_FOLDED.search(text_lower))
+        return bool(cls._VALID_INDICATOR_RE.search(text))
     
-    def _select_best_hours(self, hours_list: List[str]) -> str:
+    def _select_best_hours(self, hours_list: List[str], hours_lower: Optional[List[str]] = None) -> str:
         """
         Select the most descriptive office hours.
         Args:
             hours_list (List[str]): List of valid office hours strings.
+            hours_lower (Optional[List[str]]): The same strings lowercased, if already computed.
         Returns:
             str: The most descriptive office hours string.
         """
@@ -727,64 +1105,82 @@ class HoursDetector(BaseDetector):
         # Debug: look at what we have
         self.logger.debug(f"Selecting from hours options: {hours_list}")
 
+        if hours_lower is None:
+            hours_lower = [hours.lower() for hours in hours_list]
+
+        # Each option is ranked in one pass; the first option of the best priority
+        # wins, i.e. the smallest (priority, position) pair
+        ranked = [(priority, i) for i, priority in enumerate(map(self._hours_priority, hours_list, hours_lower))
+                  if priority is not None]
+        if ranked:
+            return hours_list[min(ranked)[1]]
+
+        # Before default: Filter out generic "see...link" patterns if there are other options
+        # These are less useful than almost anything else
+        non_generic = [h for h in hours_list if not self._GENERIC_LINK_RE.search(h)]
+        if non_generic:
+            # Return longest of the non-generic options
+            return max(non_generic, key=len)
+
+        # Default: Return longest (most complete)
+        return max(hours_list, key=len)
+
+    def _hours_priority(self, hours: str, hours_lower: str) -> Optional[int]:
+        """
+        Rank office hours by how descriptive they are, running each check at most once.
+        Args:
+            hours (str): Valid office hours string.
+            hours_lower (str): The hours lowercased.
+        Returns:
+            Optional[int]: 1 (most descriptive) to 8, or None if no priority applies.
+        """
         # Priority 1: Multi-line/multi-day patterns with semicolons (most complete)
-        for hours in hours_list:
-            if ';' in hours and any(day in hours.lower() for day in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']):
-                # This looks like a complete weekly schedule
-                return hours
+        if ';' in hours and self._WEEKDAY_RE.search(hours_lower):
+            # This looks like a complete weekly schedule
+            return 1
 
         # Priority 2: "By appointment/arrangement" with day range and specific times
         # e.g., "By appointment Sunday - Thursday 7pm - 9pm"
-        for hours in hours_list:
-            if ('by appointment' in hours.lower() or 'by arrangement' in hours.lower()) and \
-               re.search(r'(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s*[-–]\s*(monday|tuesday|wednesday|thursday|friday|saturday|sunday)', hours, re.IGNORECASE) and \
-               re.search(r'\d{1,2}\s*[ap]m', hours, re.IGNORECASE):
-                return hours
+        if ('by appointment' in hours_lower or 'by arrangement' in hours_lower) and \
+           self._DAY_RANGE_RE.search(hours) and self._AMPM_TIME_RE.search(hours):
+            return 2
 
         # Priority 3: Entries with specific times and days
-        for hours in hours_list:
-            if re.search(r'\d{1,2}:\d{2}', hours) and re.search(r'[MTWRF]|Monday|Tuesday|Wednesday|Thursday|Friday', hours, re.IGNORECASE):
-                return hours
+        has_clock_time = self._CLOCK_TIME_RE.search(hours) is not None
+        if has_clock_time and self._DAY_RE.search(hours):
+            return 3
 
         # Priority 4: "By appointment" with additional context (in person/virtual)
-        for hours in hours_list:
-            if 'by appointment' in hours.lower() and (';' in hours or 'person' in hours.lower() or 'virtual' in hours.lower()):
-                return hours
+        if 'by appointment' in hours_lower and (';' in hours or 'person' in hours_lower or 'virtual' in hours_lower):
+            return 4
 
         # Priority 5: Monday patterns with Zoom (specific virtual hours)
-        for hours in hours_list:
-            if 'monday' in hours.lower() and 'zoom' in hours.lower():
-                return hours
+        if 'monday' in hours_lower and 'zoom' in hours_lower:
+            return 5
 
         # Priority 6: Just specific times
-        for hours in hours_list:
-            if re.search(r'\d{1,2}:\d{2}', hours):
-                return hours
-        
-        # Priority 6: Just day names
-        for hours in hours_list:
-            if re.search(r'[MTWRF]|Monday|Tuesday|Wednesday|Thursday|Friday', hours, re.IGNORECASE):
-                return hours
-        
-        # Priority 7: "scheduled" or "available" patterns
-        for hours in hours_list:
-            if 'scheduled' in hours.lower() or 'available' in hours.lower():
-                return hours
+        if has_clock_time:
+            return 6
 
-        # Before default: Filter out generic "see...link" patterns if there are other options
-        # These are less useful than almost anything else
-        non_generic = [h for h in hours_list if not re.search(r'see\s+.*\s+from\s+a\s+link', h, re.IGNORECASE)]
-        if non_generic:
-            # Return longest of the non-generic options
-            return max(non_generic, key=len)
+        # Priority 7: Just day names (only reached without a time, so checked once)
+        if self._DAY_RE.search(hours):
+            return 7
 
-        # Default: Return longest (most complete)
-        return max(hours_list, key=len)
+        # Priority 8: "scheduled" or "available" patterns
+        if 'scheduled' in hours_lower or 'available' in hours_lower:
+            return 8
+
+        return None
 
 
 class PhoneDetector(BaseDetector):
     """Detector for phone number information."""
 
+    _NON_DIGIT_RE = re.compile(r'\D')
+    _NON_PHONE_CHAR_RE = re.compile(r'[^0-9().\-\s]')
+    # Deletes everything but the digits from a string _clean_phone returned
+    _CLEANED_PHONE_PUNCTUATION = str.maketrans('', '', '().- ')
+
     def __init__(self):
         """Initialize phone detector with DEFAULT_PHONE_SEARCH_LIMIT char search limit."""
         super().__init__('phone', DEFAULT_PHONE_SEARCH_LIMIT)
@@ -797,11 +1193,12 @@ class PhoneDetector(BaseDetector):
             List[re.Pattern]: Compiled regex patterns for phone detection.
         """
 
+        # Every pattern captures the number as its only group
         digit_pattern = r'([(\d][\d\s().-]{8,14})'
         
         patterns = [
-            # Standard phone labels
-            rf'(?:Office\s*)?Phone[\s:]+{digit_pattern}',
+            # Standard phone labels ("Office" is left off; it is not captured)
+            rf'Phone[\s:]+{digit_pattern}',
             rf'PHONE[\s:]+{digit_pattern}',
             
             # Contact section
@@ -817,12 +1214,28 @@ class PhoneDetector(BaseDetector):
             rf'Telephone[\s:]+{digit_pattern}',
             
             # Generic phone number patterns
-            r'603[\s.-]?\d{3}[\s.-]?\d{4}',
-            r'\(603\)[\s.-]?\d{3}[\s.-]?\d{4}',
-            r'434[\s.-]?\d{3}[\s.-]?\d{4}',  # For the 434 area code
+            r'(603[\s.-]?\d{3}[\s.-]?\d{4})',
+            r'(\(603\)[\s.-]?\d{3}[\s.-]?\d{4})',
+            r'(434[\s.-]?\d{3}[\s.-]?\d{4})',  # For the 434 area code
         ]
         
         return [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in patterns]
+
+    def _init_anchors(self) -> List[Tuple[str, ...]]:
+        """
+        Anchor literals for the phone patterns, one tuple per pattern.
+
+        Returns:
+            List[Tuple[str, ...]]: Lowercase literals, one of which every match contains.
+        """
+        return [
+            ('phone',), ('phone',),     # Standard phone labels
+            ('phone',),                 # Contact section
+            ('phone',),                 # Phone after office location
+            ('office:',),               # Combined with office info
+            ('phone',),                 # Telephone pattern
+            ('603',), ('(603)',), ('434',),  # Generic phone number patterns
+        ]
     
     def _process_matches(self, matches: List[str], text: str) -> List[str]:
         """
@@ -839,13 +1252,13 @@ class PhoneDetector(BaseDetector):
         seen_normalized = set()
         
         for match in matches:
-            if isinstance(match, tuple):
-                match = match[0] if match else ''
-            
             if match:
                 cleaned = self._clean_phone(match)
-                if cleaned and self._validate_phone(cleaned):
-                    normalized = re.sub(r'\D', '', cleaned)
+                if not cleaned:
+                    continue
+                # Digits only, for both validation and deduplication
+                normalized = cleaned.translate(self._CLEANED_PHONE_PUNCTUATION)
+                if self._validate_phone(cleaned, normalized):
                     if normalized not in seen_normalized:
                         unique_phones.append(cleaned)
                         seen_normalized.add(normalized)
@@ -858,23 +1271,25 @@ class PhoneDetector(BaseDetector):
         args:
             phone (str): Raw phone number string.
         Returns:
-            str: Cleaned phone number string.
+            str: Cleaned phone number string, made of ASCII digits, "().-" and single spaces.
         """
         # Keep only valid phone characters
-        phone = re.sub(r'[^0-9().\-\s]', '', phone)
+        phone = self._NON_PHONE_CHAR_RE.sub('', phone)
         # Normalize whitespace
         phone = ' '.join(phone.split())
         return phone.strip()
     
-    def _validate_phone(self, phone: str) -> bool:
+    def _validate_phone(self, phone: str, digits: Optional[str] = None) -> bool:
         """
         Validate phone number.
         Args:
             phone (str): Cleaned phone number string.
+            digits (Optional[str]): The digits of phone, if already extracted.
         Returns:
             bool: True if valid phone number, False otherwise.
         """
-        digits = re.sub(r'\D', '', phone)
+        if digits is None:
+            digits = self._NON_DIGIT_RE.sub('', phone)
         return len(digits) in [7, 10]  # US phone formats
 
 
@@ -898,8 +1313,9 @@ class OfficeInformationDetector:
     def __init__(self):
         """
         Initialize the office information detector with all sub-detectors.
-        Sets up the field name, logger, location_detector, hours_detector, phone_detector, and compiles
-        the list of regex patterns used to detect office information declarations.
+        Sets up the field name, logger, location_detector, hours_detector and phone_detector.
+        The sub-detectors share their compiled patterns with every other instance of
+        their class, so construction compiles nothing after the first instance.
         """
         self.field_name = 'office_information'
         self.logger = logging.getLogger('detector.office_information')
@@ -16,9 +16,24 @@ Example:
     Output: "Online" (confidence: 0.90)
 """
 from __future__ import annotations
+import functools
 import re
 import unicodedata
-from typing import Dict, Tuple, Optional
+from typing import Dict, FrozenSet, Tuple, Optional
+
+# Optional Aho-Corasick matcher for finding any of many phrases in one pass
+try:
+    import ahocorasick_rs
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional linear-time regex engine for the patterns with unbounded .* gaps
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
 
 __all__ = [
     "detect_course_delivery",
@@ -57,98 +72,291 @@ BUILDING_WORDS = r"(?:rm\.?|room|hall|bldg\.?|building|lab|laboratory|lecture ha
 DAYS_TOKEN = r"(?:m/w|mw|t/th|tth|tr|mon(?:day)?|tue(?:s)?(?:day)?|wed(?:nesday)?|thu(?:rs)?(?:day)?|fri(?:day)?|sat(?:urday)?|sun(?:day)?)"
 TIME_TOKEN = r"(?:\b\d{1,2}:\d{2}\s?(?:am|pm)?\b|\b\d{1,2}\s?(?:am|pm)\b)"
 
+# Headings that start a class location/meeting section
+CLASS_LOCATION_HEADINGS = (
+    r"(?:class|course)\s+(?:location|meets?|meeting|time)",
+    r"(?:meeting\s+)?(?:location|place|where)",
+    r"(?:time\s+and\s+)?location",
+    r"(?:class|course)\s+delivery",
+    r"delivery\s+(?:method|format|mode)",
+    r"modality",
+    r"schedule",
+)
+
+# Statements that settle the modality on their own
+ONLINE_DEFINITIVE_PHRASES = (
+    "100% online", "fully online", "completely online", "entirely online",
+    "online only", "course is online", "this course is online",
+    "delivered entirely online", "offered online",
+    "synchronous online", "meets online", "meets on zoom", "meets via zoom",
+    "asynchronous online", "fully asynchronous", "entirely asynchronous",
+    "this course meets synchronously online",
+    "no scheduled class times", "no scheduled class meeting times",
+    "there are no scheduled class times", "there are no scheduled meeting times",
+)
+HYBRID_DEFINITIVE_PHRASES = (
+    "hybrid course", "hy-flex", "hyflex", "blended course",
+    "hybrid format", "blended format", "hybrid delivery",
+)
+
+# Support services whose rooms are not class locations
+SUPPORT_CONTEXTS = (
+    "accessibility services", "student accessibility", "counseling services",
+    "tutoring", "writing center", "library", "financial aid", "registrar",
+    "dean's office", "advisement", "student services"
+)
+
+# Compiled once at import; the headings are searched as a single alternation.
+# Section headings are searched over many lines at once, so their whitespace
+# must not cross a newline.
+_SPACES_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_CLASS_LOCATION_RE = re.compile(
+    "|".join(f"(?:{heading})" for heading in CLASS_LOCATION_HEADINGS).replace(r"\s", r"[^\S\n]"), re.IGNORECASE
+)
+_OFFICE_HOURS_RE = re.compile(r"(?i)\boffice[^\S\n]+hours?\b")
+_ZOOM_CLASS_RE = re.compile(r"(?i)\b(meets?|meeting|class|delivered|offered)\b.*\b(zoom|microsoft\s*teams|teams|webex)\b")
+_ROOM_NUMBER_RE = re.compile(rf"(?i)\b{BUILDING_WORDS}\b.*\b[A-Za-z]?\d{{2,4}}\b")
+_MEETS_IN_ROOM_RE = re.compile(rf"(?i)\b(meets?|meeting)\s+in\b.*\b({BUILDING_WORDS})\b")
+
+# detect_course_delivery phase 1-2 checks, compiled once
+_ONLINE_ALSO_IN_ROOM_RE = re.compile(r"(?i)\b(online|zoom|teams|webex).*\b(and also in|also in)\b.*\b(room|rm\.?|pandora|pandra|hall|building)\b")
+_LOCATION_ONLINE_AND_ROOM_RE = re.compile(r"(?i)\blocation.*:.*\bonline\b.*\band\b.*\b(room|rm\.?|pandora|pandra)\b")
+_LOCATION_ONLINE_RE = re.compile(r"(?i)(?:time\s+and\s+)?location[:\s]+.*\bonline\b")
+_DAY_TIME_ONLINE_RE = re.compile(r"(?i)(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*[,\s]+\d{1,2}:\d{2}.*\bonline\b")
+_FACE_TO_FACE_ONLINE_RE = re.compile(r"(?i)face[-\s]?to[-\s]?face\s+(?:weekly|sessions?).*(?:async|online)")
+_DELIVERY_ONLINE_RE = re.compile(r"(?i)(?:delivery|modality|format|mode)\s*[:\-]?\s*(?:online|asynchronous|synchronous online)")
+_MEETING_ROOM_RE = re.compile(rf"(?i)\b(meets?|meeting)\b.*\b({BUILDING_WORDS})\b.*\b[A-Za-z]?\d{{2,4}}\b")
+_IN_PERSON_RE = re.compile(r"(?i)\bin[ -]?person\b")
+# Case-sensitive, as it has always run on the lowered text
+_ROOM_IN_TEXT_RE = re.compile(rf"\b({BUILDING_WORDS})\b.*\b[A-Za-z]?\d{{2,4}}\b")
+_DAYS_RE = re.compile(DAYS_TOKEN)
+_TIME_RE = re.compile(TIME_TOKEN)
+_ONLINE_CUE_RE = re.compile(r"\b(online|zoom|microsoft\s*teams|webex|remote)\b")
+
+# ===================================================================
+# SCORING TABLES
+# ===================================================================
+
+# Scoring patterns are (pattern, weight, anchors): every match contains one of
+# the lowercase anchors, so a pattern only has to run when one occurs in the
+# text. None means the pattern has no literal to anchor on.
+
+# Online patterns with weights
+ONLINE_PATTERNS = tuple((re.compile(pattern), weight, anchors) for pattern, weight, anchors in (
+    (r"(?i)\bcourse\s+(?:is\s+)?(?:delivered|offered|taught)\s+online\b", 3.5, ("online",)),
+    (r"(?i)\bonline\s+(?:course|format|delivery|instruction|modality)\b", 3.0, ("online",)),
+    (r"(?i)\bsynchronous\s+online\b", 3.2, ("synchronous",)),
+    (r"(?i)\basynchronous\s+(?:course|format|delivery)\b", 3.2, ("asynchronous",)),
+    (r"(?i)\bremote\s+(?:course|instruction|learning)\b", 2.5, ("remote",)),
+    (r"(?i)\bvirtual\s+course\b", 2.5, ("virtual",)),
+    (r"(?i)\bclass\s+meets?\s+(?:on|via)\s+(?:zoom|microsoft\s*teams|teams|webex)\b", 3.5, ("meet",)),
+    (r"(?i)\bdelivered\s+(?:entirely\s+)?(?:online|remotely|asynchronously)\b", 3.5, ("delivered",)),
+))
+
+# Irrelevant contexts to ignore
+IRRELEVANT_ONLINE_CONTEXTS = (
+    "textbook online", "materials online", "resources online",
+    "available online", "posted online", "submit online", "canvas online"
+)
+
+# In-person patterns with weights
+INPERSON_PATTERNS = tuple((re.compile(pattern), weight, anchors) for pattern, weight, anchors in (
+    (rf"(?i)\b(?:class|course|lecture)\s+(?:meets?|is held|location).*(?:{BUILDING_WORDS})\b", 3.0,
+     ("meet", "is held", "location")),
+    (rf"(?i)\b(?:location|where)\b.*\b(?:{BUILDING_WORDS})\b.*\b[A-Za-z]?\d{{2,4}}\b", 2.7, ("location", "where")),
+    (r"(?i)\bin[-\s]?person\s+(?:class|course|instruction)\b", 2.5, ("person",)),
+    (r"(?i)\bon\s+campus\s+(?:course|class)\b", 2.0, ("campus",)),
+    (r"(?i)\bclassroom\s+instruction\b", 2.0, ("classroom",)),
+    (rf"(?i)\b[A-Z][a-zA-Z]+(?:\s+(?:Hall|Building|Lab))?\s+[A-Za-z]?\d{{2,4}}\b", 2.1, None),
+    (r"(?i)\btaking\s+attendance\b", 1.5, ("attendance",)),
+    (r"(?i)\barrive\s+late\s+to\s+class\b", 1.3, ("arrive",)),
+    (r"(?i)\bleave\s+early\s+from\s+class\b", 1.3, ("leave",)),
+    (r"(?i)\bneed\s+to\s+be\s+here\b", 1.5, ("need",)),
+    (r"(?i)\bin[ -]?person\b", 2.0, ("person",)),
+    (r"(?i)\bon[- ]site\b", 1.8, ("site",)),
+    (r"(?i)face[- ]to[- ]face\b", 2.0, ("face",)),
+    (r"(?i)\b(outdoor|field)\s+(meetings?|sessions?|labs?)\b", 2.0, ("outdoor", "field")),
+))
+
+# Every scoring anchor, looked up together once per text
+SCORING_ANCHORS = tuple(dict.fromkeys(
+    anchor for _, _, anchors in ONLINE_PATTERNS + INPERSON_PATTERNS for anchor in anchors or ()
+))
+# The only characters an IGNORECASE letter matches that str.lower() does not map to it
+_LOWER_MISMATCHED_LETTERS = re.compile("[\u0130\u0131\u017f]")
+
+# Filter out support services and course codes
+SUPPORT_SERVICE_CONTEXTS = (
+    "accessibility", "counseling", "tutoring", "writing center",
+    "library", "financial aid", "registrar", "advisement", "student services",
+    "wellness", "health services"
+)
+
+COURSE_CODE_PATTERNS = (
+    r"\bcomp\s*\d", r"\bmath\s*\d", r"\bbms\s*\d", r"\bphys\s*\d",
+    r"\banth\s*\d", r"\bpsyc\s*\d", r"\bbiol\s*\d", r"\bcmn\s*\d",
+    r"\bnsia\s*\d", r"\bcredit", r"\bcrn\s*:",
+)
+_COURSE_CODE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in COURSE_CODE_PATTERNS))
+
+# quick_course_metadata fields, compiled once
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_INSTRUCTOR_LINE_RE = re.compile(r"(?im)^(?:instructor|professor|lecturer)[:\s-]+(.{3,80})$")
+_BY_LINE_RE = re.compile(r"(?im)^(?:by)[:\s-]+(.{3,80})$")
+_COURSE_LINE_RE = re.compile(r"(?im)^(?:course|class)\s*(?:title|name|code)?[:\s-]+(.{3,80})$")
+_COURSE_CODE_HEADER_RE = re.compile(r"\b[A-Z]{2,}\s?\d{3,}[A-Z-]*\b")
+
+# On ASCII text RE2 agrees with re except for \s, which in re also matches these
+_RE2_MISMATCHED_WHITESPACE = re.compile(r"[\x0b\x1c-\x1f]")
+
+
+def _compile_re2(pattern: re.Pattern):
+    """RE2 copy of a compiled pattern, or None when RE2 is missing or rejects it."""
+    if not RE2_AVAILABLE:
+        return None
+    try:
+        return re2.compile(pattern.pattern)
+    except re2.error:
+        return None
+
+
+# Patterns whose .* gaps make re backtrack over whole lines of uploaded text;
+# RE2 runs them in time linear in the text. The anchored (?im) metadata
+# patterns stay on re.
+_RE2_PATTERNS = {
+    pattern: _compile_re2(pattern)
+    for pattern in (
+        _ZOOM_CLASS_RE, _ROOM_NUMBER_RE, _MEETS_IN_ROOM_RE, _ONLINE_ALSO_IN_ROOM_RE,
+        _LOCATION_ONLINE_AND_ROOM_RE, _LOCATION_ONLINE_RE, _DAY_TIME_ONLINE_RE,
+        _FACE_TO_FACE_ONLINE_RE, _MEETING_ROOM_RE, _ROOM_IN_TEXT_RE,
+        INPERSON_PATTERNS[0][0], INPERSON_PATTERNS[1][0],
+    )
+}
+
+
+def _re2_compatible(text: str) -> bool:
+    """Whether RE2 patterns find exactly what the re patterns would in text."""
+    return RE2_AVAILABLE and text.isascii() and not _RE2_MISMATCHED_WHITESPACE.search(text)
+
+
+def _search(pattern: re.Pattern, text: str, use_re2: bool = False):
+    """pattern.search(text), on the pattern's RE2 copy when use_re2 and it has one."""
+    if use_re2:
+        pattern = _RE2_PATTERNS.get(pattern) or pattern
+    return pattern.search(text)
+
+
+def _phrase_finder(phrases: Tuple[str, ...]):
+    """Aho-Corasick automaton over phrases, or None without ahocorasick_rs"""
+    return ahocorasick_rs.AhoCorasick(list(phrases)) if AHOCORASICK_AVAILABLE else None
+
+
+_ONLINE_DEFINITIVE_FINDER = _phrase_finder(ONLINE_DEFINITIVE_PHRASES)
+_HYBRID_DEFINITIVE_FINDER = _phrase_finder(HYBRID_DEFINITIVE_PHRASES)
+_SCORING_ANCHOR_FINDER = _phrase_finder(SCORING_ANCHORS)
+
+
+def _first_phrase_in(text: str, phrases: Tuple[str, ...], finder) -> Optional[str]:
+    """First of phrases, in their order, that occurs in text (None if none does)"""
+    # One automaton pass rules out texts containing none of the phrases;
+    # without it each phrase is looked up in turn
+    if finder is not None and not finder.find_matches_as_indexes(text):
+        return None
+    return next((phrase for phrase in phrases if phrase in text), None)
+
+
+def _phrases_in(text: str, phrases: Tuple[str, ...], finder) -> FrozenSet[str]:
+    """Every one of phrases that occurs in text, in one automaton pass when available"""
+    if finder is None:
+        return frozenset(phrase for phrase in phrases if phrase in text)
+    return frozenset(phrases[index] for index, _, _ in finder.find_matches_as_indexes(text, overlapping=True))
+
+
+def _should_run(anchors: Optional[Tuple[str, ...]], present: FrozenSet[str]) -> bool:
+    """Whether a scoring pattern can match, given the anchors present in the text"""
+    return anchors is None or any(anchor in present for anchor in anchors)
+
 # ===================================================================
 # TEXT NORMALIZATION
 # ===================================================================
 
+# quick_course_metadata and detect_course_delivery are run on the same syllabus
+# one after the other, so the last few normalized texts are kept
+@functools.lru_cache(maxsize=8)
 def normalize_syllabus_text(text: str) -> str:
     """Clean up text - normalize unicode, bullets, and whitespace"""
     if not text:
         return ""
     t = unicodedata.normalize("NFKC", text)
     
-    # Replace bullet characters with dashes
+    # Replace bullet characters with dashes ("•" is U+2022, so it needs only one pass;
+    # replace skips a missing character quickly, unlike translate on non-ASCII text)
     t = (
         t.replace("•", "- ")
         .replace("▪", "- ")
         .replace("‣", "- ")
         .replace("◦", "- ")
-        .replace("\u2022", "- ")
     )
     
     # Normalize whitespace
-    t = re.sub(r"[ \t]+", " ", t)
-    t = re.sub(r"\n{3,}", "\n\n", t)
+    t = _SPACES_RE.sub(" ", t)
+    t = _BLANK_LINES_RE.sub("\n\n", t)
     return t.strip()
 
 # ===================================================================
 # SECTION EXTRACTION
 # ===================================================================
 
+def _find_section(text: str, heading_re: re.Pattern, max_lines: int) -> str:
+    """Extract the lines around the first of the first max_lines lines matching heading_re"""
+    # One search over the leading lines instead of one per line; heading_re
+    # never crosses a newline, so its first match is on the first matching line
+    head = text.split("\n", max_lines)
+    end_of_head = len(text) - len(head[max_lines]) - 1 if len(head) > max_lines else len(text)
+    match = heading_re.search(text, 0, end_of_head)
+    if not match:
+        return ""
+    i = text.count("\n", 0, match.start())
+    lines = text.split("\n", i + CONTEXT_WINDOW_AFTER)
+    start = max(0, i - CONTEXT_WINDOW_BEFORE)
+    return "\n".join(lines[start:i + CONTEXT_WINDOW_AFTER]).lower()
+
+
 def _find_class_location_section(text: str) -> str:
     """Extract class location/meeting section (not office hours)"""
-    lines = text.split("\n")
-    
-    location_patterns = [
-        r"(?i)(?:class|course)\s+(?:location|meets?|meeting|time)",
-        r"(?i)(?:meeting\s+)?(?:location|place|where)",
-        r"(?i)(?:time\s+and\s+)?location",
-        r"(?i)(?:class|course)\s+delivery",
-        r"(?i)delivery\s+(?:method|format|mode)",
-        r"(?i)modality",
-        r"(?i)schedule",
-    ]
-    
-    for i, line in enumerate(lines[:MAX_LINES_LOCATION_SEARCH]):
-        for pat in location_patterns:
-            if re.search(pat, line):
-                start = max(0, i - CONTEXT_WINDOW_BEFORE)
-                end = min(i + CONTEXT_WINDOW_AFTER, len(lines))
-                return "\n".join(lines[start:end]).lower()
-    return ""
+    return _find_section(text, _CLASS_LOCATION_RE, MAX_LINES_LOCATION_SEARCH)
 
 
 def _find_office_hours_section(text: str) -> str:
     """Extract office hours section to avoid confusion with class location"""
-    lines = text.split("\n")
-    for i, line in enumerate(lines[:MAX_LINES_OFFICE_SEARCH]):
-        if re.search(r"(?i)\boffice\s+hours?\b", line):
-            start = max(0, i - CONTEXT_WINDOW_BEFORE)
-            end = min(i + CONTEXT_WINDOW_AFTER, len(lines))
-            return "\n".join(lines[start:end]).lower()
-    return ""
+    return _find_section(text, _OFFICE_HOURS_RE, MAX_LINES_OFFICE_SEARCH)
 
 # ===================================================================
 # PATTERN CHECKERS
 # ===================================================================
 
-def _has_zoom_class_phrase(s: str) -> bool:
+def _has_zoom_class_phrase(s: str, use_re2: bool = False) -> bool:
     """Check if Zoom/Teams/Webex mentioned for class meetings (not office hours)"""
     if not s:
         return False
-    return bool(
-        re.search(r"(?i)\b(meets?|meeting|class|delivered|offered)\b.*\b(zoom|microsoft\s*teams|teams|webex)\b", s)
-    )
+    return bool(_search(_ZOOM_CLASS_RE, s, use_re2))
 
 
-def _has_physical_room_phrase(s: str) -> bool:
+def _has_physical_room_phrase(s: str, use_re2: bool = False) -> bool:
     """Check if physical room mentioned for classes (filter out support services)"""
     if not s:
         return False
     
-    # Filter out support service contexts
-    support_contexts = [
-        "accessibility services", "student accessibility", "counseling services",
-        "tutoring", "writing center", "library", "financial aid", "registrar",
-        "dean's office", "advisement", "student services"
-    ]
+    # Filter out support service contexts (substring checks beat one
+    # alternation search here: sections are short and the phrases literal)
     s_lower = s.lower()
-    if any(ctx in s_lower for ctx in support_contexts):
+    if any(ctx in s_lower for ctx in SUPPORT_CONTEXTS):
         return False
     
-    if re.search(rf"(?i)\b{BUILDING_WORDS}\b.*\b[A-Za-z]?\d{{2,4}}\b", s):
+    if _search(_ROOM_NUMBER_RE, s, use_re2):
         return True
-    if re.search(rf"(?i)\b(meets?|meeting)\s+in\b.*\b({BUILDING_WORDS})\b", s):
+    if _search(_MEETS_IN_ROOM_RE, s, use_re2):
         return True
     return False
 
@@ -176,6 +384,8 @@ def detect_course_delivery(text: str) -> Dict[str, object]:
     
     t = normalize_syllabus_text(text)
     t_lower = t.lower()
+    # Checked on t: lowering can turn non-ASCII letters (e.g. the Kelvin sign) into ASCII
+    use_re2 = _re2_compatible(t)
     
     class_section = _find_class_location_section(t)
     office_section = _find_office_hours_section(t)
@@ -185,49 +395,35 @@ def detect_course_delivery(text: str) -> Dict[str, object]:
     # PHASE 1: Definitive statements (highest confidence)
     # ================================================================
     
-    online_definitive = [
-        "100% online", "fully online", "completely online", "entirely online",
-        "online only", "course is online", "this course is online",
-        "delivered entirely online", "offered online",
-        "synchronous online", "meets online", "meets on zoom", "meets via zoom",
-        "asynchronous online", "fully asynchronous", "entirely asynchronous",
-        "this course meets synchronously online",
-        "no scheduled class times", "no scheduled class meeting times",
-        "there are no scheduled class times", "there are no scheduled meeting times",
-    ]
-    for phrase in online_definitive:
-        if phrase in t_lower:
-            return {"modality": "Online", "confidence": 0.95, "evidence": [phrase]}
+    phrase = _first_phrase_in(t_lower, ONLINE_DEFINITIVE_PHRASES, _ONLINE_DEFINITIVE_FINDER)
+    if phrase:
+        return {"modality": "Online", "confidence": 0.95, "evidence": [phrase]}
     
     # Hybrid checks (before online-only)
-    hybrid_definitive = [
-        "hybrid course", "hy-flex", "hyflex", "blended course",
-        "hybrid format", "blended format", "hybrid delivery",
-    ]
-    for phrase in hybrid_definitive:
-        if phrase in t_lower:
-            return {"modality": "Hybrid", "confidence": 0.95, "evidence": [phrase]}
+    phrase = _first_phrase_in(t_lower, HYBRID_DEFINITIVE_PHRASES, _HYBRID_DEFINITIVE_FINDER)
+    if phrase:
+        return {"modality": "Hybrid", "confidence": 0.95, "evidence": [phrase]}
     
     # Pattern: online AND physical location
-    if re.search(r"(?i)\b(online|zoom|teams|webex).*\b(and also in|also in)\b.*\b(room|rm\.?|pandora|pandra|hall|building)\b", t_lower[:HEADER_SEARCH_LIMIT_1000]):
+    if _search(_ONLINE_ALSO_IN_ROOM_RE, t_lower[:HEADER_SEARCH_LIMIT_1000], use_re2):
         return {"modality": "Hybrid", "confidence": 0.95, "evidence": ["online and also in physical location"]}
     
-    if re.search(r"(?i)\blocation.*:.*\bonline\b.*\band\b.*\b(room|rm\.?|pandora|pandra)\b", t_lower[:HEADER_SEARCH_LIMIT_1000]):
+    if _search(_LOCATION_ONLINE_AND_ROOM_RE, t_lower[:HEADER_SEARCH_LIMIT_1000], use_re2):
         return {"modality": "Hybrid", "confidence": 0.95, "evidence": ["location shows both online and room"]}
     
     # Location: Online (but not if also mentions room)
-    location_online_match = re.search(r"(?i)(?:time\s+and\s+)?location[:\s]+.*\bonline\b", t_lower[:HEADER_SEARCH_LIMIT_800])
+    location_online_match = _search(_LOCATION_ONLINE_RE, t_lower[:HEADER_SEARCH_LIMIT_800], use_re2)
     if location_online_match:
         location_text = t_lower[location_online_match.start():min(location_online_match.end() + 100, len(t_lower))]
         if not any(word in location_text for word in ["room", "rm", "hall", "building", "pandora", "pandra"]):
             return {"modality": "Online", "confidence": 0.93, "evidence": ["location states online"]}
     
     # Day/time with online
-    if re.search(r"(?i)(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*[,\s]+\d{1,2}:\d{2}.*\bonline\b", t_lower[:HEADER_SEARCH_LIMIT_800]):
+    if _search(_DAY_TIME_ONLINE_RE, t_lower[:HEADER_SEARCH_LIMIT_800], use_re2):
         return {"modality": "Online", "confidence": 0.93, "evidence": ["class time shows online"]}
     
     # Face-to-face + async/online
-    if re.search(r"(?i)face[-\s]?to[-\s]?face\s+(?:weekly|sessions?).*(?:async|online)", t_lower):
+    if _search(_FACE_TO_FACE_ONLINE_RE, t_lower, use_re2):
         return {"modality": "Hybrid", "confidence": 0.92, "evidence": ["face-to-face + async/online components"]}
     
     # ================================================================
@@ -240,37 +436,36 @@ def detect_course_delivery(text: str) -> Dict[str, object]:
             return {"modality": "Hybrid", "confidence": 0.95, "evidence": ["header explicitly states hybrid"]}
     
     if class_section:
-        if _has_zoom_class_phrase(class_section):
+        if _has_zoom_class_phrase(class_section, use_re2):
             return {"modality": "Online", "confidence": 0.90, "evidence": ["class meets on Zoom/Teams/Webex"]}
-        if _has_physical_room_phrase(class_section):
+        if _has_physical_room_phrase(class_section, use_re2):
             return {"modality": "In-Person", "confidence": 0.90, "evidence": ["class meets in physical room"]}
     
     # Delivery method in header
     header_1000 = t_lower[:HEADER_SEARCH_LIMIT_1000]
-    if re.search(r"(?i)(?:delivery|modality|format|mode)\s*[:\-]?\s*(?:online|asynchronous|synchronous online)", header_1000):
+    if _DELIVERY_ONLINE_RE.search(header_1000):
         return {"modality": "Online", "confidence": 0.92, "evidence": ["delivery method states online"]}
     
     # Physical meeting room in header
     header_600 = t_lower[:HEADER_SEARCH_LIMIT_600]
-    meeting_match = re.search(rf"(?i)\b(meets?|meeting)\b.*\b({BUILDING_WORDS})\b.*\b[A-Za-z]?\d{{2,4}}\b", header_600)
+    meeting_match = _search(_MEETING_ROOM_RE, header_600, use_re2)
     if meeting_match:
         office_in_header = "office" in header_600[max(0, meeting_match.start() - CONTEXT_OFFSET_50) : meeting_match.end() + CONTEXT_OFFSET_150]
         if not office_in_header and "hybrid" not in header_1500:
             return {"modality": "In-Person", "confidence": 0.92, "evidence": ["header shows physical meeting room"]}
     
     # In-person in header
-    if re.search(r"(?i)\bin[ -]?person\b", header_600) and "office" not in header_600 and "hybrid" not in header_1500:
+    if _IN_PERSON_RE.search(header_600) and "office" not in header_600 and "hybrid" not in header_1500:
         return {"modality": "In-Person", "confidence": 0.90, "evidence": ["header says in person"]}
     
     # Physical room outside office hours
     non_office = t_lower.replace(office_section, "") if office_section else t_lower
-    if re.search(rf"\b({BUILDING_WORDS})\b.*\b[A-Za-z]?\d{{2,4}}\b", non_office) and "hybrid" not in header_1500:
+    if _search(_ROOM_IN_TEXT_RE, non_office, use_re2) and "hybrid" not in header_1500:
         return {"modality": "In-Person", "confidence": 0.90, "evidence": ["physical room outside office hours"]}
     
     # Day/time schedule without online cues
-    if re.search(DAYS_TOKEN, non_office) and re.search(TIME_TOKEN, non_office) and not re.search(
-        r"\b(online|zoom|microsoft\s*teams|webex|remote)\b", non_office
-    ) and "hybrid" not in header_1500:
+    if _DAYS_RE.search(non_office) and _TIME_RE.search(non_office) and not _ONLINE_CUE_RE.search(non_office) \
+            and "hybrid" not in header_1500:
         return {"modality": "In-Person", "confidence": 0.86, "evidence": ["day/time schedule with no online cues"]}
     
     # ================================================================
@@ -303,30 +498,21 @@ def detect_course_delivery(text: str) -> Dict[str, object]:
     score_hybrid = 0.0
     score_inperson = 0.0
     
-    # Online patterns with weights
-    online_patterns = [
-        (r"(?i)\bcourse\s+(?:is\s+)?(?:delivered|offered|taught)\s+online\b", 3.5),
-        (r"(?i)\bonline\s+(?:course|format|delivery|instruction|modality)\b", 3.0),
-        (r"(?i)\bsynchronous\s+online\b", 3.2),
-        (r"(?i)\basynchronous\s+(?:course|format|delivery)\b", 3.2),
-        (r"(?i)\bremote\s+(?:course|instruction|learning)\b", 2.5),
-        (r"(?i)\bvirtual\s+course\b", 2.5),
-        (r"(?i)\bclass\s+meets?\s+(?:on|via)\s+(?:zoom|microsoft\s*teams|teams|webex)\b", 3.5),
-        (r"(?i)\bdelivered\s+(?:entirely\s+)?(?:online|remotely|asynchronously)\b", 3.5),
-    ]
-    
-    # Irrelevant contexts to ignore
-    irrelevant_online_contexts = [
-        "textbook online", "materials online", "resources online",
-        "available online", "posted online", "submit online", "canvas online"
-    ]
-    
-    for pat, w in online_patterns:
-        match = re.search(pat, t_lower)
+    # Each pattern scans the whole text; skip those whose anchors are all absent.
+    # The check is only exact when lowering left no letter IGNORECASE folds differently.
+    if _LOWER_MISMATCHED_LETTERS.search(t_lower):
+        present = frozenset(SCORING_ANCHORS)
+    else:
+        present = _phrases_in(t_lower, SCORING_ANCHORS, _SCORING_ANCHOR_FINDER)
+    
+    for pat, w, anchors in ONLINE_PATTERNS:
+        if not _should_run(anchors, present):
+            continue
+        match = pat.search(t_lower)
         if match:
             match_start = match.start()
             match_context = t_lower[max(0, match_start - 30):match.end() + 30]
-            if not any(ctx in match_context for ctx in irrelevant_online_contexts):
+            if not any(ctx in match_context for ctx in IRRELEVANT_ONLINE_CONTEXTS):
                 score_online += w
                 evidence.append("online_pattern_match")
     
@@ -339,46 +525,17 @@ def detect_course_delivery(text: str) -> Dict[str, object]:
             if any(ctx in near for ctx in ["meet", "class", "course", "location", "delivery"]):
                 score_online += 2.0
     
-    # In-person patterns with weights
-    inperson_patterns = [
-        (rf"(?i)\b(?:class|course|lecture)\s+(?:meets?|is held|location).*(?:{BUILDING_WORDS})\b", 3.0),
-        (rf"(?i)\b(?:location|where)\b.*\b(?:{BUILDING_WORDS})\b.*\b[A-Za-z]?\d{{2,4}}\b", 2.7),
-        (r"(?i)\bin[-\s]?person\s+(?:class|course|instruction)\b", 2.5),
-        (r"(?i)\bon\s+campus\s+(?:course|class)\b", 2.0),
-        (r"(?i)\bclassroom\s+instruction\b", 2.0),
-        (rf"(?i)\b[A-Z][a-zA-Z]+(?:\s+(?:Hall|Building|Lab))?\s+[A-Za-z]?\d{{2,4}}\b", 2.1),
-        (r"(?i)\btaking\s+attendance\b", 1.5),
-        (r"(?i)\barrive\s+late\s+to\s+class\b", 1.3),
-        (r"(?i)\bleave\s+early\s+from\s+class\b", 1.3),
-        (r"(?i)\bneed\s+to\s+be\s+here\b", 1.5),
-        (r"(?i)\bin[ -]?person\b", 2.0),
-        (r"(?i)\bon[- ]site\b", 1.8),
-        (r"(?i)face[- ]to[- ]face\b", 2.0),
-        (r"(?i)\b(outdoor|field)\s+(meetings?|sessions?|labs?)\b", 2.0),
-    ]
-    
-    # Filter out support services and course codes
-    support_service_contexts = [
-        "accessibility", "counseling", "tutoring", "writing center",
-        "library", "financial aid", "registrar", "advisement", "student services",
-        "wellness", "health services"
-    ]
-    
-    course_code_patterns = [
-        r"\bcomp\s*\d", r"\bmath\s*\d", r"\bbms\s*\d", r"\bphys\s*\d",
-        r"\banth\s*\d", r"\bpsyc\s*\d", r"\bbiol\s*\d", r"\bcmn\s*\d",
-        r"\bnsia\s*\d", r"\bcredit", r"\bcrn\s*:",
-    ]
-    
-    for pat, w in inperson_patterns:
-        match = re.search(pat, t_lower)
+    for pat, w, anchors in INPERSON_PATTERNS:
+        if not _should_run(anchors, present):
+            continue
+        match = _search(pat, t_lower, use_re2)
         if match:
             match_start = match.start()
             match_context = t_lower[max(0, match_start - 50):match.end() + 50]
             
-            is_course_code = any(re.search(code_pat, match_context) for code_pat in course_code_patterns)
+            is_course_code = bool(_COURSE_CODE_RE.search(match_context))
             
-            if not any(ctx in match_context for ctx in support_service_contexts) and not is_course_code:
+            if not any(ctx in match_context for ctx in SUPPORT_SERVICE_CONTEXTS) and not is_course_code:
                 score_inperson += w
                 evidence.append("inperson_pattern_match")
     
@@ -388,8 +545,8 @@ def detect_course_delivery(text: str) -> Dict[str, object]:
     
     # Adjust scores if office hours but no class location
     if office_section and score_inperson > 0:
-        room_in_class = bool(re.search(rf"(?i)\b{BUILDING_WORDS}\b.*\b[A-Za-z]?\d{{2,4}}\b", class_section))
-        room_in_office = bool(re.search(rf"(?i)\b{BUILDING_WORDS}\b.*\b[A-Za-z]?\d{{2,4}}\b", office_section))
+        room_in_class = bool(_search(_ROOM_NUMBER_RE, class_section, use_re2))
+        room_in_office = bool(_search(_ROOM_NUMBER_RE, office_section, use_re2))
         if room_in_office and not room_in_class:
             score_inperson = max(0.0, score_inperson - INPERSON_PENALTY)
             evidence.append("reduced_inperson_office_hours_only")
@@ -432,21 +589,21 @@ def quick_course_metadata(text: str) -> Dict[str, str]:
     t = normalize_syllabus_text(text)
     
     # Extract email
-    email_match = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", t)
+    email_match = _EMAIL_RE.search(t)
     email = email_match.group(0) if email_match else ""
     
     # Extract instructor
-    instructor_match = re.search(r"(?im)^(?:instructor|professor|lecturer)[:\s-]+(.{3,80})$", t)
+    instructor_match = _INSTRUCTOR_LINE_RE.search(t)
     instructor = (instructor_match.group(1).strip() if instructor_match else "")
     if not instructor:
-        by_match = re.search(r"(?im)^(?:by)[:\s-]+(.{3,80})$", t)
+        by_match = _BY_LINE_RE.search(t)
         instructor = by_match.group(1).strip() if by_match else ""
     
     # Extract course
-    course_match = re.search(r"(?im)^(?:course|class)\s*(?:title|name|code)?[:\s-]+(.{3,80})$", t)
+    course_match = _COURSE_LINE_RE.search(t)
     course = (course_match.group(1).strip() if course_match else "")
     if not course:
-        code_match = re.search(r"\b[A-Z]{2,}\s?\d{3,}[A-Z-]*\b", t[:HEADER_SEARCH_LIMIT_400])
+        code_match = _COURSE_CODE_HEADER_RE.search(t[:HEADER_SEARCH_LIMIT_400])
         course = code_match.group(0) if code_match else ""
     
     return {"course": course, "instructor": instructor, "email": email}
@@ -1,5 +1,5 @@
 import unittest
-from detectors.grading_process_detection import GradingProcessDetector
+from detectors.grading_process_detection import GradingProcessDetector, NUMBA_AVAILABLE
 
 class TestGradingProcessDetector(unittest.TestCase):
     def setUp(self):
@@ -52,5 +52,23 @@ class TestGradingProcessDetector(unittest.TestCase):
         self.assertFalse(res['found'])
         self.assertEqual(res['content'], '')
 
+    def test_find_letter_block(self):
+        text = "Scale A: 93-100 B: 83-86 C: 73-76 D: 63-66 F: below 60"
+        self.assertEqual(self.detector._find_letter_block(text), (6, text.index('F:') + 2))
+        self.assertIsNone(self.detector._find_letter_block("A: excellent " + "x" * 100 + " B: good C: D: F:"))
+        # the first B: is a dead end; the block continues from the later one
+        text = "A: B: " + "x" * 70 + " B: " + "y" * 60 + " C: D: F:"
+        self.assertEqual(self.detector._find_letter_block(text), (0, 149))
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba not installed")
+    def test_numba_masks_match_regex(self):
+        import numpy as np
+        from detectors.grading_process_detection import _scan_lines
+        text = "Exam 1 - 22%\nProject 10 Points\n5pts, 4 %\nA1 pts\n3 pointsx\nno numbers\n12\t%"
+        lines = text.split('\n')
+        _, has_percent, has_points = _scan_lines(np.frombuffer(text.encode('ascii'), dtype=np.uint8))
+        self.assertEqual(has_percent.tolist(), [bool(self.detector.percent_pattern.search(ln)) for ln in lines])
+        self.assertEqual(has_points.tolist(), [bool(self.detector.points_pattern.search(ln)) for ln in lines])
+
 if __name__ == '__main__':
     unittest.main()
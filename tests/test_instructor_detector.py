@@ -0,0 +1,67 @@
+import itertools
+import unittest
+from detectors.instructor_detector import InstructorDetector, NUMBA_AVAILABLE, RE2_AVAILABLE
+
+class OtherDetector(InstructorDetector):
+    """Subclass with its own detection, for the cache and batch tests."""
+    def _detect(self, text):
+        return {'found': False, 'name': 'Other', 'title': 'Missing', 'department': 'Missing'}
+
+class TestInstructorDetector(unittest.TestCase):
+    def setUp(self):
+        self.detector = InstructorDetector()
+
+    def test_name_after_keyword_detected(self):
+        res = self.detector.detect("COMP 101 Syllabus\nInstructor: John Smith\n")
+        self.assertEqual(res['name'], 'John Smith')
+
+    def test_publisher_surname_on_instructor_line(self):
+        self.assertEqual(self.detector.detect("COMP 101\nInstructor: Karen Pearson\n")['name'], 'Karen Pearson')
+        self.assertEqual(self.detector.detect("Professor: Karen Wiley\n")['name'], 'Karen Wiley')
+
+    def test_publisher_line_skipped_in_fallback(self):
+        self.assertEqual(self.detector.detect("COMP 101\nRequired: Pearson Education, 5th ed.\n")['name'], 'Missing')
+        self.assertTrue(self.detector.skip_line_pattern.search("text: see canvas"))
+        self.assertIsNone(self.detector.skip_line_pattern.search("context: office hours"))
+
+    def test_capitalized_exclusions_do_not_apply(self):
+        # "New" was listed capitalized and never matched a lowercased word
+        self.assertTrue(self.detector.is_valid_name("Karen New"))
+        self.assertEqual(self.detector.detect("Instructor: Karen New\n")['name'], 'Karen New')
+
+    def test_detect_cache_is_per_class(self):
+        text = "Instructor: Jane Doe\nCache test\n"
+        self.assertEqual(self.detector.detect(text)['name'], 'Jane Doe')
+        self.assertEqual(OtherDetector().detect(text)['name'], 'Other')
+        self.assertEqual(self.detector.detect(text)['name'], 'Jane Doe')
+
+    def test_detect_batch_uses_detector_class(self):
+        texts = ["Instructor: Jane Doe\nBatch test\n", "Professor: John Smith\nBatch test\n"]
+        detector = OtherDetector()
+        self.assertEqual(detector.detect_batch(texts, max_workers=2), [detector.detect(text) for text in texts])
+        self.assertEqual(self.detector.detect_batch(texts, max_workers=2), [self.detector.detect(text) for text in texts])
+
+    @unittest.skipUnless(RE2_AVAILABLE, "google-re2 not installed")
+    def test_re2_set_lines_without_name_patterns(self):
+        # Lines with two capitals that no name pattern matches, then a name
+        text = "Instructor: A B\nName: Course ABC\nContact Information: X-Y\nProfessor: Jane Doe\n"
+        self.assertEqual(self.detector.matching_name_patterns("A B"), [])
+        res = self.detector.detect(text)
+        self.assertEqual(res['name'], 'Jane Doe')
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba not installed")
+    def test_numba_name_kernel_matches_python(self):
+        plain = InstructorDetector()
+        plain.stopword_hashes = None
+        words = [
+            'John', 'Smith', 'J', 'J.', 'K.M.', 'K.M', 'KM.', 'McDonald', 'McDoNald', 'Pacha-Sucharzewski',
+            'Mary-Jane-Ann', 'Jean-', '-Jean', 'Jean-paul', 'St.John', 'SMITH', 'JO', 'Dr', 'Professor',
+            'Course', 'The', 'Hands-On', 'Face-To-Face', 'of', 'smith', 'Wildcat', 'Computer', '3D', 'Ab1',
+        ]
+        candidates = [' '.join(combo) for n in range(1, 4) for combo in itertools.product(words, repeat=n)]
+        candidates += ['', '  ', 'John  Smith', '\tJohn\nSmith ', 'A B C D E', 'John Smith Jones Brown']
+        for candidate in candidates:
+            self.assertEqual(self.detector.is_valid_name(candidate), plain.is_valid_name(candidate), candidate)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from detectors.online_detection import (
+    AHOCORASICK_AVAILABLE, ONLINE_DEFINITIVE_PHRASES, SCORING_ANCHORS,
+    _first_phrase_in, _phrase_finder, _phrases_in, detect_course_delivery,
+)
+
+class TestOnlineDetection(unittest.TestCase):
+    TEXTS = [
+        "this course is online and meets on zoom",
+        "class meets in pandora hall 101 on campus; taking attendance",
+        "no anchors at all",
+        "",
+        "fully asynchronous. there are no scheduled class times. offered online",
+    ]
+
+    def test_definitive_phrase_detected(self):
+        res = detect_course_delivery("COMP 101\nThis course is 100% online.")
+        self.assertEqual(res['modality'], 'Online')
+        self.assertEqual(res['evidence'], ['100% online'])
+
+    def test_phrases_in_without_finder(self):
+        self.assertEqual(_phrases_in("taking attendance in person", SCORING_ANCHORS, None),
+                         frozenset({'attendance', 'person'}))
+        self.assertEqual(_first_phrase_in("offered online, fully online", ONLINE_DEFINITIVE_PHRASES, None),
+                         'fully online')
+
+    @unittest.skipUnless(AHOCORASICK_AVAILABLE, "ahocorasick_rs not installed")
+    def test_phrases_in_finder_matches_lookups(self):
+        anchor_finder = _phrase_finder(SCORING_ANCHORS)
+        online_finder = _phrase_finder(ONLINE_DEFINITIVE_PHRASES)
+        for text in self.TEXTS:
+            self.assertEqual(_phrases_in(text, SCORING_ANCHORS, anchor_finder),
+                             _phrases_in(text, SCORING_ANCHORS, None), text)
+            self.assertEqual(_first_phrase_in(text, ONLINE_DEFINITIVE_PHRASES, online_finder),
+                             _first_phrase_in(text, ONLINE_DEFINITIVE_PHRASES, None), text)
+
+if __name__ == '__main__':
+    unittest.main()